@@ -0,0 +1,11 @@
+"""
+Suite de benchmarks de extremo a extremo de la API.
+
+Ejecuta escenarios sobre la aplicación de `main.py` con un cliente ASGI en proceso
+(httpx.ASGITransport) contra una base de datos con datos (seed o scripts.generate_dataset),
+y compara los resultados con una línea base guardada.
+
+Uso:
+    python -m benchmarks --save-baseline
+    python -m benchmarks --scenarios list_materials get_material
+"""
@@ -0,0 +1,117 @@
+"""
+CLI de la suite de benchmarks.
+
+Uso:
+    python -m benchmarks [--scenarios NOMBRE ...] [--iterations 200] [--concurrency 10]
+                         [--baseline benchmarks/baseline.json] [--save-baseline]
+                         [--tolerance 0.25] [--output resultados.json]
+
+Sale con código 1 si algún escenario empeora respecto a la línea base.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+
+import httpx
+
+from benchmarks.runner import (
+    compare,
+    format_report,
+    load_baseline,
+    run_scenario,
+    save_baseline,
+)
+from benchmarks.scenarios import SCENARIOS
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+async def run(args) -> list:
+    from main import app
+    from database.connection import async_engine, replica_set
+
+    scenarios = [s for s in SCENARIOS if not args.scenarios or s.name in args.scenarios]
+    context = {"email": args.email, "password": args.password}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        response = await client.post(
+            "/auth/login", json={"email": args.email, "password": args.password}
+        )
+        token = response.json().get("token") if response.status_code == 200 else None
+        if not token:
+            raise SystemExit(f"❌ No se pudo iniciar sesión como {args.email}: {response.text}")
+        context["token"] = token
+
+        results = []
+        for scenario in scenarios:
+            print(f"🔄 {scenario.name} ({scenario.description})")
+            results.append(
+                await run_scenario(
+                    client, scenario, context, args.iterations, args.concurrency, args.warmup
+                )
+            )
+
+    await async_engine.dispose()
+    await replica_set.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--scenarios", nargs="*", help="Escenarios a ejecutar (por defecto todos)")
+    parser.add_argument("--iterations", type=int, default=200, help="Peticiones por escenario")
+    parser.add_argument("--concurrency", type=int, default=10, help="Peticiones concurrentes")
+    parser.add_argument("--warmup", type=int, default=5, help="Peticiones de calentamiento")
+    parser.add_argument("--email", default="admin@ejemplo.com", help="Usuario administrador")
+    parser.add_argument("--password", default="admin123", help="Contraseña del administrador")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Archivo de línea base")
+    parser.add_argument("--save-baseline", action="store_true", help="Guarda los resultados como línea base")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Regresión de p95 tolerada (fracción)")
+    parser.add_argument("--output", default=None, help="Archivo JSON con los resultados")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios or []) - {s.name for s in SCENARIOS}
+    if unknown:
+        parser.error(f"Escenarios desconocidos: {', '.join(sorted(unknown))}")
+
+    results = asyncio.run(run(args))
+    print()
+    print(format_report(results))
+
+    metadata = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "iterations": args.iterations,
+        "concurrency": args.concurrency,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({**metadata, "scenarios": results}, f, indent=2, ensure_ascii=False)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, metadata)
+        print(f"\n✅ Línea base guardada en {args.baseline}")
+        return
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\n⚠️ No existe la línea base {args.baseline}; usa --save-baseline para crearla.")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\n❌ Regresiones respecto a la línea base:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        sys.exit(1)
+    print("\n✅ Sin regresiones respecto a la línea base.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Prueba de contención de préstamos: lanza cientos de POST /loans/ en paralelo.
+
+Modos:
+    same:      todas las peticiones piden el mismo material disponible. Debe haber
+               exactamente un 201 y el resto 409.
+    different: cada petición pide un material disponible distinto. Todas deben
+               responder 201 y ninguna sesión debe esperar un bloqueo (por ejemplo,
+               la fila de versión del catálogo en table_versions).
+
+Mientras corre cada modo, una conexión aparte muestrea pg_stat_activity cada
+`--sample-ms` y cuenta las sesiones que esperan un bloqueo (wait_event_type = 'Lock').
+La espera por bloqueos se estima como la suma de esas sesiones por el intervalo de
+muestreo. Al terminar se devuelven los préstamos creados (PUT /loans/{id}/return).
+
+La concurrencia real contra PostgreSQL está limitada por DB_POOL_SIZE + DB_MAX_OVERFLOW.
+
+Uso:
+    python -m benchmarks.checkout_contention [--mode same|different|both] [--requests 200]
+
+Sale con código 1 si algún modo no cumple el resultado esperado, incluida cualquier
+espera por bloqueos en el modo different.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+import httpx
+from sqlalchemy import text
+
+from benchmarks.runner import percentile
+from benchmarks.scenarios import _auth, _prepare_ids
+
+LOCK_WAITERS = text(
+    """
+    SELECT count(*) FROM pg_stat_activity
+    WHERE datname = current_database() AND wait_event_type = 'Lock'
+    """
+)
+
+
+async def _sample_lock_waits(stop: asyncio.Event, interval: float) -> Dict[str, float]:
+    from database.connection import AsyncSessionLocal
+
+    samples = 0
+    waiting = 0
+    peak = 0
+    async with AsyncSessionLocal() as db:
+        while not stop.is_set():
+            count = await db.scalar(LOCK_WAITERS)
+            await db.rollback()
+            samples += 1
+            waiting += count
+            peak = max(peak, count)
+            try:
+                await asyncio.wait_for(stop.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+    return {
+        "lock_wait_ms": waiting * interval * 1000,
+        "lock_waiters_peak": peak,
+        "samples": samples,
+    }
+
+
+async def _checkout(client, context, material_id, i):
+    start = time.perf_counter()
+    response = await client.post(
+        "/loans/",
+        headers=_auth(context),
+        json={
+            "material_id": str(material_id),
+            "user_id": str(context["user_ids"][i % len(context["user_ids"])]),
+            "expected_return_date": (
+                datetime.now(timezone.utc) + timedelta(days=14)
+            ).isoformat(),
+            "status_id": str(context["borrowed_status_id"]),
+        },
+    )
+    return response, (time.perf_counter() - start) * 1000
+
+
+async def run_mode(client, context, mode: str, requests: int, sample_interval: float) -> dict:
+    """
+    Ejecuta `requests` préstamos simultáneos en el modo indicado y devuelve los
+    préstamos creados.
+
+    Returns:
+        dict: Throughput, latencias, códigos de respuesta, espera por bloqueos y si
+        el resultado es el esperado.
+    """
+    available = list(context["available_material_ids"])
+    if mode == "same":
+        material_ids = available[:1] * requests
+    else:
+        material_ids = available[:requests]
+    if len(material_ids) < requests:
+        raise SystemExit(
+            f"❌ Solo hay {len(available)} materiales disponibles para {requests} peticiones"
+        )
+
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sample_lock_waits(stop, sample_interval))
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(
+        *(_checkout(client, context, material_id, i) for i, material_id in enumerate(material_ids))
+    )
+    elapsed = time.perf_counter() - start
+    stop.set()
+    locks = await sampler
+
+    status_codes: Dict[int, int] = {}
+    created: List[str] = []
+    for response, _ in outcomes:
+        status_codes[response.status_code] = status_codes.get(response.status_code, 0) + 1
+        if response.status_code == 201:
+            created.append(response.json()["id"])
+
+    # Los materiales prestados dejan de estar disponibles para el modo siguiente
+    used = set(material_ids)
+    context["available_material_ids"] = [m for m in available if m not in used]
+
+    for loan_id in created:
+        await client.put(f"/loans/{loan_id}/return", headers=_auth(context))
+
+    if mode == "same":
+        expected = {201: 1, 409: requests - 1} if requests > 1 else {201: 1}
+    else:
+        expected = {201: requests}
+
+    ok = status_codes == expected
+    if mode == "different":
+        # Materiales distintos no comparten filas: cualquier espera es una regresión
+        ok = ok and locks["lock_waiters_peak"] == 0
+
+    latencies = [latency for _, latency in outcomes]
+    return {
+        "mode": mode,
+        "requests": requests,
+        "throughput_rps": requests / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "status_codes": {str(code): count for code, count in sorted(status_codes.items())},
+        "ok": ok,
+        **locks,
+    }
+
+
+async def run(args) -> List[dict]:
+    from main import app
+    from database.connection import async_engine, replica_set
+
+    context = {"email": args.email, "password": args.password}
+    modes = ["same", "different"] if args.mode == "both" else [args.mode]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark", timeout=None
+    ) as client:
+        response = await client.post(
+            "/auth/login", json={"email": args.email, "password": args.password}
+        )
+        token = response.json().get("token") if response.status_code == 200 else None
+        if not token:
+            raise SystemExit(f"❌ No se pudo iniciar sesión como {args.email}: {response.text}")
+        context["token"] = token
+        await _prepare_ids(client, context)
+
+        results = []
+        for mode in modes:
+            print(f"🔄 {mode}: {args.requests} préstamos simultáneos")
+            results.append(
+                await run_mode(client, context, mode, args.requests, args.sample_ms / 1000)
+            )
+
+    await async_engine.dispose()
+    await replica_set.dispose()
+    return results
+
+
+def format_report(results: List[dict]) -> str:
+    header = (
+        f"{'Modo':<11}{'Peticiones':>11}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}"
+        f"{'Espera ms':>11}{'Máx. esp.':>10}  Respuestas"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        codes = ", ".join(f"{code}×{count}" for code, count in r["status_codes"].items())
+        lines.append(
+            f"{r['mode']:<11}{r['requests']:>11}{r['throughput_rps']:>9.1f}{r['p50_ms']:>9.1f}"
+            f"{r['p95_ms']:>9.1f}{r['lock_wait_ms']:>11.0f}{r['lock_waiters_peak']:>10}  "
+            f"{codes} {'✅' if r['ok'] else '❌'}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.checkout_contention")
+    parser.add_argument("--mode", choices=["same", "different", "both"], default="both")
+    parser.add_argument("--requests", type=int, default=200, help="Préstamos simultáneos por modo")
+    parser.add_argument("--sample-ms", type=float, default=10, help="Intervalo de muestreo de bloqueos")
+    parser.add_argument("--email", default="admin@ejemplo.com", help="Usuario administrador")
+    parser.add_argument("--password", default="admin123", help="Contraseña del administrador")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print()
+    print(format_report(results))
+
+    if not all(r["ok"] for r in results):
+        print("\n❌ Resultado inesperado: algún préstamo se duplicó, falló o esperó un bloqueo")
+        sys.exit(1)
+    print("\n✅ Un solo préstamo por material y sin errores")
+
+
+if __name__ == "__main__":
+    main()
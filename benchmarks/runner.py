@@ -0,0 +1,144 @@
+"""
+Ejecución de escenarios, métricas y comparación con la línea base.
+
+Las sentencias SQL por petición se leen de la cabecera Server-Timing que agrega
+SqlMetricsMiddleware, por lo que SQL_INSTRUMENTATION debe estar activo.
+"""
+
+import asyncio
+import json
+import math
+import re
+import time
+from typing import Dict, List, Optional
+
+_QUERIES = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries')
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Percentil por el método del rango más cercano."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+def statement_count(response) -> Optional[int]:
+    match = _QUERIES.search(response.headers.get("server-timing", ""))
+    return int(match.group(1)) if match else None
+
+
+async def run_scenario(client, scenario, context: dict, iterations: int, concurrency: int, warmup: int) -> dict:
+    """
+    Ejecuta un escenario con `concurrency` tareas concurrentes.
+
+    Returns:
+        dict: Métricas del escenario (throughput, percentiles, sentencias, errores).
+    """
+    if scenario.prepare is not None:
+        await scenario.prepare(client, context)
+
+    if scenario.warmup:
+        for i in range(warmup):
+            await scenario.request(client, context, i)
+
+    total = scenario.iteration_limit(context, iterations)
+    latencies: List[float] = []
+    statements: List[int] = []
+    errors: Dict[int, int] = {}
+    next_iteration = iter(range(total))
+
+    async def worker():
+        for i in next_iteration:
+            start = time.perf_counter()
+            response = await scenario.request(client, context, i)
+            latencies.append((time.perf_counter() - start) * 1000)
+            count = statement_count(response)
+            if count is not None:
+                statements.append(count)
+            if response.status_code >= 400:
+                errors[response.status_code] = errors.get(response.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, max(total, 1)))))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "name": scenario.name,
+        "description": scenario.description,
+        "requests": total,
+        "throughput_rps": total / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "statements_avg": sum(statements) / len(statements) if statements else None,
+        "statements_max": max(statements) if statements else None,
+        "errors": sum(errors.values()),
+        "error_codes": {str(code): count for code, count in errors.items()},
+    }
+
+
+def compare(results: List[dict], baseline: Dict[str, dict], latency_tolerance: float) -> List[str]:
+    """
+    Compara los resultados con la línea base.
+
+    Se considera regresión:
+    - p95 mayor que el de la línea base en más de `latency_tolerance` (fracción)
+    - Más sentencias SQL promedio por petición (se tolera 0.5 por variaciones de caché)
+    - Errores en un escenario que no los tenía
+
+    Returns:
+        List[str]: Descripción de cada regresión encontrada.
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get(result["name"])
+        if reference is None or result["requests"] == 0:
+            continue
+        if result["p95_ms"] > reference["p95_ms"] * (1 + latency_tolerance):
+            regressions.append(
+                f"{result['name']}: p95 {result['p95_ms']:.1f} ms > "
+                f"{reference['p95_ms']:.1f} ms (+{latency_tolerance:.0%})"
+            )
+        if (
+            result["statements_avg"] is not None
+            and reference.get("statements_avg") is not None
+            and result["statements_avg"] > reference["statements_avg"] + 0.5
+        ):
+            regressions.append(
+                f"{result['name']}: {result['statements_avg']:.1f} sentencias SQL por petición > "
+                f"{reference['statements_avg']:.1f}"
+            )
+        if result["errors"] and not reference.get("errors"):
+            regressions.append(f"{result['name']}: {result['errors']} errores {result['error_codes']}")
+    return regressions
+
+
+def load_baseline(path: str) -> Optional[Dict[str, dict]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {entry["name"]: entry for entry in json.load(f)["scenarios"]}
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(path: str, results: List[dict], metadata: dict):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({**metadata, "scenarios": results}, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def format_report(results: List[dict]) -> str:
+    header = (
+        f"{'Escenario':<22}{'Peticiones':>11}{'req/s':>9}{'p50 ms':>9}"
+        f"{'p95 ms':>9}{'p99 ms':>9}{'SQL/pet':>9}{'Errores':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        sql = f"{r['statements_avg']:.1f}" if r["statements_avg"] is not None else "-"
+        lines.append(
+            f"{r['name']:<22}{r['requests']:>11}{r['throughput_rps']:>9.1f}{r['p50_ms']:>9.1f}"
+            f"{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}{sql:>9}{r['errors']:>9}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,234 @@
+"""
+Escenarios de benchmark.
+
+Cada escenario hace una petición por iteración; `prepare` obtiene una sola vez los
+datos que necesita (ids de materiales, usuarios, estados) directamente de la base de datos.
+Los escenarios se ejecutan en el orden de SCENARIOS: loan_return devuelve los
+préstamos creados por loan_create.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from database.connection import (
+    AsyncSessionLocal,
+    Author as AuthorDB,
+    LoanStatus as LoanStatusDB,
+    Material as MaterialDB,
+    User as UserDB,
+)
+
+
+class Scenario:
+    """
+    Escenario de benchmark.
+
+    Attributes:
+        name (str): Nombre único, usado en la línea base.
+        description (str): Descripción corta para el reporte.
+        request: Corrutina (client, context, iteration) -> httpx.Response.
+        prepare: Corrutina opcional (client, context) que completa el contexto.
+        max_iterations: Tope de iteraciones, entero o función del contexto
+            (por ejemplo login, limitado por bcrypt).
+        warmup (bool): False para escenarios que modifican datos y no admiten calentamiento.
+    """
+
+    def __init__(
+        self, name, description, request, prepare=None, max_iterations=None, warmup=True
+    ):
+        self.name = name
+        self.description = description
+        self.request = request
+        self.prepare = prepare
+        self.max_iterations = max_iterations
+        self.warmup = warmup
+
+    def iteration_limit(self, context, requested: int) -> int:
+        limit = self.max_iterations
+        if callable(limit):
+            limit = limit(context)
+        return requested if limit is None else min(requested, limit)
+
+
+def _auth(context) -> dict:
+    return {"Authorization": f"Bearer {context['token']}"}
+
+
+async def _prepare_ids(client, context):
+    if "material_ids" in context:
+        return
+    async with AsyncSessionLocal() as db:
+        context["material_ids"] = (
+            await db.scalars(
+                select(MaterialDB.id).where(MaterialDB.is_deleted == False).limit(1000)
+            )
+        ).all()
+        context["author_names"] = (await db.scalars(select(AuthorDB.name).limit(100))).all()
+        context["material_titles"] = (
+            await db.scalars(
+                select(MaterialDB.title).where(MaterialDB.is_deleted == False).limit(100)
+            )
+        ).all()
+        context["user_ids"] = (
+            await db.scalars(select(UserDB.id).where(UserDB.is_deleted == False).limit(1000))
+        ).all()
+        context["borrowed_status_id"] = await db.scalar(
+            select(LoanStatusDB.id).where(LoanStatusDB.name == "borrowed")
+        )
+        context["available_material_ids"] = (
+            await db.scalars(
+                select(MaterialDB.id)
+                .where(MaterialDB.is_deleted == False, MaterialDB.is_available == True)
+                .limit(1000)
+            )
+        ).all()
+    if not context["material_ids"] or not context["user_ids"]:
+        raise RuntimeError(
+            "La base de datos no tiene datos: ejecuta `python -m database.migrations seed` "
+            "o `python -m scripts.generate_dataset`"
+        )
+
+
+async def login(client, context, i):
+    return await client.post(
+        "/auth/login", json={"email": context["email"], "password": context["password"]}
+    )
+
+
+async def list_materials(client, context, i):
+    return await client.get("/materials/", params={"limit": 50})
+
+
+async def _prepare_materials_etag(client, context):
+    response = await client.get("/materials/", params={"limit": 50})
+    context["materials_etag"] = response.headers.get("etag")
+    if not context["materials_etag"]:
+        raise RuntimeError("GET /materials/ no devolvió ETag")
+
+
+async def list_materials_not_modified(client, context, i):
+    return await client.get(
+        "/materials/",
+        params={"limit": 50},
+        headers={"If-None-Match": context["materials_etag"]},
+    )
+
+
+async def get_material(client, context, i):
+    material_ids = context["material_ids"]
+    return await client.get(f"/materials/{material_ids[i % len(material_ids)]}")
+
+
+async def materials_by_author(client, context, i):
+    names = context["author_names"]
+    return await client.get(f"/materials/by-author/{names[i % len(names)]}")
+
+
+async def search_materials(client, context, i):
+    titles = context["material_titles"]
+    words = titles[i % len(titles)].split()
+    return await client.get("/materials/search", params={"q": " ".join(words[-2:])})
+
+
+async def search_materials_typo(client, context, i):
+    # Apellido del autor con una letra menos: fuerza la búsqueda por trigramas
+    names = context["author_names"]
+    surname = names[i % len(names)].split()[-1]
+    return await client.get("/materials/search", params={"q": surname[:2] + surname[3:]})
+
+
+async def material_facets(client, context, i):
+    # Sin filtro cada 10 peticiones (catálogo completo, en caché tras la primera)
+    if i % 10 == 0:
+        return await client.get("/materials/facets")
+    titles = context["material_titles"]
+    return await client.get("/materials/facets", params={"q": titles[i % len(titles)].split()[-1]})
+
+
+async def loan_create(client, context, i):
+    response = await client.post(
+        "/loans/",
+        headers=_auth(context),
+        json={
+            "material_id": str(context["available_material_ids"][i]),
+            "user_id": str(context["user_ids"][i % len(context["user_ids"])]),
+            "expected_return_date": (
+                datetime.now(timezone.utc) + timedelta(days=14)
+            ).isoformat(),
+            "status_id": str(context["borrowed_status_id"]),
+        },
+    )
+    if response.status_code == 201:
+        context.setdefault("created_loan_ids", []).append(response.json()["id"])
+    return response
+
+
+async def loan_return(client, context, i):
+    loan_id = context["created_loan_ids"][i]
+    return await client.put(f"/loans/{loan_id}/return", headers=_auth(context))
+
+
+async def list_loans(client, context, i):
+    # Alterna el listado general con los que vencen en los próximos 3 días
+    params = {"limit": 50}
+    if i % 2:
+        now = datetime.now(timezone.utc)
+        params.update(
+            sort="due",
+            due_from=now.isoformat(),
+            due_to=(now + timedelta(days=3)).isoformat(),
+        )
+    return await client.get("/loans/", headers=_auth(context), params=params)
+
+
+async def list_users(client, context, i):
+    return await client.get("/users/", headers=_auth(context), params={"limit": 50})
+
+
+async def list_authors(client, context, i):
+    return await client.get("/authors/", headers=_auth(context), params={"limit": 50})
+
+
+async def list_roles(client, context, i):
+    return await client.get("/roles/", headers=_auth(context))
+
+
+async def list_loan_status(client, context, i):
+    return await client.get("/loan-status/", headers=_auth(context))
+
+
+def _available_count(context):
+    return len(context.get("available_material_ids", []))
+
+
+def _created_count(context):
+    return len(context.get("created_loan_ids", []))
+
+
+SCENARIOS = [
+    Scenario("login", "POST /auth/login", login, max_iterations=50),
+    Scenario("list_materials", "GET /materials/", list_materials, _prepare_ids),
+    Scenario(
+        "list_materials_not_modified", "GET /materials/ con If-None-Match (304)",
+        list_materials_not_modified, _prepare_materials_etag,
+    ),
+    Scenario("get_material", "GET /materials/{id}", get_material, _prepare_ids),
+    Scenario("materials_by_author", "GET /materials/by-author/{author}", materials_by_author, _prepare_ids),
+    Scenario("search_materials", "GET /materials/search", search_materials, _prepare_ids),
+    Scenario("search_materials_typo", "GET /materials/search (con error)", search_materials_typo, _prepare_ids),
+    Scenario("material_facets", "GET /materials/facets", material_facets, _prepare_ids),
+    Scenario(
+        "loan_create", "POST /loans/", loan_create, _prepare_ids,
+        max_iterations=_available_count, warmup=False,
+    ),
+    Scenario(
+        "loan_return", "PUT /loans/{id}/return", loan_return, _prepare_ids,
+        max_iterations=_created_count, warmup=False,
+    ),
+    Scenario("list_loans", "GET /loans/", list_loans),
+    Scenario("list_users", "GET /users/", list_users),
+    Scenario("list_authors", "GET /authors/", list_authors),
+    Scenario("list_roles", "GET /roles/", list_roles),
+    Scenario("list_loan_status", "GET /loan-status/", list_loan_status),
+]
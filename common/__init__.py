@@ -1,4 +1,9 @@
 from .enums.material_type_enum import MaterialType
+from .enums.material_sort_enum import MaterialSort
+from .enums.loan_sort_enum import LoanSort
+from .enums.loan_expand_enum import LoanExpand
+from .enums.import_format_enum import ImportFormat
+from .enums.export_entity_enum import ExportEntity
 from .enums.roles_enum import RolEnum
 
-__all__ = ["MaterialType", "RolEnum"]
\ No newline at end of file
+__all__ = ["MaterialType", "MaterialSort", "LoanSort", "LoanExpand", "ImportFormat", "ExportEntity", "RolEnum"]
\ No newline at end of file
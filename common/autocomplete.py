@@ -0,0 +1,401 @@
+"""
+Autocompletado de títulos y autores desde un índice de prefijos en memoria.
+
+Cada pulsación del cliente se responde sin consultar la base de datos: el índice
+guarda las palabras normalizadas (minúsculas, sin tildes) de los títulos de los
+materiales activos y de los nombres de los autores en un vocabulario ordenado, y una
+consulta busca con bisect el rango de palabras que empiezan con el último término.
+
+El índice es compacto: los ids se guardan como 16 bytes seguidos en un bytearray, los
+textos originales en UTF-8 en otro bytearray con desplazamientos en arrays, y cada
+palabra apunta a un array ordenado de enteros de 32 bits con las ranuras que la
+contienen. No hay un objeto Python por entrada.
+
+Los endpoints de escritura aplican sus cambios de inmediato (apply_change), pero solo
+en el proceso que atendió la petición; cada proceso reconstruye además los índices
+completos cada AUTOCOMPLETE_REFRESH_SECONDS. Los cambios que llegan durante una
+reconstrucción se vuelven a aplicar sobre el índice nuevo antes de reemplazar al
+anterior.
+
+Clases:
+    PrefixIndex: Índice de prefijos con actualización incremental
+
+Funciones:
+    normalize: Minúsculas y sin tildes
+    tokenize: Palabras normalizadas de un texto
+    rebuild_autocomplete: Reconstruye los índices desde la base de datos
+    run_autocomplete_refresh: Reconstrucción periódica (tarea de inicio)
+    get_autocomplete_stats: Tamaño y memoria de los índices
+"""
+
+import asyncio
+import bisect
+import re
+import sys
+import threading
+import time
+import unicodedata
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+
+from database.connection import AsyncSessionLocal, Author, Material
+
+_WORD = re.compile(r"\w+")
+
+# Candidatos revisados como máximo cuando la consulta tiene varios términos
+MAX_SCANNED = 5000
+
+
+def _contains(posting: array, slot: int) -> bool:
+    index = bisect.bisect_left(posting, slot)
+    return index < len(posting) and posting[index] == slot
+
+
+def normalize(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(normalize(text))
+
+
+class PrefixIndex:
+    """
+    Índice de prefijos sobre las palabras normalizadas de un conjunto de textos.
+
+    Attributes:
+        name (str): Nombre con el que se reportan las estadísticas.
+        entries (int): Textos indexados.
+        built_at (Optional[datetime]): Fin de la última reconstrucción completa.
+        build_seconds (Optional[float]): Duración de la última reconstrucción completa.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._ids = bytearray()
+        self._label_data = bytearray()
+        self._label_offsets = array("I")
+        self._label_lengths = array("H")
+        self._free: List[int] = []
+        self._words: List[str] = []
+        self._postings: Dict[str, array] = {}
+        # Palabras nuevas de un lote aún sin intercalar en _words (apply_changes)
+        self._unsorted_words: List[str] = []
+        self._garbage = 0
+        self._journal: Optional[List[Tuple[UUID, Optional[str], Optional[str]]]] = None
+        self.entries = 0
+        self.built_at: Optional[datetime] = None
+        self.build_seconds: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.built_at is not None
+
+    def _label(self, slot: int) -> str:
+        offset = self._label_offsets[slot]
+        return self._label_data[offset : offset + self._label_lengths[slot]].decode("utf-8")
+
+    def _id(self, slot: int) -> UUID:
+        return UUID(bytes=bytes(self._ids[slot * 16 : slot * 16 + 16]))
+
+    def _add(self, item_id: UUID, label: str, keep_sorted: bool = True):
+        words = set(tokenize(label))
+        if not words:
+            # Un texto sin palabras no se puede encontrar: no ocupa ranura
+            return
+        encoded = label.encode("utf-8")
+        if self._free:
+            slot = self._free.pop()
+            self._ids[slot * 16 : slot * 16 + 16] = item_id.bytes
+            self._label_offsets[slot] = len(self._label_data)
+            self._label_lengths[slot] = len(encoded)
+        else:
+            slot = len(self._label_offsets)
+            self._ids += item_id.bytes
+            self._label_offsets.append(len(self._label_data))
+            self._label_lengths.append(len(encoded))
+        self._label_data += encoded
+
+        for word in words:
+            posting = self._postings.get(word)
+            if posting is None:
+                posting = self._postings[word] = array("I")
+                if keep_sorted:
+                    bisect.insort(self._words, word)
+                else:
+                    self._unsorted_words.append(word)
+            # Las ranuras nuevas son crecientes; solo una ranura reutilizada se intercala
+            if posting and posting[-1] > slot:
+                bisect.insort(posting, slot)
+            else:
+                posting.append(slot)
+        self.entries += 1
+
+    def _remove(self, item_id: UUID, label: str) -> bool:
+        words = set(tokenize(label))
+        postings = [self._postings.get(word) for word in words]
+        if not postings or any(posting is None for posting in postings):
+            return False
+
+        target = item_id.bytes
+        slot = next(
+            (
+                candidate
+                for candidate in min(postings, key=len)
+                if self._ids[candidate * 16 : candidate * 16 + 16] == target
+            ),
+            None,
+        )
+        if slot is None:
+            return False
+
+        for word, posting in zip(words, postings):
+            del posting[bisect.bisect_left(posting, slot)]
+            if not posting:
+                del self._postings[word]
+                index = bisect.bisect_left(self._words, word)
+                if index < len(self._words) and self._words[index] == word:
+                    del self._words[index]
+
+        # El texto queda en _label_data hasta la próxima reconstrucción
+        self._garbage += self._label_lengths[slot]
+        self._ids[slot * 16 : slot * 16 + 16] = bytes(16)
+        self._label_lengths[slot] = 0
+        self._free.append(slot)
+        self.entries -= 1
+        return True
+
+    def _apply(
+        self,
+        item_id: UUID,
+        old_label: Optional[str],
+        new_label: Optional[str],
+        keep_sorted: bool = True,
+    ):
+        # Idempotente: se puede volver a aplicar tras una reconstrucción que ya incluye el cambio
+        if old_label:
+            self._remove(item_id, old_label)
+        if new_label:
+            self._remove(item_id, new_label)
+            self._add(item_id, new_label, keep_sorted)
+
+    def _merge_unsorted_words(self):
+        # Timsort intercala dos tramos ordenados en tiempo lineal
+        new_words = {word for word in self._unsorted_words if word in self._postings}
+        self._unsorted_words = []
+        if new_words:
+            self._words.extend(sorted(new_words))
+            self._words.sort()
+
+    def apply_change(
+        self, item_id: UUID, old_label: Optional[str] = None, new_label: Optional[str] = None
+    ):
+        """
+        Aplica una alta (solo new_label), una baja (solo old_label) o un cambio de texto.
+        """
+        with self._lock:
+            self._apply(item_id, old_label, new_label)
+            if self._journal is not None:
+                self._journal.append((item_id, old_label, new_label))
+
+    def apply_changes(self, changes: List[Tuple[UUID, Optional[str], Optional[str]]]):
+        """
+        Aplica un lote de cambios (id, texto anterior, texto nuevo) de una vez: las
+        palabras nuevas se intercalan en el vocabulario con una sola ordenación al final,
+        en lugar de un insort por palabra.
+        """
+        with self._lock:
+            for change in changes:
+                self._apply(*change, keep_sorted=False)
+            self._merge_unsorted_words()
+            if self._journal is not None:
+                self._journal.extend(changes)
+
+    def load(self, rows):
+        """
+        Carga filas (id, texto) durante una reconstrucción; el vocabulario se ordena en
+        finish_build.
+        """
+        with self._lock:
+            for item_id, label in rows:
+                self._add(item_id, label, keep_sorted=False)
+
+    def finish_build(self, build_seconds: float):
+        with self._lock:
+            self._words = sorted(self._postings)
+            self._unsorted_words = []
+            self.build_seconds = build_seconds
+            self.built_at = datetime.now(timezone.utc)
+
+    def begin_rebuild(self):
+        with self._lock:
+            self._journal = []
+
+    def abort_rebuild(self):
+        with self._lock:
+            self._journal = None
+
+    def replace_with(self, fresh: "PrefixIndex"):
+        """
+        Reemplaza el contenido por el de un índice recién construido, aplicando antes
+        los cambios recibidos mientras se construía.
+        """
+        with self._lock:
+            for change in self._journal or []:
+                fresh._apply(*change)
+            self._journal = None
+            for attribute in (
+                "_ids", "_label_data", "_label_offsets", "_label_lengths", "_free",
+                "_words", "_postings", "_garbage", "entries", "built_at", "build_seconds",
+            ):
+                setattr(self, attribute, getattr(fresh, attribute))
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[UUID, str]]:
+        """
+        Busca los textos que contienen una palabra que empieza con el último término de
+        la consulta y todas las palabras anteriores completas.
+
+        Args:
+            query (str): Texto escrito por el usuario.
+            limit (int): Número máximo de resultados.
+
+        Returns:
+            List[Tuple[UUID, str]]: Id y texto original de cada coincidencia.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        *complete, prefix = terms
+
+        with self._lock:
+            if complete:
+                postings = [self._postings.get(word) for word in complete]
+                if any(posting is None for posting in postings):
+                    return []
+                # Se recorre la palabra menos frecuente y se intersecta con bisect
+                smallest, *others = sorted(postings, key=len)
+                results = []
+                for scanned, slot in enumerate(smallest):
+                    if scanned >= MAX_SCANNED or len(results) >= limit:
+                        break
+                    if not all(_contains(posting, slot) for posting in others):
+                        continue
+                    label = self._label(slot)
+                    words = tokenize(label)
+                    if all(word in words for word in complete) and any(
+                        word.startswith(prefix) for word in words
+                    ):
+                        results.append((self._id(slot), label))
+                return results
+
+            results = []
+            seen = set()
+            index = bisect.bisect_left(self._words, prefix)
+            while index < len(self._words) and len(results) < limit:
+                word = self._words[index]
+                if not word.startswith(prefix):
+                    break
+                for slot in self._postings[word]:
+                    if slot not in seen:
+                        seen.add(slot)
+                        results.append((self._id(slot), self._label(slot)))
+                        if len(results) >= limit:
+                            break
+                index += 1
+            return results
+
+    def memory_bytes(self) -> int:
+        """Memoria ocupada por las estructuras del índice (sys.getsizeof)."""
+        with self._lock:
+            size = sum(
+                sys.getsizeof(part)
+                for part in (
+                    self._ids, self._label_data, self._label_offsets, self._label_lengths,
+                    self._free, self._words, self._postings,
+                )
+            )
+            size += sum(sys.getsizeof(word) for word in self._words)
+            size += sum(sys.getsizeof(posting) for posting in self._postings.values())
+            return size
+
+    def snapshot(self) -> Dict:
+        memory = self.memory_bytes()
+        with self._lock:
+            return {
+                "name": self.name,
+                "ready": self.ready,
+                "entries": self.entries,
+                "words": len(self._words),
+                "memory_bytes": memory,
+                "bytes_per_entry": round(memory / self.entries, 1) if self.entries else 0.0,
+                "garbage_bytes": self._garbage,
+                "built_at": self.built_at,
+                "build_seconds": self.build_seconds,
+            }
+
+
+title_index = PrefixIndex("titles")
+author_index = PrefixIndex("authors")
+
+
+async def rebuild_autocomplete(batch_size: int = 10_000):
+    """
+    Reconstruye los índices de títulos (materiales activos) y autores leyendo las
+    tablas con un cursor del servidor. La carga de cada bloque corre en un hilo para
+    no bloquear el event loop.
+    """
+    sources = (
+        (title_index, select(Material.id, Material.title).where(Material.is_deleted == False)),
+        (author_index, select(Author.id, Author.name)),
+    )
+    for index, stmt in sources:
+        start = time.perf_counter()
+        fresh = PrefixIndex(index.name)
+        index.begin_rebuild()
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.stream(stmt, execution_options={"yield_per": batch_size})
+                async for rows in result.partitions():
+                    await asyncio.to_thread(fresh.load, rows)
+            await asyncio.to_thread(fresh.finish_build, time.perf_counter() - start)
+        except BaseException:
+            index.abort_rebuild()
+            raise
+        index.replace_with(fresh)
+
+
+async def run_autocomplete_refresh(interval: float):
+    """
+    Construye los índices al iniciar y los reconstruye cada `interval` segundos, para
+    incorporar los cambios hechos por otros procesos y descartar los textos reemplazados.
+
+    Args:
+        interval (float): Segundos entre reconstrucciones.
+    """
+    while True:
+        try:
+            await rebuild_autocomplete()
+            print(
+                f"🔤 Índices de autocompletado: {title_index.entries} títulos, "
+                f"{author_index.entries} autores"
+            )
+        except Exception as e:
+            print(f"⚠️ Error al reconstruir el autocompletado: {e}")
+        await asyncio.sleep(interval)
+
+
+def get_autocomplete_stats() -> List[Dict]:
+    """
+    Devuelve el tamaño y la memoria de los índices de autocompletado de este proceso.
+
+    Returns:
+        List[Dict]: Entradas, palabras, memoria total y por entrada, bytes descartados
+        pendientes de la próxima reconstrucción y fecha y duración de la última.
+    """
+    return [index.snapshot() for index in (title_index, author_index)]
@@ -0,0 +1,183 @@
+"""
+Caché en memoria del catálogo (LRU con TTL).
+
+Este módulo proporciona:
+- Una caché LRU acotada en tamaño y con expiración por TTL
+- Las cachés del detalle de materiales y de los autores y tipos de material que
+  referencian; el detalle se compone a partir de las tres, de modo que actualizar un
+  autor solo invalida su entrada y no la de cada material
+- Contadores de aciertos, fallos, desalojos, expiraciones e invalidaciones por caché
+
+Cada entrada del detalle guarda la versión de su tabla (table_versions) en el momento
+de leerla; el ETag de un detalle servido desde la caché se calcula con esas versiones,
+así que un cuerpo siempre se sirve con el ETag de los datos de los que se leyó.
+
+Los conteos de facetas se guardan por parámetros de la petición, sin versión, y
+expiran a los FACET_CACHE_TTL segundos; es su única invalidación.
+
+Las cachés son por proceso: cada worker de uvicorn tiene la suya y las invalidaciones
+solo alcanzan al proceso que atendió la escritura; en los demás la entrada vive como
+máximo CATALOG_CACHE_TTL segundos. Tras invalidar una clave no se vuelve a guardar
+durante CATALOG_CACHE_INVALIDATION_GRACE segundos, para que una lectura concurrente o
+una réplica retrasada no repongan el valor anterior.
+
+Clases:
+    LRUCache: Caché LRU con TTL y contadores
+
+Funciones:
+    invalidate_material: Invalida el detalle de un material
+    invalidate_author: Invalida un autor
+    invalidate_material_type: Invalida un tipo de material
+    get_cache_stats: Contadores de todas las cachés del catálogo
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from config import settings
+
+
+class LRUCache:
+    """
+    Caché LRU acotada con expiración por TTL.
+
+    Attributes:
+        name (str): Nombre con el que se reportan los contadores.
+        max_size (int): Número máximo de entradas; al superarlo se desaloja la menos usada.
+        ttl (float): Segundos de vida de cada entrada.
+        invalidation_grace (float): Segundos durante los que no se guarda una clave invalidada.
+    """
+
+    def __init__(self, name: str, max_size: int, ttl: float, invalidation_grace: float = 0):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.invalidation_grace = invalidation_grace
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._invalidated: "OrderedDict[Hashable, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Devuelve el valor guardado o None si no existe o expiró.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Guarda un valor. Se ignora si la clave se invalidó hace menos de
+        `invalidation_grace` segundos.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._prune_invalidated(now)
+            if key in self._invalidated:
+                return
+            self._entries[key] = (value, now + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        now = time.monotonic()
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+            if self.invalidation_grace > 0:
+                self._invalidated[key] = now + self.invalidation_grace
+                self._invalidated.move_to_end(key)
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def _prune_invalidated(self, now: float):
+        while self._invalidated:
+            key, until = next(iter(self._invalidated.items()))
+            if until > now:
+                break
+            del self._invalidated[key]
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+def _catalog_cache(name: str, max_size: int) -> LRUCache:
+    return LRUCache(
+        name,
+        max_size,
+        settings.CATALOG_CACHE_TTL,
+        settings.CATALOG_CACHE_INVALIDATION_GRACE,
+    )
+
+
+"""
+Por id, tuplas (versión de la tabla al leer, esquema): detalle de materiales sin
+relaciones (Material con author y material_type en None), autores (Author) y tipos de
+material (MaterialType). Los conteos de facetas se guardan sin versión (MaterialFacets).
+"""
+material_cache = _catalog_cache("materials", settings.CATALOG_CACHE_MAX_SIZE)
+author_cache = _catalog_cache("authors", settings.CATALOG_CACHE_MAX_SIZE)
+material_type_cache = _catalog_cache("material_types", 256)
+facet_cache = LRUCache("facets", 1024, settings.FACET_CACHE_TTL)
+
+
+def invalidate_material(material_id):
+    material_cache.invalidate(material_id)
+
+
+def invalidate_author(author_id):
+    author_cache.invalidate(author_id)
+
+
+def invalidate_material_type(type_id):
+    material_type_cache.invalidate(type_id)
+
+
+def get_cache_stats() -> List[Dict]:
+    """
+    Devuelve los contadores actuales de las cachés del catálogo de este proceso.
+
+    Returns:
+        List[Dict]: Tamaño, límites, aciertos, fallos, desalojos, expiraciones e invalidaciones.
+    """
+    return [
+        cache.snapshot()
+        for cache in (material_cache, author_cache, material_type_cache, facet_cache)
+    ]
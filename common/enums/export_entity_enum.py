@@ -0,0 +1,6 @@
+import enum
+
+class ExportEntity(str, enum.Enum):
+    materials = "materials"
+    authors = "authors"
+    loans = "loans"
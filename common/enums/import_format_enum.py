@@ -0,0 +1,5 @@
+import enum
+
+class ImportFormat(str, enum.Enum):
+    csv = "csv"
+    ndjson = "ndjson"
@@ -0,0 +1,6 @@
+import enum
+
+class LoanExpand(str, enum.Enum):
+    material = "material"
+    user = "user"
+    status = "status"
\ No newline at end of file
@@ -0,0 +1,5 @@
+import enum
+
+class LoanSort(str, enum.Enum):
+    newest = "newest"
+    due = "due"
\ No newline at end of file
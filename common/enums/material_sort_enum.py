@@ -0,0 +1,5 @@
+import enum
+
+class MaterialSort(str, enum.Enum):
+    title = "title"
+    newest = "newest"
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+ETag y GET condicional para los endpoints del catálogo y de referencia.
+
+El ETag de una respuesta se deriva de la ruta, los parámetros de consulta, la versión
+de la API y la versión de cada tabla que la respuesta lee (tabla `table_versions`,
+migración 0006). Si el cliente envía `If-None-Match` con el mismo ETag se responde
+304 sin consultar las filas ni serializar el cuerpo; el costo es una lectura de
+`table_versions` por clave primaria.
+
+Las versiones se leen con la misma sesión que el endpoint, de modo que el ETag
+corresponde a los datos de la réplica o del primario que atiende la petición.
+
+Funciones:
+    get_table_versions: Versiones actuales de un conjunto de tablas
+    make_etag: Calcula el ETag de una petición
+    etag_matches: Compara If-None-Match con un ETag
+    apply_etag: Responde 304 o agrega las cabeceras de un ETag ya calculado
+    conditional_get: Fábrica de dependencias que responde 304 o agrega el ETag
+"""
+
+import hashlib
+from typing import Dict, Iterable, Optional, Sequence
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.connection import get_read_db
+
+_VERSIONS_QUERY = text(
+    "SELECT table_name, version FROM table_versions WHERE table_name IN :tables"
+).bindparams(bindparam("tables", expanding=True))
+
+
+async def get_table_versions(db: AsyncSession, tables: Sequence[str]) -> Dict[str, int]:
+    """
+    Obtiene la versión de cada tabla; las tablas sin fila se reportan con versión 0.
+    """
+    rows = (await db.execute(_VERSIONS_QUERY, {"tables": list(tables)})).all()
+    versions = {table: 0 for table in tables}
+    versions.update({name: version for name, version in rows})
+    return versions
+
+
+def make_etag(request: Request, versions: Dict[str, int]) -> str:
+    """
+    Calcula un ETag fuerte para la petición.
+
+    Args:
+        request (Request): Petición actual (ruta, parámetros y versión de la API).
+        versions (Dict[str, int]): Versión de cada tabla leída por la respuesta.
+
+    Returns:
+        str: ETag entre comillas.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(request.app.version).encode())
+    digest.update(request.url.path.encode())
+    digest.update(repr(sorted(request.query_params.multi_items())).encode())
+    for table in sorted(versions):
+        digest.update(f"{table}:{versions[table]};".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Comparación débil de If-None-Match (RFC 9110): ignora el prefijo W/ y acepta "*".
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def apply_etag(request: Request, response: Response, etag: str):
+    """
+    Responde 304 si If-None-Match coincide con `etag`; si no, agrega las cabeceras
+    ETag y Cache-Control: no-cache a la respuesta.
+
+    Raises:
+        HTTPException(304) - El cliente ya tiene esta versión
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def conditional_get(*tables: str, uncacheable_params: Iterable[str] = ()):
+    """
+    Crea una dependencia que calcula el ETag de la respuesta a partir de las versiones
+    de `tables`. Si coincide con If-None-Match responde 304 (sin ejecutar el endpoint);
+    de lo contrario agrega las cabeceras ETag y Cache-Control: no-cache.
+
+    Declarar la dependencia después de las de autenticación para que una petición sin
+    permisos no reciba un 304.
+
+    Args:
+        *tables (str): Tablas que lee la respuesta.
+        uncacheable_params (Iterable[str]): Parámetros de consulta con los que la
+            respuesta depende de otras tablas (por ejemplo préstamos); con ellos no se
+            genera ETag.
+
+    Returns:
+        Callable: Dependencia de FastAPI que devuelve el ETag (o None).
+    """
+    uncacheable_params = tuple(uncacheable_params)
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_read_db),
+    ) -> Optional[str]:
+        if any(param in request.query_params for param in uncacheable_params):
+            return None
+
+        etag = make_etag(request, await get_table_versions(db, tables))
+        apply_etag(request, response, etag)
+        return etag
+
+    return dependency
@@ -1,3 +1,4 @@
 from .auth_middleware import JWTBearer, get_current_user, require_admin
+from .sql_metrics_middleware import SqlMetricsMiddleware
 
-__all__ = ['get_current_user', 'JWTBearer', 'require_admin']
\ No newline at end of file
+__all__ = ['get_current_user', 'JWTBearer', 'require_admin', 'SqlMetricsMiddleware']
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Middleware de métricas SQL por petición.
+
+Abre un contexto de instrumentación por cada petición HTTP, y al terminar:
+- Agrega la cabecera `Server-Timing` con el tiempo total, el tiempo en base de datos,
+  el número de sentencias y las filas leídas o afectadas
+- Acumula las métricas en la plantilla de ruta (por ejemplo "GET /loans/{loan_id}")
+  para exponerlas en /admin/db/routes
+
+Clases:
+    SqlMetricsMiddleware: Middleware de Starlette que instrumenta cada petición
+"""
+
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+
+from database.instrumentation import start_request, finish_request
+
+
+class SqlMetricsMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware que mide el SQL ejecutado por cada petición.
+
+    Las métricas se leen y se acumulan en la ruta cuando call_next devuelve la
+    respuesta, antes de armar la cabecera. Las sentencias que se ejecutan después (por
+    ejemplo al cerrar la sesión en la dependencia) no se cuentan ni en la cabecera ni
+    en la ruta.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        start = time.perf_counter()
+        token = start_request(request.method, request.scope)
+        try:
+            response = await call_next(request)
+        finally:
+            stats = finish_request(token)
+
+        total_ms = (time.perf_counter() - start) * 1000
+        server_timing = [
+            f"app;dur={total_ms:.1f}",
+            f'db;dur={stats.db_time * 1000:.1f};desc="{stats.statements} queries, {stats.rows} rows"',
+        ]
+        if stats.n_plus_one:
+            server_timing.append(f'n-plus-one;desc="{len(stats.n_plus_one)} statements"')
+        response.headers["Server-Timing"] = ", ".join(server_timing)
+        return response
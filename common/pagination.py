@@ -0,0 +1,63 @@
+"""
+Utilidades de paginación por cursor (keyset).
+
+El cursor es opaco para el cliente: codifica en base64 URL-safe un JSON con el
+criterio de orden y los valores de la última fila devuelta. La siguiente página se
+obtiene con una comparación de tuplas sobre esos valores, que PostgreSQL resuelve
+con el índice del orden, por lo que su costo no depende de la profundidad.
+
+Funciones:
+    encode_cursor: Genera el cursor a partir de los valores de la última fila
+    decode_cursor: Valida y decodifica un cursor recibido del cliente
+"""
+
+import base64
+import json
+from typing import List
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(sort: str, values: List) -> str:
+    """
+    Genera un cursor opaco.
+
+    Args:
+        sort (str): Criterio de orden con el que se generó la página.
+        values (List): Valores de la clave de orden de la última fila (se serializan con str).
+
+    Returns:
+        str: Cursor en base64 URL-safe sin relleno.
+    """
+    payload = json.dumps({"s": sort, "v": [str(value) for value in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, size: int) -> List[str]:
+    """
+    Decodifica un cursor y verifica que corresponda al orden solicitado.
+
+    Args:
+        cursor (str): Cursor recibido del cliente.
+        sort (str): Criterio de orden de la petición actual.
+        size (int): Número de valores esperados.
+
+    Returns:
+        List[str]: Valores de la clave de orden, como texto.
+
+    Raises:
+        HTTPException(400) - Cursor inválido o de otro criterio de orden
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["v"]
+        valid = payload["s"] == sort and isinstance(values, list) and len(values) == size
+    except (ValueError, KeyError, TypeError):
+        valid = False
+    if not valid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor inválido para este criterio de orden",
+        )
+    return values
@@ -7,6 +7,71 @@ class Settings:
     # Base de datos
     DATABASE_URL: str = os.getenv('SQL_SERVER_CONNECTION_STRING')
     
+    # Pool de conexiones
+    DB_POOL_SIZE: int = int(os.getenv('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT: float = float(os.getenv('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE: int = int(os.getenv('DB_POOL_RECYCLE', 300))
+    DB_POOL_PRE_PING: bool = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    DB_ECHO: bool = os.getenv('DB_ECHO', 'false').lower() == 'true'
+    
+    # Réplicas de lectura
+    DB_READ_REPLICA_URLS: list = [
+        url for url in os.getenv('DB_READ_REPLICA_URLS', '').split(',') if url
+    ]
+    DB_REPLICA_MAX_LAG_SECONDS: float = float(os.getenv('DB_REPLICA_MAX_LAG_SECONDS', 5))
+    DB_REPLICA_LAG_CHECK_INTERVAL: float = float(os.getenv('DB_REPLICA_LAG_CHECK_INTERVAL', 5))
+    DB_READ_YOUR_WRITES_SECONDS: float = float(os.getenv('DB_READ_YOUR_WRITES_SECONDS', 10))
+    
+    # Instrumentación SQL
+    SQL_INSTRUMENTATION: bool = os.getenv('SQL_INSTRUMENTATION', 'true').lower() == 'true'
+    SQL_N_PLUS_ONE_THRESHOLD: int = int(os.getenv('SQL_N_PLUS_ONE_THRESHOLD', 10))
+    
+    # Particiones de préstamos
+    LOANS_PARTITION_MONTHS_AHEAD: int = int(os.getenv('LOANS_PARTITION_MONTHS_AHEAD', 3))
+    LOANS_PARTITION_MAINTENANCE_INTERVAL: float = float(os.getenv('LOANS_PARTITION_MAINTENANCE_INTERVAL', 86400))
+    LOANS_ARCHIVE_SCHEMA: str = os.getenv('LOANS_ARCHIVE_SCHEMA', 'archive')
+    LOANS_ARCHIVE_TABLESPACE: str = os.getenv('LOANS_ARCHIVE_TABLESPACE', '')
+
+    # Marcado de préstamos vencidos
+    OVERDUE_SWEEP_ENABLED: bool = os.getenv('OVERDUE_SWEEP_ENABLED', 'true').lower() == 'true'
+    OVERDUE_SWEEP_INTERVAL: float = float(os.getenv('OVERDUE_SWEEP_INTERVAL', 300))
+    OVERDUE_SWEEP_FULL_INTERVAL: float = float(os.getenv('OVERDUE_SWEEP_FULL_INTERVAL', 86400))
+    OVERDUE_SWEEP_BATCH_SIZE: int = int(os.getenv('OVERDUE_SWEEP_BATCH_SIZE', 5000))
+    
+    # Consultas lentas
+    SLOW_QUERY_LOG: bool = os.getenv('SLOW_QUERY_LOG', 'true').lower() == 'true'
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', 200))
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = float(os.getenv('SLOW_QUERY_EXPLAIN_SAMPLE_RATE', 0.1))
+    SLOW_QUERY_EXPLAIN_TIMEOUT_MS: int = int(os.getenv('SLOW_QUERY_EXPLAIN_TIMEOUT_MS', 10000))
+    SLOW_QUERY_MAX_CONCURRENT_EXPLAINS: int = int(os.getenv('SLOW_QUERY_MAX_CONCURRENT_EXPLAINS', 2))
+    SLOW_QUERY_BUFFER_SIZE: int = int(os.getenv('SLOW_QUERY_BUFFER_SIZE', 200))
+    SLOW_QUERY_LOG_FILE: str = os.getenv('SLOW_QUERY_LOG_FILE', 'logs/slow_queries.log')
+    SLOW_QUERY_LOG_MAX_BYTES: int = int(os.getenv('SLOW_QUERY_LOG_MAX_BYTES', 10 * 1024 * 1024))
+    SLOW_QUERY_LOG_BACKUPS: int = int(os.getenv('SLOW_QUERY_LOG_BACKUPS', 5))
+
+    # Búsqueda en el catálogo
+    SEARCH_MAX_CANDIDATES: int = int(os.getenv('SEARCH_MAX_CANDIDATES', 1000))
+
+    # Caché del catálogo (por proceso)
+    CATALOG_CACHE_ENABLED: bool = os.getenv('CATALOG_CACHE_ENABLED', 'true').lower() == 'true'
+    CATALOG_CACHE_MAX_SIZE: int = int(os.getenv('CATALOG_CACHE_MAX_SIZE', 10000))
+    CATALOG_CACHE_TTL: float = float(os.getenv('CATALOG_CACHE_TTL', 60))
+    CATALOG_CACHE_INVALIDATION_GRACE: float = float(os.getenv('CATALOG_CACHE_INVALIDATION_GRACE', 5))
+    # Antigüedad máxima de los conteos de disponibilidad de /materials/facets
+    FACET_CACHE_TTL: float = float(os.getenv('FACET_CACHE_TTL', 10))
+
+    # Importación masiva de materiales
+    MATERIAL_IMPORT_BATCH_SIZE: int = int(os.getenv('MATERIAL_IMPORT_BATCH_SIZE', 5000))
+    MATERIAL_IMPORT_MAX_REPORTED_ERRORS: int = int(os.getenv('MATERIAL_IMPORT_MAX_REPORTED_ERRORS', 1000))
+
+    # Exportación por streaming (filas por bloque del cursor del servidor)
+    EXPORT_BATCH_SIZE: int = int(os.getenv('EXPORT_BATCH_SIZE', 5000))
+
+    # Autocompletado en memoria (por proceso)
+    AUTOCOMPLETE_ENABLED: bool = os.getenv('AUTOCOMPLETE_ENABLED', 'true').lower() == 'true'
+    AUTOCOMPLETE_REFRESH_SECONDS: float = float(os.getenv('AUTOCOMPLETE_REFRESH_SECONDS', 600))
+    
     # Servidor
     HOST: str = os.getenv('HOST', '0.0.0.0')
     PORT: int = int(os.getenv('PORT', 8000))
@@ -7,27 +7,135 @@ from sqlalchemy import (
     Date,
     Text,
     ForeignKey,
+    Index,
+    event,
     text,
 )
-from sqlalchemy.orm import declarative_base, sessionmaker, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker, relationship, deferred
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from datetime import datetime, timezone
+from fastapi import Request, Response
 import os
+import time
 from dotenv import load_dotenv
 from uuid import uuid4
+from config import settings
+from database.pool_stats import (
+    InstrumentedQueuePool,
+    InstrumentedAsyncAdaptedQueuePool,
+    register_pool_stats,
+)
+from database.replicas import ReplicaSet, to_async_url
+from database.instrumentation import instrument_engine
+from database.slow_query import install_slow_query_log
 
 load_dotenv()
 
 connection_string = os.getenv("DATABASE_URL")
 if not connection_string:
     raise ValueError("DATABASE_URL environment variable is not set.")
+
+"""
+Opciones del pool y del logging SQL comunes a ambos engines, configurables
+por despliegue desde config.Settings.
+"""
+engine_options = {
+    "echo": settings.DB_ECHO,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+}
+
 engine = create_engine(
-    connection_string, echo=True, pool_pre_ping=True, pool_recycle=300
+    connection_string, poolclass=InstrumentedQueuePool, **engine_options
 )
+register_pool_stats("sync", engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+"""
+Engine asíncrono (asyncpg) usado por los endpoints. El engine síncrono se
+mantiene para scripts y tareas de mantenimiento como migrate_database.
+Si ASYNC_DATABASE_URL no está definida se deriva de DATABASE_URL, traduciendo sus
+parámetros de libpq (sslmode, etc.) a los argumentos de conexión de asyncpg.
+"""
+async_connect_args = {}
+async_connection_string = os.getenv("ASYNC_DATABASE_URL")
+if not async_connection_string:
+    async_connection_string, async_connect_args = to_async_url(connection_string)
+async_engine = create_async_engine(
+    async_connection_string,
+    connect_args=async_connect_args,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    **engine_options,
+)
+register_pool_stats("primary", async_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+"""
+Réplicas de lectura opcionales. Los GET usan get_read_db, que elige una réplica
+con retraso aceptable o vuelve al primario; las escrituras usan get_write_db.
+"""
+replica_set = ReplicaSet(
+    settings.DB_READ_REPLICA_URLS,
+    engine_options,
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.DB_REPLICA_LAG_CHECK_INTERVAL,
+)
+
+"""
+Instrumentación SQL por petición (sentencias, tiempo y filas) en todos los
+engines; el middleware SqlMetricsMiddleware la expone en Server-Timing.
+"""
+if settings.SQL_INSTRUMENTATION:
+    for instrumented_engine in [engine, async_engine] + [
+        replica.engine for replica in replica_set.replicas
+    ]:
+        instrument_engine(instrumented_engine)
+
+"""
+Registro de consultas lentas con captura muestreada de EXPLAIN (ANALYZE, BUFFERS)
+"""
+if settings.SLOW_QUERY_LOG:
+    install_slow_query_log("sync", engine)
+    install_slow_query_log("primary", async_engine)
+    for replica in replica_set.replicas:
+        install_slow_query_log(replica.name, replica.engine)
+
+LAST_WRITE_COOKIE = "last_write_at"
+LAST_WRITE_HEADER = "X-Last-Write-At"
 Base = declarative_base()
 
 
+class UTCDateTime(TypeDecorator):
+    """
+    TIMESTAMP sin zona horaria que guarda los valores en UTC.
+    asyncpg rechaza datetimes con zona horaria en columnas TIMESTAMP, así que los
+    valores con zona se convierten a UTC y se les quita la zona antes de enviarlos.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+
+"""
+Todas las relaciones usan lazy="raise": se cargan con las opciones de
+database.load_options y acceder a una relación no cargada falla en lugar de emitir
+una consulta por fila. Las colecciones usan passive_deletes=True para que borrar el
+padre no las cargue; la clave foránea rechaza el borrado si tiene filas asociadas.
+"""
+
+
 class Role(Base):
     __tablename__ = "roles"
 
@@ -37,12 +145,12 @@ class Role(Base):
     created_by = Column(UUID(as_uuid=True), nullable=True)
     updated_by = Column(UUID(as_uuid=True), nullable=True)
     updated_at = Column(
-        DateTime,
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
 
-    users = relationship("User", back_populates="role")
+    users = relationship("User", back_populates="role", lazy="raise", passive_deletes=True)
 
     def __repr__(self):
         return f"<Role(name={self.name})>"
@@ -50,24 +158,34 @@ class Role(Base):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_active", "id", postgresql_where=text("is_deleted = false")),
+        Index("ix_users_role_id", "role_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     email = Column(String(100), unique=True, nullable=False)
     full_name = Column(String(100))
     password = Column(String(255), nullable=False)
     role_id = Column(UUID(as_uuid=True), ForeignKey("roles.id"), nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(timezone.utc))
     created_by = Column(UUID(as_uuid=True), nullable=True)
     updated_at = Column(
-        DateTime,
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
     updated_by = Column(UUID(as_uuid=True), nullable=True)
     is_deleted = Column(Boolean, default=False)
 
-    role = relationship("Role", back_populates="users")
-    loans = relationship("Loan", foreign_keys="Loan.user_id", back_populates="user")
+    role = relationship("Role", back_populates="users", lazy="raise")
+    loans = relationship(
+        "Loan",
+        foreign_keys="Loan.user_id",
+        back_populates="user",
+        lazy="raise",
+        passive_deletes=True,
+    )
 
     def __repr__(self):
         return f"<User(email={self.email})>"
@@ -75,6 +193,7 @@ class User(Base):
 
 class Author(Base):
     __tablename__ = "authors"
+    __table_args__ = (Index("ix_authors_name", "name"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String(100), nullable=False)
@@ -85,12 +204,14 @@ class Author(Base):
     created_by = Column(UUID(as_uuid=True), nullable=True)
     updated_by = Column(UUID(as_uuid=True), nullable=True)
     updated_at = Column(
-        DateTime,
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
 
-    materials = relationship("Material", back_populates="author")
+    materials = relationship(
+        "Material", back_populates="author", lazy="raise", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<Author(name={self.name})>"
@@ -105,12 +226,14 @@ class MaterialType(Base):
     created_by = Column(UUID(as_uuid=True), nullable=True)
     updated_by = Column(UUID(as_uuid=True), nullable=True)
     updated_at = Column(
-        DateTime,
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
 
-    materials = relationship("Material", back_populates="material_type")
+    materials = relationship(
+        "Material", back_populates="material_type", lazy="raise", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<MaterialType(name={self.name})>"
@@ -118,25 +241,75 @@ class MaterialType(Base):
 
 class Material(Base):
     __tablename__ = "materials"
+    __table_args__ = (
+        Index(
+            "ix_materials_active_title",
+            "title",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # Orden `newest` del catálogo (recorrido hacia atrás)
+        Index(
+            "ix_materials_active_date_added",
+            "date_added",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index("ix_materials_author_id", "author_id"),
+        Index("ix_materials_type_id", "type_id"),
+        # Búsqueda de texto completo (migración 0005); los índices de trigramas sobre
+        # f_unaccent(lower(title)) solo existen en la migración
+        Index(
+            "ix_materials_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # Filtro `available` del catálogo (migración 0007), uno por orden
+        Index(
+            "ix_materials_available_title",
+            "title",
+            "id",
+            postgresql_where=text("is_deleted = false AND is_available = true"),
+        ),
+        Index(
+            "ix_materials_available_date_added",
+            "date_added",
+            "id",
+            postgresql_where=text("is_deleted = false AND is_available = true"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     title = Column(String(200), nullable=False)
     author_id = Column(UUID(as_uuid=True), ForeignKey("authors.id"), nullable=False)
     type_id = Column(UUID(as_uuid=True), ForeignKey("material_types.id"), nullable=False)
     is_deleted = Column(Boolean, default=False)
-    date_added = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    date_added = Column(
+        UTCDateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
     created_by = Column(UUID(as_uuid=True), nullable=True)
     updated_by = Column(UUID(as_uuid=True), nullable=True)
     updated_at = Column(
-        DateTime,
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
-
-    author = relationship("Author", back_populates="materials")
-    material_type = relationship("MaterialType", back_populates="materials")
+    # Mantenida por el trigger materials_search_vector_update; no se carga por defecto
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+    # Se actualizan en la misma transacción que crea o devuelve el préstamo, con la
+    # fila bloqueada. Sin clave foránea: la clave primaria de loans es (id, loan_date)
+    is_available = Column(Boolean, nullable=False, default=True, server_default=text("true"))
+    active_loan_id = Column(UUID(as_uuid=True), nullable=True)
+
+    author = relationship("Author", back_populates="materials", lazy="raise")
+    material_type = relationship("MaterialType", back_populates="materials", lazy="raise")
     loans = relationship(
-        "Loan", foreign_keys="Loan.material_id", back_populates="material"
+        "Loan",
+        foreign_keys="Loan.material_id",
+        back_populates="material",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -145,18 +318,19 @@ class Material(Base):
 
 class LoanStatus(Base):
     __tablename__ = "loan_status"
+    __table_args__ = (Index("ix_loan_status_name", "name"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String(50), nullable=False)
     created_by = Column(UUID(as_uuid=True), nullable=True)
     updated_by = Column(UUID(as_uuid=True), nullable=True)
     updated_at = Column(
-        DateTime,
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
 
-    loans = relationship("Loan", back_populates="status")
+    loans = relationship("Loan", back_populates="status", lazy="raise", passive_deletes=True)
 
     def __repr__(self):
         return f"<LoanStatus(name={self.name})>"
@@ -164,198 +338,93 @@ class LoanStatus(Base):
 
 class Loan(Base):
     __tablename__ = "loans"
+    __table_args__ = (
+        # Préstamo abierto por material (verificación de disponibilidad)
+        Index(
+            "ix_loans_open_material",
+            "material_id",
+            postgresql_where=text("actual_return_date IS NULL"),
+        ),
+        # Préstamos abiertos por fecha de vencimiento (barrido de vencidos, migración 0010)
+        Index(
+            "ix_loans_open_due",
+            "expected_return_date",
+            "id",
+            postgresql_where=text("actual_return_date IS NULL"),
+        ),
+        # Listado paginado por cursor (migración 0008)
+        Index("ix_loans_loan_date", "loan_date", "id"),
+        # Historial de un usuario; cubre las columnas del resumen del préstamo
+        Index(
+            "ix_loans_user_history",
+            "user_id",
+            "loan_date",
+            "id",
+            postgresql_include=[
+                "material_id", "status_id", "expected_return_date", "actual_return_date",
+            ],
+        ),
+        Index("ix_loans_material_history", "material_id", "loan_date", "id"),
+        Index("ix_loans_status_loan_date", "status_id", "loan_date", "id"),
+        Index("ix_loans_expected_return", "expected_return_date", "id"),
+        # Particionada por mes (migración 0003, mantenimiento en database.partitions)
+        {"postgresql_partition_by": "RANGE (loan_date)"},
+    )
 
+    # La clave primaria incluye la clave de partición
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     material_id = Column(UUID(as_uuid=True), ForeignKey("materials.id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    loan_date = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    expected_return_date = Column(DateTime, nullable=False)
-    actual_return_date = Column(DateTime)
+    # Sin zona horaria desde Python para que la identidad (id, loan_date) coincida con la fila leída
+    loan_date = Column(
+        UTCDateTime,
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+    expected_return_date = Column(UTCDateTime, nullable=False)
+    actual_return_date = Column(UTCDateTime)
     status_id = Column(UUID(as_uuid=True), ForeignKey("loan_status.id"), nullable=False)
     created_by = Column(UUID(as_uuid=True), nullable=True)
     updated_by = Column(UUID(as_uuid=True), nullable=True)
     updated_at = Column(
-        DateTime,
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
 
-    material = relationship("Material", back_populates="loans")
-    user = relationship("User", foreign_keys="Loan.user_id", back_populates="loans")
-    status = relationship("LoanStatus", back_populates="loans")
+    material = relationship("Material", back_populates="loans", lazy="raise")
+    user = relationship(
+        "User", foreign_keys="Loan.user_id", back_populates="loans", lazy="raise"
+    )
+    status = relationship("LoanStatus", back_populates="loans", lazy="raise")
 
     def __repr__(self):
         return f"<Loan(user_id={self.user_id}, material_id={self.material_id})>"
 
 
 def create_tables():
+    from database.partitions import DEFAULT_PARTITION, ensure_loan_partitions
+
     Base.metadata.create_all(bind=engine)
+    # create_all crea loans particionada pero sin particiones
+    with engine.begin() as connection:
+        connection.execute(
+            text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF loans DEFAULT")
+        )
+        ensure_loan_partitions(connection)
     print("✅ Tablas creadas correctamente.")
 
 
 def migrate_database():
-    Base.metadata.create_all(bind=engine)
-
-    # Configurar el hash de contraseñas
-    from passlib.context import CryptContext
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-    
-    with SessionLocal() as db:
-        # Crear roles si no existen
-        if db.query(Role).count() == 0:
-            admin_role = Role(
-                name="admin",
-                description="Administrador del sistema"
-            )
-            client_role = Role(
-                name="cliente",
-                description="Cliente de la biblioteca"
-            )
-            db.add_all([admin_role, client_role])
-            db.commit()
-            print("👥 Roles de ejemplo insertados.")
-        else:
-            admin_role = db.query(Role).filter_by(name="admin").first()
-            client_role = db.query(Role).filter_by(name="cliente").first()
-            print("⚠️ Ya existen roles, no se insertaron de nuevo.")
-
-        # Crear usuarios si no existen
-        if db.query(User).count() == 0:
-            admin = User(
-                email="admin@ejemplo.com",
-                full_name="Administrador",
-                password=pwd_context.hash("admin123"),
-                role_id=admin_role.id,
-            )
-            user1 = User(
-                email="usuario1@ejemplo.com",
-                full_name="Juan Pérez",
-                password=pwd_context.hash("user123"),
-                role_id=client_role.id,
-            )
-            db.add_all([admin, user1])
-            db.commit()
-            print("👤 Usuarios de ejemplo insertados.")
-
-            admin_id = admin.id
-            user1_id = user1.id
-
-        else:
-            admin_id = db.query(User.id).filter_by(email="admin@ejemplo.com").scalar()
-            user1_id = (
-                db.query(User.id).filter_by(email="usuario1@ejemplo.com").scalar()
-            )
-            print("⚠️ Ya existen usuarios, no se insertaron de nuevo.")
-
-        # Crear autores si no existen
-        if db.query(Author).count() == 0:
-            author1 = Author(
-                name="Antoine de Saint-Exupéry",
-                nationality="Francés",
-                birth_date="1900-06-29"
-            )
-            author2 = Author(
-                name="Miguel de Cervantes",
-                nationality="Español",
-                birth_date="1547-09-29",
-                death_date="1616-04-22"
-            )
-            db.add_all([author1, author2])
-            db.commit()
-            print("✍️ Autores de ejemplo insertados.")
-        else:
-            author1 = db.query(Author).filter_by(name="Antoine de Saint-Exupéry").first()
-            author2 = db.query(Author).filter_by(name="Miguel de Cervantes").first()
-            print("⚠️ Ya existen autores, no se insertaron de nuevo.")
-
-        # Crear tipos de material si no existen
-        if db.query(MaterialType).count() == 0:
-            book_type = MaterialType(
-                name="book",
-                description="Libro"
-            )
-            magazine_type = MaterialType(
-                name="magazine",
-                description="Revista"
-            )
-            newspaper_type = MaterialType(
-                name="newspaper",
-                description="Periódico"
-            )
-            db.add_all([book_type, magazine_type, newspaper_type])
-            db.commit()
-            print("📖 Tipos de material de ejemplo insertados.")
-        else:
-            book_type = db.query(MaterialType).filter_by(name="book").first()
-            magazine_type = db.query(MaterialType).filter_by(name="magazine").first()
-            newspaper_type = db.query(MaterialType).filter_by(name="newspaper").first()
-            print("⚠️ Ya existen tipos de material, no se insertaron de nuevo.")
-
-        # Crear materiales si no existen
-        if db.query(Material).count() == 0:
-            m1 = Material(
-                title="El Principito",
-                author_id=author1.id,
-                type_id=book_type.id,
-                created_by=admin_id,
-                updated_by=admin_id,
-            )
-            m2 = Material(
-                title="Don Quijote",
-                author_id=author2.id,
-                type_id=book_type.id,
-                created_by=admin_id,
-                updated_by=admin_id,
-            )
-            db.add_all([m1, m2])
-            db.commit()
-            print("📚 Materiales de ejemplo insertados.")
-            m1_id = m1.id
-            m2_id = m2.id
-        else:
-            m1_id = db.query(Material.id).filter_by(title="El Principito").scalar()
-            m2_id = db.query(Material.id).filter_by(title="Don Quijote").scalar()
-            print("⚠️ Ya existen materiales, no se insertaron de nuevo.")
-
-        # Crear estados de préstamo si no existen
-        if db.query(LoanStatus).count() == 0:
-            borrowed_status = LoanStatus(name="borrowed")
-            returned_status = LoanStatus(name="returned")
-            overdue_status = LoanStatus(name="overdue")
-            db.add_all([borrowed_status, returned_status, overdue_status])
-            db.commit()
-            print("📋 Estados de préstamo insertados.")
-        else:
-            borrowed_status = db.query(LoanStatus).filter_by(name="borrowed").first()
-            returned_status = db.query(LoanStatus).filter_by(name="returned").first()
-            overdue_status = db.query(LoanStatus).filter_by(name="overdue").first()
-            print("⚠️ Ya existen estados de préstamo, no se insertaron de nuevo.")
-
-        # Crear préstamos si no existen
-        if db.query(Loan).count() == 0:
-            loan1 = Loan(
-                material_id=m1_id,
-                user_id=user1_id,
-                expected_return_date=datetime.now(timezone.utc),
-                status_id=borrowed_status.id,
-                created_by=admin_id,
-                updated_by=admin_id,
-            )
-            loan2 = Loan(
-                material_id=m2_id,
-                user_id=admin_id,
-                expected_return_date=datetime.now(timezone.utc),
-                status_id=returned_status.id,
-                actual_return_date=datetime.now(timezone.utc),
-                created_by=admin_id,
-                updated_by=admin_id,
-            )
-            db.add_all([loan1, loan2])
-            db.commit()
-            print("📋 Préstamos de ejemplo insertados.")
-        else:
-            print("⚠️ Ya existen préstamos, no se insertaron de nuevo.")
-
+    """
+    Aplica las migraciones pendientes y los datos de ejemplo.
+    Pensado para scripts; la API no lo ejecuta al iniciar.
+    """
+    from database.migrations import upgrade
+    from database.seed import seed_database
+
+    upgrade(engine)
+    seed_database()
     print("✅ Migración ejecutada correctamente.")
 
 
@@ -370,6 +439,16 @@ def test_connection():
         return False
 
 
+async def test_async_connection():
+    try:
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        return True
+    except Exception as e:
+        print(f"❌ Error de conexión: {e}")
+        return False
+
+
 if __name__ == "__main__":
     print("🔄 Probando conexión a la base de datos...")
     if test_connection():
@@ -382,3 +461,54 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_write_db(response: Response):
+    """
+    Sesión sobre el primario para endpoints que escriben.
+    Tras cada commit exitoso marca al cliente (cookie y header) para que sus
+    lecturas inmediatas vayan al primario y vea su propia escritura; si la
+    escritura falla no se marca.
+    """
+
+    def mark_last_write(session):
+        now = f"{time.time():.3f}"
+        response.set_cookie(
+            LAST_WRITE_COOKIE,
+            now,
+            max_age=int(settings.DB_READ_YOUR_WRITES_SECONDS) + 1,
+            httponly=True,
+            samesite="lax",
+        )
+        response.headers[LAST_WRITE_HEADER] = now
+
+    async with AsyncSessionLocal() as db:
+        event.listen(db.sync_session, "after_commit", mark_last_write)
+        yield db
+
+
+def _wrote_recently(request: Request) -> bool:
+    last_write = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(
+        LAST_WRITE_COOKIE
+    )
+    try:
+        return time.time() - float(last_write) < settings.DB_READ_YOUR_WRITES_SECONDS
+    except (TypeError, ValueError):
+        return False
+
+
+async def get_read_db(request: Request):
+    """
+    Sesión de solo lectura: usa una réplica con retraso aceptable, o el
+    primario si no hay ninguna disponible o el cliente escribió hace poco.
+    """
+    sessionmaker = None
+    if not _wrote_recently(request):
+        sessionmaker = replica_set.pick()
+    async with (sessionmaker or AsyncSessionLocal)() as db:
+        yield db
@@ -0,0 +1,126 @@
+"""
+Exportación de materiales, autores y préstamos en NDJSON o CSV con memoria constante.
+
+Las filas se leen con un cursor del lado del servidor (`stream` con `yield_per`) como
+tuplas Core, sin pasar por el identity map del ORM, y se serializan por bloques de
+EXPORT_BATCH_SIZE filas: en memoria solo vive el bloque actual. El orden es la clave
+primaria, de modo que una exportación interrumpida se reanuda desde el último id
+escrito (`after`) con una comparación que resuelve el índice de la clave primaria.
+
+El cursor mantiene abierta una transacción de lectura mientras dura la exportación;
+en una réplica, una exportación larga puede retrasar o cancelar la replicación según
+`max_standby_streaming_delay` y `hot_standby_feedback`.
+
+Lo usan el endpoint GET /admin/export/{entity} y el script scripts.export_catalog.
+
+Funciones:
+    export_columns: Nombres de las columnas exportadas de una entidad
+    stream_export: Genera el contenido de la exportación por bloques
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common import ExportEntity, ImportFormat
+from config import settings
+from database.connection import Author, Loan, Material
+
+"""
+Columnas exportadas por entidad: todas las de la tabla salvo las derivadas
+(search_vector se reconstruye con el trigger de la migración 0005).
+"""
+EXPORT_COLUMNS = {
+    ExportEntity.materials: [
+        column for column in Material.__table__.c if column.name != "search_vector"
+    ],
+    ExportEntity.authors: list(Author.__table__.c),
+    ExportEntity.loans: list(Loan.__table__.c),
+}
+
+
+def export_columns(entity: ExportEntity) -> List[str]:
+    return [column.name for column in EXPORT_COLUMNS[entity]]
+
+
+def _text_value(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _json_value(value):
+    if isinstance(value, (datetime, date, UUID)):
+        return _text_value(value)
+    return value
+
+
+def _serialize(rows, names: List[str], export_format: ImportFormat) -> str:
+    if export_format == ImportFormat.ndjson:
+        return "".join(
+            json.dumps(
+                {name: _json_value(value) for name, value in zip(names, row)},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            + "\n"
+            for row in rows
+        )
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(
+        [_text_value(value) for value in row] for row in rows
+    )
+    return buffer.getvalue()
+
+
+async def stream_export(
+    db: AsyncSession,
+    entity: ExportEntity,
+    export_format: ImportFormat,
+    after: Optional[UUID] = None,
+    batch_size: Optional[int] = None,
+) -> AsyncIterator[Tuple[str, Optional[UUID], int]]:
+    """
+    Recorre la tabla de la entidad en orden de clave primaria con un cursor del lado
+    del servidor y genera el contenido serializado por bloques.
+
+    Args:
+        db (AsyncSession): Sesión sobre la que se abre el cursor.
+        entity (ExportEntity): Tabla a exportar.
+        export_format (ImportFormat): csv o ndjson.
+        after (Optional[UUID]): Reanuda después de este id (el último exportado). En
+            CSV el encabezado solo se escribe cuando no se reanuda.
+        batch_size (Optional[int]): Filas por bloque; por defecto EXPORT_BATCH_SIZE.
+
+    Returns:
+        AsyncIterator[Tuple[str, Optional[UUID], int]]: Cada bloque de texto, el id de
+        su última fila (None en el encabezado), para registrar el punto de reanudación,
+        y su número de filas.
+    """
+    columns = EXPORT_COLUMNS[entity]
+    names = export_columns(entity)
+    table = columns[0].table
+
+    stmt = select(*columns).order_by(*table.primary_key.columns)
+    if after is not None:
+        stmt = stmt.where(table.c.id > after)
+
+    if export_format == ImportFormat.csv and after is None:
+        yield _serialize([names], names, export_format), None, 0
+
+    result = await db.stream(
+        stmt, execution_options={"yield_per": batch_size or settings.EXPORT_BATCH_SIZE}
+    )
+    id_index = names.index("id")
+    async for rows in result.partitions():
+        yield _serialize(rows, names, export_format), rows[-1][id_index], len(rows)
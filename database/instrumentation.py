@@ -0,0 +1,210 @@
+"""
+Instrumentación de SQL por petición.
+
+Este módulo proporciona:
+- Hooks de SQLAlchemy que cuentan sentencias, tiempo en base de datos y filas por petición
+- Detección de N+1: la misma forma de sentencia ejecutada más de N veces en una petición
+- Estadísticas acumuladas por ruta para el endpoint de administración
+
+El middleware SqlMetricsMiddleware abre el contexto de cada petición con
+`start_request` y lo cierra con `finish_request`.
+
+Clases:
+    RequestSqlStats: Métricas SQL de una petición en curso
+
+Funciones:
+    instrument_engine: Registra los hooks en un engine (síncrono o asíncrono)
+    current_request_stats: Métricas de la petición actual, si hay una
+    current_route: Ruta de la petición actual, si hay una
+    start_request / finish_request: Ciclo de vida del contexto por petición
+    get_route_stats: Estadísticas acumuladas por ruta
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_IN_LIST = re.compile(r"IN \((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normaliza una sentencia para agrupar ejecuciones equivalentes."""
+    return _WHITESPACE.sub(" ", _IN_LIST.sub("IN (...)", statement)).strip()
+
+
+class RequestSqlStats:
+    """
+    Métricas SQL de una petición.
+
+    Attributes:
+        method (str): Método HTTP de la petición.
+        statements (int): Sentencias ejecutadas.
+        db_time (float): Segundos acumulados en base de datos.
+        rows (int): Filas devueltas o afectadas.
+        n_plus_one (List[str]): Formas de sentencia que superaron el umbral.
+    """
+
+    def __init__(self, method: str, scope: dict):
+        self.method = method
+        self._scope = scope
+        self.statements = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.shapes: Counter = Counter()
+        self.n_plus_one: List[str] = []
+
+    @property
+    def routed(self) -> bool:
+        return self._scope.get("route") is not None
+
+    @property
+    def route(self) -> str:
+        """Plantilla de ruta (por ejemplo "GET /loans/{loan_id}") o la ruta cruda si aún no se resolvió."""
+        route = self._scope.get("route")
+        return f"{self.method} {route.path if route is not None else self._scope['path']}"
+
+    def record(self, statement: str, elapsed: float, rows: int):
+        self.statements += 1
+        self.db_time += elapsed
+        self.rows += max(rows, 0)
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        if self.shapes[shape] == settings.SQL_N_PLUS_ONE_THRESHOLD + 1:
+            self.n_plus_one.append(shape)
+            logger.warning(
+                "Posible N+1 en %s: la misma sentencia se ejecutó más de %s veces: %s",
+                self.route,
+                settings.SQL_N_PLUS_ONE_THRESHOLD,
+                shape[:300],
+            )
+
+
+_current: ContextVar[Optional[RequestSqlStats]] = ContextVar(
+    "request_sql_stats", default=None
+)
+
+
+def current_request_stats() -> Optional[RequestSqlStats]:
+    return _current.get()
+
+
+def current_route() -> Optional[str]:
+    """Ruta de la petición en curso, o None fuera de una petición."""
+    stats = _current.get()
+    return stats.route if stats is not None else None
+
+
+def start_request(method: str, scope: dict):
+    """Abre el contexto de métricas de una petición; devuelve el token para cerrarlo."""
+    return _current.set(RequestSqlStats(method, scope))
+
+
+def _row_count(cursor) -> int:
+    if cursor.rowcount is not None and cursor.rowcount >= 0:
+        return cursor.rowcount
+    # El cursor adaptado de asyncpg no informa rowcount en SELECT, pero ya
+    # tiene las filas en memoria al terminar la ejecución
+    return len(getattr(cursor, "_rows", None) or ())
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed, _row_count(cursor))
+
+
+def instrument_engine(engine):
+    """
+    Registra los hooks de instrumentación en un engine.
+
+    Args:
+        engine: Engine o AsyncEngine de SQLAlchemy.
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class _RouteStats:
+    def __init__(self):
+        self.requests = 0
+        self.statements = 0
+        self.max_statements = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.n_plus_one_requests = 0
+        self.n_plus_one_shapes: Counter = Counter()
+
+
+_route_stats: Dict[str, _RouteStats] = {}
+_route_lock = threading.Lock()
+
+
+def finish_request(token) -> RequestSqlStats:
+    """
+    Cierra el contexto de la petición y acumula sus métricas en la plantilla de ruta.
+    Las rutas inexistentes se agrupan en una sola entrada por método.
+
+    Args:
+        token: Valor devuelto por start_request.
+
+    Returns:
+        RequestSqlStats: Las métricas de la petición.
+    """
+    stats = _current.get()
+    _current.reset(token)
+    route = stats.route if stats.routed else f"{stats.method} <sin ruta>"
+    with _route_lock:
+        entry = _route_stats.setdefault(route, _RouteStats())
+        entry.requests += 1
+        entry.statements += stats.statements
+        entry.max_statements = max(entry.max_statements, stats.statements)
+        entry.db_time += stats.db_time
+        entry.rows += stats.rows
+        if stats.n_plus_one:
+            entry.n_plus_one_requests += 1
+            entry.n_plus_one_shapes.update(stats.n_plus_one)
+    return stats
+
+
+def get_route_stats() -> List[dict]:
+    """
+    Devuelve las estadísticas acumuladas por ruta, de mayor a menor tiempo en base de datos.
+
+    Returns:
+        List[dict]: Una entrada por ruta.
+    """
+    with _route_lock:
+        items = [
+            {
+                "route": route,
+                "requests": entry.requests,
+                "statements_avg": entry.statements / entry.requests,
+                "statements_max": entry.max_statements,
+                "db_time_avg_ms": entry.db_time / entry.requests * 1000,
+                "db_time_total_ms": entry.db_time * 1000,
+                "rows_avg": entry.rows / entry.requests,
+                "n_plus_one_requests": entry.n_plus_one_requests,
+                "n_plus_one_statements": [
+                    shape for shape, _ in entry.n_plus_one_shapes.most_common(5)
+                ],
+            }
+            for route, entry in _route_stats.items()
+        ]
+    return sorted(items, key=lambda item: item["db_time_total_ms"], reverse=True)
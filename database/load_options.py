@@ -0,0 +1,33 @@
+"""
+Opciones de carga de relaciones para cada esquema de respuesta.
+
+Las relaciones de los modelos usan lazy="raise": acceder a una relación que no se
+cargó por adelantado lanza una excepción en lugar de emitir una consulta por fila
+(N+1). Los endpoints que devuelven un esquema con relaciones anidadas aplican estas
+opciones, que cargan exactamente lo que el esquema serializa.
+
+Las relaciones muchos-a-uno obligatorias se cargan con joinedload(innerjoin=True),
+por lo que cada página se obtiene en una sola consulta.
+
+Constantes:
+    USER_RESPONSE_OPTIONS: Esquema User (role)
+    MATERIAL_RESPONSE_OPTIONS: Esquema Material (author, material_type)
+    LOAN_RESPONSE_OPTIONS: Esquema LoanResponse (material con autor y tipo, user con rol, status)
+"""
+
+from sqlalchemy.orm import joinedload
+
+from database.connection import Loan, Material, User
+
+USER_RESPONSE_OPTIONS = (joinedload(User.role, innerjoin=True),)
+
+MATERIAL_RESPONSE_OPTIONS = (
+    joinedload(Material.author, innerjoin=True),
+    joinedload(Material.material_type, innerjoin=True),
+)
+
+LOAN_RESPONSE_OPTIONS = (
+    joinedload(Loan.material, innerjoin=True).options(*MATERIAL_RESPONSE_OPTIONS),
+    joinedload(Loan.user, innerjoin=True).options(*USER_RESPONSE_OPTIONS),
+    joinedload(Loan.status, innerjoin=True),
+)
@@ -0,0 +1,102 @@
+"""
+Esquema inicial: roles, usuarios, autores, tipos de material, materiales,
+estados de préstamo y préstamos.
+
+Usa IF NOT EXISTS para que las bases creadas antes del sistema de migraciones
+(con Base.metadata.create_all) queden registradas sin cambios.
+"""
+
+from sqlalchemy import text
+
+description = "Esquema inicial"
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS roles (
+        id UUID PRIMARY KEY,
+        name VARCHAR(50) NOT NULL,
+        description VARCHAR(200),
+        created_by UUID,
+        updated_by UUID,
+        updated_at TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id UUID PRIMARY KEY,
+        email VARCHAR(100) NOT NULL UNIQUE,
+        full_name VARCHAR(100),
+        password VARCHAR(255) NOT NULL,
+        role_id UUID NOT NULL REFERENCES roles(id),
+        created_at TIMESTAMP,
+        created_by UUID,
+        updated_at TIMESTAMP,
+        updated_by UUID,
+        is_deleted BOOLEAN
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS authors (
+        id UUID PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        nationality VARCHAR(50),
+        birth_date DATE,
+        death_date DATE,
+        biography TEXT,
+        created_by UUID,
+        updated_by UUID,
+        updated_at TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS material_types (
+        id UUID PRIMARY KEY,
+        name VARCHAR(50) NOT NULL,
+        description VARCHAR(200),
+        created_by UUID,
+        updated_by UUID,
+        updated_at TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS materials (
+        id UUID PRIMARY KEY,
+        title VARCHAR(200) NOT NULL,
+        author_id UUID NOT NULL REFERENCES authors(id),
+        type_id UUID NOT NULL REFERENCES material_types(id),
+        is_deleted BOOLEAN,
+        date_added TIMESTAMP,
+        created_by UUID,
+        updated_by UUID,
+        updated_at TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS loan_status (
+        id UUID PRIMARY KEY,
+        name VARCHAR(50) NOT NULL,
+        created_by UUID,
+        updated_by UUID,
+        updated_at TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS loans (
+        id UUID PRIMARY KEY,
+        material_id UUID NOT NULL REFERENCES materials(id),
+        user_id UUID NOT NULL REFERENCES users(id),
+        loan_date TIMESTAMP,
+        expected_return_date TIMESTAMP NOT NULL,
+        actual_return_date TIMESTAMP,
+        status_id UUID NOT NULL REFERENCES loan_status(id),
+        created_by UUID,
+        updated_by UUID,
+        updated_at TIMESTAMP
+    )
+    """,
+]
+
+
+def upgrade(connection):
+    for statement in STATEMENTS:
+        connection.execute(text(statement))
@@ -0,0 +1,61 @@
+"""
+Índices para las consultas más frecuentes: préstamos abiertos por material y por
+vencimiento, préstamos por usuario, materiales activos por título, filtros por
+autor y tipo, usuarios no eliminados y ordenamiento por nombre.
+
+Se construyen con CREATE INDEX CONCURRENTLY para no bloquear escrituras, por lo
+que la migración corre fuera de una transacción.
+"""
+
+from sqlalchemy import text
+
+description = "Índices para rutas de consulta frecuentes"
+
+transactional = False
+
+INDEXES = [
+    ("ix_loans_open_material", "loans (material_id) WHERE actual_return_date IS NULL"),
+    (
+        "ix_loans_open_expected_return",
+        "loans (expected_return_date) WHERE actual_return_date IS NULL",
+    ),
+    ("ix_loans_user_id", "loans (user_id)"),
+    ("ix_loans_material_id", "loans (material_id)"),
+    ("ix_materials_active_title", "materials (title, id) WHERE is_deleted = false"),
+    ("ix_materials_author_id", "materials (author_id)"),
+    ("ix_materials_type_id", "materials (type_id)"),
+    ("ix_users_active", "users (id) WHERE is_deleted = false"),
+    ("ix_users_role_id", "users (role_id)"),
+    ("ix_authors_name", "authors (name)"),
+    ("ix_loan_status_name", "loan_status (name)"),
+]
+
+
+def _drop_invalid_indexes(connection):
+    """
+    Un CREATE INDEX CONCURRENTLY interrumpido deja un índice INVALID que
+    IF NOT EXISTS no reconstruiría; se eliminan para reintentarlos.
+    """
+    invalid = connection.execute(
+        text(
+            """
+            SELECT c.relname
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE NOT i.indisvalid AND c.relname = ANY(:names)
+            """
+        ),
+        {"names": [name for name, _ in INDEXES]},
+    ).scalars().all()
+    for name in invalid:
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+
+def upgrade(connection):
+    _drop_invalid_indexes(connection)
+    for name, definition in INDEXES:
+        connection.execute(
+            text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+        )
+    for table in ("loans", "materials", "users", "authors", "loan_status"):
+        connection.execute(text(f"ANALYZE {table}"))
@@ -0,0 +1,89 @@
+"""
+Particiona la tabla loans por rango de loan_date (una partición por mes).
+
+La tabla existente se renombra, se crea la tabla particionada con la misma estructura,
+las particiones mensuales desde el préstamo más antiguo hasta LOANS_PARTITION_MONTHS_AHEAD
+meses adelante y una partición DEFAULT, se copian los datos y se eliminan la tabla y los
+índices anteriores. Los índices de la migración 0002 sobre loans se recrean sobre la
+tabla particionada, que los propaga a cada partición.
+
+La clave primaria pasa a ser (id, loan_date), ya que PostgreSQL exige que incluya la
+clave de partición; loan_date pasa a ser NOT NULL.
+
+Copia toda la tabla en una transacción con un lock exclusivo: ejecutar en una ventana
+de mantenimiento.
+"""
+
+import importlib
+
+from sqlalchemy import text
+
+from database.partitions import DEFAULT_PARTITION, ensure_loan_partitions
+
+description = "Particionamiento de loans por rango de loan_date"
+
+COLUMNS = (
+    "id, material_id, user_id, loan_date, expected_return_date, actual_return_date, "
+    "status_id, created_by, updated_by, updated_at"
+)
+
+
+def _loan_indexes():
+    hot_path_indexes = importlib.import_module("database.migrations.0002_hot_path_indexes")
+    return [
+        (name, definition)
+        for name, definition in hot_path_indexes.INDEXES
+        if definition.startswith("loans ")
+    ]
+
+
+def upgrade(connection):
+    relkind = connection.scalar(text("SELECT relkind FROM pg_class WHERE oid = to_regclass('loans')"))
+    if relkind == "p":
+        return
+
+    connection.execute(text("LOCK TABLE loans IN ACCESS EXCLUSIVE MODE"))
+    connection.execute(
+        text(
+            "UPDATE loans SET loan_date = COALESCE(updated_at, now() at time zone 'utc') "
+            "WHERE loan_date IS NULL"
+        )
+    )
+
+    connection.execute(text("ALTER TABLE loans RENAME TO loans_legacy"))
+    connection.execute(text("ALTER TABLE loans_legacy RENAME CONSTRAINT loans_pkey TO loans_legacy_pkey"))
+    for name, _ in _loan_indexes():
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+    connection.execute(
+        text(
+            """
+            CREATE TABLE loans (
+                id UUID NOT NULL,
+                material_id UUID NOT NULL REFERENCES materials(id),
+                user_id UUID NOT NULL REFERENCES users(id),
+                loan_date TIMESTAMP NOT NULL,
+                expected_return_date TIMESTAMP NOT NULL,
+                actual_return_date TIMESTAMP,
+                status_id UUID NOT NULL REFERENCES loan_status(id),
+                created_by UUID,
+                updated_by UUID,
+                updated_at TIMESTAMP,
+                PRIMARY KEY (id, loan_date)
+            ) PARTITION BY RANGE (loan_date)
+            """
+        )
+    )
+    connection.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF loans DEFAULT"))
+
+    oldest = connection.scalar(text("SELECT MIN(loan_date) FROM loans_legacy"))
+    ensure_loan_partitions(connection, start=oldest)
+
+    connection.execute(
+        text(f"INSERT INTO loans ({COLUMNS}) SELECT {COLUMNS} FROM loans_legacy")
+    )
+    connection.execute(text("DROP TABLE loans_legacy"))
+
+    for name, definition in _loan_indexes():
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}"))
+    connection.execute(text("ANALYZE loans"))
@@ -0,0 +1,50 @@
+"""
+Índice para paginar el catálogo por fecha de ingreso: (date_added, id) sobre los
+materiales activos. PostgreSQL lo recorre hacia atrás para el orden `newest`
+(date_added DESC, id DESC); el orden por título usa ix_materials_active_title.
+
+date_added pasa a ser NOT NULL (las filas sin fecha toman updated_at o la fecha
+actual) para que la comparación de tuplas del cursor no omita filas con NULL.
+
+El índice se construye con CREATE INDEX CONCURRENTLY, fuera de una transacción.
+"""
+
+from sqlalchemy import text
+
+description = "Índice de paginación por fecha de ingreso de materiales"
+
+transactional = False
+
+INDEX_NAME = "ix_materials_active_date_added"
+
+
+def upgrade(connection):
+    connection.execute(
+        text(
+            "UPDATE materials SET date_added = COALESCE(updated_at, now() at time zone 'utc') "
+            "WHERE date_added IS NULL"
+        )
+    )
+    connection.execute(text("ALTER TABLE materials ALTER COLUMN date_added SET NOT NULL"))
+
+    # Un CREATE INDEX CONCURRENTLY interrumpido deja un índice INVALID
+    invalid = connection.scalar(
+        text(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE NOT i.indisvalid AND c.relname = :name
+            )
+            """
+        ),
+        {"name": INDEX_NAME},
+    )
+    if invalid:
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}"))
+    connection.execute(
+        text(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            "ON materials (date_added, id) WHERE is_deleted = false"
+        )
+    )
+    connection.execute(text("ANALYZE materials"))
@@ -0,0 +1,148 @@
+"""
+Búsqueda de texto completo en el catálogo.
+
+- Extensiones unaccent y pg_trgm
+- Configuración de búsqueda `es_unaccent`: español con eliminación de tildes
+  ("Pérez" y "perez" generan el mismo lexema)
+- Función inmutable `f_unaccent(text)`, necesaria para usar unaccent en índices
+- Columna `materials.search_vector` (título con peso A, nombre del autor con peso B),
+  mantenida por triggers en materials y en authors (cambio de nombre del autor)
+- Índice GIN sobre search_vector e índices GIN de trigramas sobre el título y el
+  nombre del autor normalizados, para tolerar errores de escritura
+
+El relleno de search_vector se hace por lotes y los índices con CREATE INDEX
+CONCURRENTLY, por lo que la migración corre fuera de una transacción y es idempotente.
+"""
+
+from sqlalchemy import text
+
+description = "Búsqueda de texto completo en el catálogo"
+
+transactional = False
+
+BACKFILL_BATCH_SIZE = 10_000
+
+SETUP_STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'es_unaccent') THEN
+            CREATE TEXT SEARCH CONFIGURATION es_unaccent (COPY = spanish);
+            ALTER TEXT SEARCH CONFIGURATION es_unaccent
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+        END IF;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    AS $$ SELECT public.unaccent('public.unaccent', $1) $$
+    """,
+    "ALTER TABLE materials ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    """
+    CREATE OR REPLACE FUNCTION materials_search_vector(title text, author_id uuid)
+    RETURNS tsvector LANGUAGE sql STABLE
+    AS $$
+        SELECT setweight(to_tsvector('es_unaccent', coalesce(title, '')), 'A')
+            || setweight(
+                to_tsvector(
+                    'es_unaccent',
+                    coalesce((SELECT name FROM authors WHERE id = author_id), '')
+                ),
+                'B'
+            )
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION materials_search_vector_trigger() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        NEW.search_vector := materials_search_vector(NEW.title, NEW.author_id);
+        RETURN NEW;
+    END
+    $$
+    """,
+    "DROP TRIGGER IF EXISTS materials_search_vector_update ON materials",
+    """
+    CREATE TRIGGER materials_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, author_id ON materials
+    FOR EACH ROW EXECUTE FUNCTION materials_search_vector_trigger()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION authors_search_vector_trigger() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        UPDATE materials
+        SET search_vector = materials_search_vector(title, author_id)
+        WHERE author_id = NEW.id;
+        RETURN NULL;
+    END
+    $$
+    """,
+    "DROP TRIGGER IF EXISTS authors_search_vector_update ON authors",
+    """
+    CREATE TRIGGER authors_search_vector_update
+    AFTER UPDATE OF name ON authors
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION authors_search_vector_trigger()
+    """,
+]
+
+INDEXES = [
+    (
+        "ix_materials_search_vector",
+        "materials USING gin (search_vector) WHERE is_deleted = false",
+    ),
+    (
+        "ix_materials_title_trgm",
+        "materials USING gin (f_unaccent(lower(title)) gin_trgm_ops) WHERE is_deleted = false",
+    ),
+    ("ix_authors_name_trgm", "authors USING gin (f_unaccent(lower(name)) gin_trgm_ops)"),
+]
+
+BACKFILL = text(
+    """
+    UPDATE materials
+    SET search_vector = materials_search_vector(title, author_id)
+    WHERE id IN (
+        SELECT id FROM materials WHERE search_vector IS NULL LIMIT :batch_size
+    )
+    """
+)
+
+
+def upgrade(connection):
+    for statement in SETUP_STATEMENTS:
+        connection.execute(text(statement))
+
+    # Cada lote se confirma por separado (AUTOCOMMIT) para no bloquear la tabla
+    while True:
+        updated = connection.execute(BACKFILL, {"batch_size": BACKFILL_BATCH_SIZE}).rowcount
+        if not updated:
+            break
+        print(f"   search_vector: {updated} materiales actualizados")
+
+    names = [name for name, _ in INDEXES]
+    invalid = connection.execute(
+        text(
+            """
+            SELECT c.relname
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE NOT i.indisvalid AND c.relname = ANY(:names)
+            """
+        ),
+        {"names": names},
+    ).scalars().all()
+    for name in invalid:
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+    for name, definition in INDEXES:
+        connection.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}"))
+
+    connection.execute(text("ANALYZE materials"))
+    connection.execute(text("ANALYZE authors"))
@@ -0,0 +1,64 @@
+"""
+Contador de cambios por tabla para los ETag de las respuestas del catálogo.
+
+La tabla `table_versions` guarda una versión por tabla que un trigger por sentencia
+incrementa en cada INSERT, UPDATE, DELETE o TRUNCATE (también COPY). Los endpoints
+calculan el ETag a partir de estas versiones sin leer las filas de la respuesta
+(common/etag.py).
+"""
+
+from sqlalchemy import text
+
+description = "Versiones por tabla para ETag"
+
+TRACKED_TABLES = ["materials", "authors", "material_types", "loan_status"]
+
+
+def upgrade(connection):
+    connection.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS table_versions (
+                table_name VARCHAR(63) PRIMARY KEY,
+                version BIGINT NOT NULL,
+                updated_at TIMESTAMP NOT NULL DEFAULT (now() at time zone 'utc')
+            )
+            """
+        )
+    )
+    connection.execute(
+        text(
+            """
+            CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger
+            LANGUAGE plpgsql
+            AS $$
+            BEGIN
+                INSERT INTO table_versions (table_name, version, updated_at)
+                VALUES (TG_TABLE_NAME, 1, now() at time zone 'utc')
+                ON CONFLICT (table_name) DO UPDATE
+                    SET version = table_versions.version + 1,
+                        updated_at = EXCLUDED.updated_at;
+                RETURN NULL;
+            END
+            $$
+            """
+        )
+    )
+    for table in TRACKED_TABLES:
+        connection.execute(
+            text(
+                "INSERT INTO table_versions (table_name, version) VALUES (:table, 1) "
+                "ON CONFLICT (table_name) DO NOTHING"
+            ),
+            {"table": table},
+        )
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {table}_bump_version ON {table}"))
+        connection.execute(
+            text(
+                f"""
+                CREATE TRIGGER {table}_bump_version
+                AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+                """
+            )
+        )
@@ -0,0 +1,81 @@
+"""
+Disponibilidad desnormalizada en materials.
+
+`is_available` y `active_loan_id` (el préstamo abierto) se actualizan en la misma
+transacción que crea o devuelve el préstamo, con la fila del material bloqueada
+(endpoints/loans). Saber si un material está en estantería deja de requerir una
+consulta a `loans`, y el filtro `available` del catálogo usa índices parciales sobre
+los materiales disponibles.
+
+active_loan_id no lleva clave foránea: la clave primaria de loans es (id, loan_date)
+por el particionado (migración 0003).
+
+ADD COLUMN con un DEFAULT constante no reescribe la tabla. Los índices se construyen
+con CREATE INDEX CONCURRENTLY, fuera de una transacción.
+"""
+
+from sqlalchemy import text
+
+description = "Disponibilidad desnormalizada de materiales"
+
+transactional = False
+
+"""
+Recalcula la disponibilidad a partir de los préstamos abiertos. La usan esta
+migración y scripts.generate_dataset después de cargar préstamos con COPY.
+"""
+SYNC_AVAILABILITY = text(
+    """
+    UPDATE materials m
+    SET is_available = open_loan.id IS NULL,
+        active_loan_id = open_loan.id
+    FROM materials target
+    LEFT JOIN LATERAL (
+        SELECT l.id FROM loans l
+        WHERE l.material_id = target.id AND l.actual_return_date IS NULL
+        ORDER BY l.loan_date DESC
+        LIMIT 1
+    ) open_loan ON true
+    WHERE m.id = target.id
+      AND (m.is_available IS DISTINCT FROM (open_loan.id IS NULL)
+           OR m.active_loan_id IS DISTINCT FROM open_loan.id)
+    """
+)
+
+INDEXES = {
+    "ix_materials_available_title": (
+        "ON materials (title, id) WHERE is_deleted = false AND is_available = true"
+    ),
+    "ix_materials_available_date_added": (
+        "ON materials (date_added, id) WHERE is_deleted = false AND is_available = true"
+    ),
+}
+
+
+def upgrade(connection):
+    connection.execute(
+        text(
+            "ALTER TABLE materials "
+            "ADD COLUMN IF NOT EXISTS is_available BOOLEAN NOT NULL DEFAULT true, "
+            "ADD COLUMN IF NOT EXISTS active_loan_id UUID"
+        )
+    )
+    connection.execute(SYNC_AVAILABILITY)
+
+    for name, definition in INDEXES.items():
+        # Un CREATE INDEX CONCURRENTLY interrumpido deja un índice INVALID
+        invalid = connection.scalar(
+            text(
+                """
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                    WHERE NOT i.indisvalid AND c.relname = :name
+                )
+                """
+            ),
+            {"name": name},
+        )
+        if invalid:
+            connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+        connection.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}"))
+    connection.execute(text("ANALYZE materials"))
@@ -0,0 +1,82 @@
+"""
+Índices para listar préstamos paginados por cursor (keyset) con filtros.
+
+- (loan_date, id): listado general, del más reciente al más antiguo
+- (user_id, loan_date, id) INCLUDE (material_id, status_id, expected_return_date,
+  actual_return_date): historial de un usuario; incluye las columnas del resumen del
+  préstamo. Reemplaza a ix_loans_user_id.
+- (material_id, loan_date, id): historial de un material. Reemplaza a ix_loans_material_id.
+- (status_id, loan_date, id): filtro por estado (por ejemplo, vencidos)
+- (expected_return_date, id): orden y rangos por fecha de devolución esperada
+
+loans está particionada y PostgreSQL no admite CREATE INDEX CONCURRENTLY sobre la
+tabla particionada. Cada índice se crea primero solo en la tabla padre (ON ONLY, queda
+inválido), luego con CONCURRENTLY en cada partición y se adjunta; al adjuntar la
+última partición el índice padre pasa a ser válido y las particiones nuevas lo
+heredan. La migración es idempotente y corre fuera de una transacción.
+"""
+
+from sqlalchemy import text
+
+from database.partitions import LOANS_TABLE, list_partitions
+
+description = "Índices de paginación y filtros del listado de préstamos"
+
+transactional = False
+
+INDEXES = [
+    ("ix_loans_loan_date", "(loan_date, id)"),
+    (
+        "ix_loans_user_history",
+        "(user_id, loan_date, id) "
+        "INCLUDE (material_id, status_id, expected_return_date, actual_return_date)",
+    ),
+    ("ix_loans_material_history", "(material_id, loan_date, id)"),
+    ("ix_loans_status_loan_date", "(status_id, loan_date, id)"),
+    ("ix_loans_expected_return", "(expected_return_date, id)"),
+]
+
+# Prefijos de los índices anteriores cubiertos por los nuevos
+REPLACED_INDEXES = ["ix_loans_user_id", "ix_loans_material_id"]
+
+
+def _partition_index_name(partition: str, name: str) -> str:
+    return f"{partition}_{name[len('ix_loans_'):]}_idx"
+
+
+def _is_invalid(connection, name: str) -> bool:
+    return connection.scalar(
+        text(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE NOT i.indisvalid AND c.relname = :name
+            )
+            """
+        ),
+        {"name": name},
+    )
+
+
+def upgrade(connection):
+    for name, definition in INDEXES:
+        connection.execute(
+            text(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY {LOANS_TABLE} {definition}")
+        )
+        for partition in list_partitions(connection):
+            child = _partition_index_name(partition["name"], name)
+            # Un CREATE INDEX CONCURRENTLY interrumpido deja un índice INVALID
+            if _is_invalid(connection, child):
+                connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {child}"))
+            connection.execute(
+                text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} "
+                    f"ON {partition['name']} {definition}"
+                )
+            )
+            # Adjuntar un índice ya adjuntado al mismo padre no hace nada
+            connection.execute(text(f"ALTER INDEX {name} ATTACH PARTITION {child}"))
+
+    for name in REPLACED_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    connection.execute(text(f"ANALYZE {LOANS_TABLE}"))
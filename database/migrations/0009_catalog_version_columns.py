@@ -0,0 +1,48 @@
+"""
+La versión de `materials` en `table_versions` deja de cambiar con los préstamos.
+
+El trigger de la migración 0006 incrementaba la versión en cualquier UPDATE de
+`materials`, incluidos los que hacen los préstamos y devoluciones sobre
+`is_available` y `active_loan_id` (migración 0007). Como la versión es una sola fila,
+todas las escrituras de préstamos se serializaban en su bloqueo hasta el commit, y
+cada préstamo cambiaba el ETag del catálogo.
+
+El trigger se reemplaza por dos triggers por sentencia: uno para INSERT, DELETE y
+TRUNCATE, y otro `AFTER UPDATE OF` las columnas que exponen las respuestas del
+catálogo. Un UPDATE que solo asigna columnas de disponibilidad no lo dispara.
+"""
+
+from sqlalchemy import text
+
+description = "Versión del catálogo sin las columnas de disponibilidad"
+
+# Columnas de materials que exponen las respuestas con ETag; no incluye is_available,
+# active_loan_id (préstamos), updated_at (los préstamos la dejan igual) ni search_vector
+CATALOG_COLUMNS = (
+    "title", "author_id", "type_id", "is_deleted", "date_added", "created_by", "updated_by",
+)
+
+
+def upgrade(connection):
+    connection.execute(text("DROP TRIGGER IF EXISTS materials_bump_version ON materials"))
+    connection.execute(
+        text("DROP TRIGGER IF EXISTS materials_bump_version_update ON materials")
+    )
+    connection.execute(
+        text(
+            """
+            CREATE TRIGGER materials_bump_version
+            AFTER INSERT OR DELETE OR TRUNCATE ON materials
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+            """
+        )
+    )
+    connection.execute(
+        text(
+            f"""
+            CREATE TRIGGER materials_bump_version_update
+            AFTER UPDATE OF {", ".join(CATALOG_COLUMNS)} ON materials
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+            """
+        )
+    )
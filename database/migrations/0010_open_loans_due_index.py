@@ -0,0 +1,66 @@
+"""
+Índice parcial de préstamos abiertos por (expected_return_date, id).
+
+El barrido de vencidos (database/overdue.py) ordena y continúa cada bloque por
+(expected_return_date, id), pero ix_loans_open_expected_return (migración 0002) solo
+cubre expected_return_date: PostgreSQL tenía que ordenar los empates por id en cada
+bloque. ix_loans_open_due incluye id en la clave y lo reemplaza.
+
+Como en la migración 0008, loans está particionada: el índice se crea ON ONLY en la
+tabla padre, con CONCURRENTLY en cada partición y se adjunta. El índice anterior se
+elimina al final (DROP INDEX de un índice particionado no admite CONCURRENTLY, pero
+solo borra archivos). La migración es idempotente y corre fuera de una transacción.
+"""
+
+from sqlalchemy import text
+
+from database.partitions import LOANS_TABLE, list_partitions
+
+description = "Índice de préstamos abiertos por (expected_return_date, id)"
+
+transactional = False
+
+INDEX_NAME = "ix_loans_open_due"
+INDEX_DEFINITION = "(expected_return_date, id) WHERE actual_return_date IS NULL"
+
+REPLACED_INDEX = "ix_loans_open_expected_return"
+
+
+def _partition_index_name(partition: str) -> str:
+    return f"{partition}_open_due_idx"
+
+
+def _is_invalid(connection, name: str) -> bool:
+    return connection.scalar(
+        text(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE NOT i.indisvalid AND c.relname = :name
+            )
+            """
+        ),
+        {"name": name},
+    )
+
+
+def upgrade(connection):
+    connection.execute(
+        text(f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON ONLY {LOANS_TABLE} {INDEX_DEFINITION}")
+    )
+    for partition in list_partitions(connection):
+        child = _partition_index_name(partition["name"])
+        # Un CREATE INDEX CONCURRENTLY interrumpido deja un índice INVALID
+        if _is_invalid(connection, child):
+            connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {child}"))
+        connection.execute(
+            text(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} "
+                f"ON {partition['name']} {INDEX_DEFINITION}"
+            )
+        )
+        # Adjuntar un índice ya adjuntado al mismo padre no hace nada
+        connection.execute(text(f"ALTER INDEX {INDEX_NAME} ATTACH PARTITION {child}"))
+
+    connection.execute(text(f"DROP INDEX IF EXISTS {REPLACED_INDEX}"))
+    connection.execute(text(f"ANALYZE {LOANS_TABLE}"))
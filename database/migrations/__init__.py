@@ -0,0 +1,179 @@
+"""
+Migraciones versionadas del esquema de base de datos.
+
+Cada migración es un módulo `NNNN_descripcion.py` dentro de este paquete con:
+- `description` (str): Descripción corta de la migración
+- `upgrade(connection)`: Aplica los cambios usando una Connection síncrona
+- `transactional` (bool, opcional): False para migraciones que no pueden correr
+  dentro de una transacción (por ejemplo CREATE INDEX CONCURRENTLY); estas deben
+  ser idempotentes, ya que la versión se registra después de aplicarlas
+
+Las versiones aplicadas se registran en la tabla `schema_version`. Al iniciar la API
+solo se compara la versión registrada con la última disponible; las migraciones se
+aplican explícitamente con `python -m database.migrations upgrade`.
+
+Funciones:
+    discover_migrations: Lista las migraciones disponibles ordenadas por versión
+    head_version: Última versión disponible
+    current_version: Versión registrada en la base de datos
+    upgrade: Aplica las migraciones pendientes
+"""
+
+import importlib
+import pkgutil
+import re
+from collections import namedtuple
+from typing import List, Optional
+
+from sqlalchemy import text
+
+SCHEMA_VERSION_TABLE = "schema_version"
+
+# Clave del advisory lock que evita que dos procesos migren a la vez
+MIGRATION_LOCK_KEY = 727_001
+
+_MODULE_PATTERN = re.compile(r"^(\d{4})_\w+$")
+
+Migration = namedtuple("Migration", ["version", "name"])
+
+
+def discover_migrations() -> List[Migration]:
+    """
+    Lista las migraciones disponibles a partir de los nombres de módulo.
+
+    Returns:
+        List[Migration]: Migraciones ordenadas por versión.
+    """
+    migrations = []
+    for module_info in pkgutil.iter_modules(__path__):
+        match = _MODULE_PATTERN.match(module_info.name)
+        if match:
+            migrations.append(Migration(int(match.group(1)), module_info.name))
+    return sorted(migrations)
+
+
+def head_version() -> int:
+    migrations = discover_migrations()
+    return migrations[-1].version if migrations else 0
+
+
+def current_version(connection) -> int:
+    """
+    Obtiene la versión registrada en la base de datos.
+
+    Args:
+        connection: Connection síncrona de SQLAlchemy.
+
+    Returns:
+        int: Última versión aplicada, 0 si la tabla schema_version no existe.
+    """
+    exists = connection.scalar(
+        text("SELECT to_regclass(:table)"), {"table": SCHEMA_VERSION_TABLE}
+    )
+    if exists is None:
+        return 0
+    return connection.scalar(
+        text(f"SELECT COALESCE(MAX(version), 0) FROM {SCHEMA_VERSION_TABLE}")
+    )
+
+
+def _ensure_version_table(connection):
+    connection.execute(
+        text(
+            f"""
+            CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (
+                version INTEGER PRIMARY KEY,
+                description VARCHAR(200) NOT NULL,
+                applied_at TIMESTAMP NOT NULL DEFAULT (now() at time zone 'utc')
+            )
+            """
+        )
+    )
+
+
+def _record_version(connection, version: int, description: str):
+    connection.execute(
+        text(
+            f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, description) "
+            "VALUES (:version, :description)"
+        ),
+        {"version": version, "description": description},
+    )
+
+
+def upgrade(engine, target: Optional[int] = None) -> List[int]:
+    """
+    Aplica en orden las migraciones pendientes hasta `target` (o la última).
+
+    Args:
+        engine: Engine síncrono de SQLAlchemy.
+        target (Optional[int]): Versión máxima a aplicar.
+
+    Returns:
+        List[int]: Versiones aplicadas en esta ejecución.
+    """
+    applied = []
+    with engine.connect() as lock_connection:
+        lock_connection.execute(
+            text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+        )
+        lock_connection.commit()
+        try:
+            with engine.begin() as connection:
+                _ensure_version_table(connection)
+                version = current_version(connection)
+
+            for migration in discover_migrations():
+                if migration.version <= version:
+                    continue
+                if target is not None and migration.version > target:
+                    break
+
+                module = importlib.import_module(f"{__name__}.{migration.name}")
+                print(f"🔄 Aplicando migración {migration.version}: {module.description}")
+
+                if getattr(module, "transactional", True):
+                    with engine.begin() as connection:
+                        module.upgrade(connection)
+                        _record_version(connection, migration.version, module.description)
+                else:
+                    with engine.connect().execution_options(
+                        isolation_level="AUTOCOMMIT"
+                    ) as connection:
+                        module.upgrade(connection)
+                    with engine.begin() as connection:
+                        _record_version(connection, migration.version, module.description)
+
+                applied.append(migration.version)
+        finally:
+            lock_connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY}
+            )
+            lock_connection.commit()
+
+    return applied
+
+
+async def check_schema_version(async_engine) -> bool:
+    """
+    Compara la versión registrada con la última migración disponible.
+    Es la única verificación de esquema que se hace al iniciar la API.
+
+    Args:
+        async_engine: AsyncEngine de SQLAlchemy.
+
+    Returns:
+        bool: True si el esquema está al día.
+    """
+    async with async_engine.connect() as connection:
+        version = await connection.run_sync(current_version)
+    head = head_version()
+    if version < head:
+        print(
+            f"⚠️ Esquema en versión {version}, se esperaba {head}. "
+            "Ejecuta `python -m database.migrations upgrade`."
+        )
+        return False
+    if version > head:
+        print(f"⚠️ Esquema en versión {version}, más reciente que el código ({head}).")
+    return True
@@ -0,0 +1,49 @@
+"""
+CLI de migraciones.
+
+Uso:
+    python -m database.migrations upgrade [--target N] [--seed]
+    python -m database.migrations current
+    python -m database.migrations seed
+"""
+
+import argparse
+
+from database.connection import engine
+from database.migrations import current_version, head_version, upgrade
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m database.migrations")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    upgrade_parser = subparsers.add_parser("upgrade", help="Aplica las migraciones pendientes")
+    upgrade_parser.add_argument("--target", type=int, default=None, help="Versión máxima a aplicar")
+    upgrade_parser.add_argument("--seed", action="store_true", help="Inserta los datos de ejemplo al terminar")
+
+    subparsers.add_parser("current", help="Muestra la versión actual del esquema")
+    subparsers.add_parser("seed", help="Inserta los datos de ejemplo")
+
+    args = parser.parse_args()
+
+    if args.command == "upgrade":
+        applied = upgrade(engine, target=args.target)
+        if applied:
+            print(f"✅ Migraciones aplicadas: {', '.join(str(v) for v in applied)}")
+        else:
+            print("✅ El esquema ya estaba al día.")
+        if args.seed:
+            from database.seed import seed_database
+
+            seed_database()
+    elif args.command == "current":
+        with engine.connect() as connection:
+            print(f"Versión actual: {current_version(connection)} (última disponible: {head_version()})")
+    elif args.command == "seed":
+        from database.seed import seed_database
+
+        seed_database()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+Marcado periódico de préstamos vencidos.
+
+Un préstamo abierto (actual_return_date IS NULL) cuya expected_return_date ya pasó
+cambia al estado `overdue`. El barrido recorre el índice parcial de préstamos abiertos
+por vencimiento (ix_loans_open_due) en orden (expected_return_date, id) y
+actualiza bloques de OVERDUE_SWEEP_BATCH_SIZE filas con una sola sentencia por bloque,
+cada una en su propia transacción corta:
+
+- Las filas se toman con FOR UPDATE SKIP LOCKED: las que una devolución o edición
+  tiene bloqueadas se saltan en lugar de esperar, y ninguna petición espera al
+  barrido más de lo que dura un bloque.
+- Cada bloque continúa desde la última clave del anterior (keyset), así que un barrido
+  lee cada entrada del índice una sola vez.
+- El primer barrido de cada proceso, y uno cada OVERDUE_SWEEP_FULL_INTERVAL segundos,
+  recorre todos los préstamos abiertos vencidos. Los demás solo recorren los
+  vencimientos desde el barrido anterior (con un intervalo de margen), de modo que su
+  costo no depende de cuántos préstamos vencidos siguen abiertos. Los barridos
+  completos recogen las filas saltadas o cuya fecha se editó hacia atrás.
+- Un advisory lock evita que varios workers barran a la vez.
+
+El barrido no toca `materials`, así que no compite por bloqueos con los préstamos
+nuevos.
+
+Uso:
+    python -m database.overdue [--full] [--batch-size 5000]
+
+Funciones:
+    sweep_overdue_loans: Ejecuta un barrido por bloques hasta la fecha actual
+    run_overdue_sweeper: Bucle asíncrono que ejecuta los barridos (tarea de inicio)
+    get_overdue_stats: Métricas de los barridos de este proceso
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import text
+
+from config import settings
+
+# Clave del advisory lock que evita que dos procesos barran a la vez
+OVERDUE_LOCK_KEY = 727_003
+
+OVERDUE_STATUS_ID = text("SELECT id FROM loan_status WHERE name = 'overdue'")
+
+_SWEEP_BATCH = """
+    WITH batch AS (
+        SELECT id, loan_date, expected_return_date
+        FROM loans
+        WHERE actual_return_date IS NULL
+          AND expected_return_date < :now
+          {since}
+          {after}
+          AND status_id <> :overdue_status_id
+        ORDER BY expected_return_date, id
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    ), updated AS (
+        UPDATE loans l
+        SET status_id = :overdue_status_id, updated_at = :now
+        FROM batch b
+        WHERE l.id = b.id AND l.loan_date = b.loan_date
+        RETURNING l.id
+    ), last_row AS (
+        SELECT expected_return_date, id FROM batch
+        ORDER BY expected_return_date DESC, id DESC
+        LIMIT 1
+    )
+    SELECT (SELECT count(*) FROM updated) AS updated,
+           last_row.expected_return_date AS last_date,
+           last_row.id AS last_id
+    FROM last_row
+"""
+
+_stats: Dict = {
+    "sweeps": 0,
+    "skipped": 0,
+    "total_updated": 0,
+    "last_full": None,
+    "last_started_at": None,
+    "last_duration_seconds": None,
+    "last_updated": None,
+    "last_batches": None,
+    "last_rows_per_second": None,
+    "last_error": None,
+}
+
+
+def _sweep_statement(since: bool, after: bool):
+    return text(
+        _SWEEP_BATCH.format(
+            since="AND expected_return_date >= :since" if since else "",
+            after="AND (expected_return_date, id) > (:after_date, :after_id)" if after else "",
+        )
+    )
+
+
+async def sweep_overdue_loans(
+    async_engine, since: Optional[datetime] = None, batch_size: Optional[int] = None
+) -> Optional[Dict]:
+    """
+    Marca como vencidos los préstamos abiertos con vencimiento anterior a ahora.
+
+    Args:
+        async_engine: AsyncEngine del primario.
+        since (Optional[datetime]): Solo vencimientos desde esta fecha (UTC sin zona);
+            None recorre todos los préstamos abiertos.
+        batch_size (Optional[int]): Filas por bloque (por defecto OVERDUE_SWEEP_BATCH_SIZE).
+
+    Returns:
+        Optional[Dict]: Fecha de corte, filas actualizadas, bloques y duración; None si
+        otro proceso está barriendo.
+    """
+    batch_size = batch_size or settings.OVERDUE_SWEEP_BATCH_SIZE
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    start = time.perf_counter()
+
+    async with async_engine.connect() as connection:
+        locked = await connection.scalar(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": OVERDUE_LOCK_KEY}
+        )
+        await connection.commit()
+        if not locked:
+            return None
+
+        try:
+            overdue_status_id = await connection.scalar(OVERDUE_STATUS_ID)
+            await connection.commit()
+            if overdue_status_id is None:
+                raise RuntimeError("No existe el estado de préstamo 'overdue'")
+
+            updated = 0
+            batches = 0
+            after = None
+            while True:
+                params = {
+                    "now": now,
+                    "overdue_status_id": overdue_status_id,
+                    "batch_size": batch_size,
+                }
+                if since is not None:
+                    params["since"] = since
+                if after is not None:
+                    params["after_date"], params["after_id"] = after
+
+                row = (
+                    await connection.execute(
+                        _sweep_statement(since is not None, after is not None), params
+                    )
+                ).first()
+                # Cada bloque en su propia transacción: los bloqueos duran un bloque
+                await connection.commit()
+                if row is None:
+                    break
+                updated += row.updated
+                batches += 1
+                after = (row.last_date, row.last_id)
+                # Deja pasar a las peticiones entre bloques
+                await asyncio.sleep(0)
+        finally:
+            await connection.rollback()
+            await connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": OVERDUE_LOCK_KEY}
+            )
+            await connection.commit()
+
+    return {
+        "now": now,
+        "full": since is None,
+        "updated": updated,
+        "batches": batches,
+        "duration_seconds": time.perf_counter() - start,
+    }
+
+
+async def run_overdue_sweeper(async_engine, interval: float, full_interval: float):
+    """
+    Marca periódicamente los préstamos vencidos. El primer barrido es completo; los
+    siguientes solo recorren los vencimientos desde el anterior, salvo uno completo
+    cada `full_interval` segundos.
+
+    Args:
+        async_engine: AsyncEngine del primario.
+        interval (float): Segundos entre barridos.
+        full_interval (float): Segundos entre barridos completos.
+    """
+    last_now: Optional[datetime] = None
+    last_full: Optional[float] = None
+    while True:
+        full = last_full is None or time.monotonic() - last_full >= full_interval
+        since = None if full else last_now - timedelta(seconds=interval)
+        _stats["last_started_at"] = datetime.now(timezone.utc)
+        try:
+            result = await sweep_overdue_loans(async_engine, since=since)
+            if result is None:
+                _stats["skipped"] += 1
+            else:
+                last_now = result["now"]
+                if result["full"]:
+                    last_full = time.monotonic()
+                duration = result["duration_seconds"]
+                _stats.update(
+                    sweeps=_stats["sweeps"] + 1,
+                    total_updated=_stats["total_updated"] + result["updated"],
+                    last_full=result["full"],
+                    last_duration_seconds=round(duration, 3),
+                    last_updated=result["updated"],
+                    last_batches=result["batches"],
+                    last_rows_per_second=round(result["updated"] / duration, 1) if duration else None,
+                    last_error=None,
+                )
+                if result["updated"]:
+                    print(
+                        f"⏰ Préstamos vencidos: {result['updated']} marcados en "
+                        f"{result['batches']} bloques ({duration:.2f} s)"
+                    )
+        except Exception as e:
+            _stats["last_error"] = str(e)
+            print(f"⚠️ Error al marcar préstamos vencidos: {e}")
+        await asyncio.sleep(interval)
+
+
+def get_overdue_stats() -> Dict:
+    """
+    Devuelve las métricas de los barridos de este proceso.
+
+    Returns:
+        Dict: Barridos realizados y omitidos (otro proceso tenía el lock), filas
+        marcadas en total y, del último barrido, tipo, duración, filas, bloques,
+        filas por segundo y error.
+    """
+    return {"enabled": settings.OVERDUE_SWEEP_ENABLED, **_stats}
+
+
+async def _main(args):
+    from database.connection import async_engine
+
+    result = await sweep_overdue_loans(
+        async_engine,
+        since=None if args.full else datetime.now(timezone.utc).replace(tzinfo=None)
+        - timedelta(seconds=settings.OVERDUE_SWEEP_FULL_INTERVAL),
+        batch_size=args.batch_size,
+    )
+    await async_engine.dispose()
+    if result is None:
+        print("⚠️ Otro proceso está marcando préstamos vencidos; intenta más tarde.")
+        return
+    print(
+        f"✅ {result['updated']} préstamos marcados como vencidos en {result['batches']} "
+        f"bloques ({result['duration_seconds']:.2f} s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m database.overdue")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Recorre todos los préstamos abiertos (por defecto, los vencidos en OVERDUE_SWEEP_FULL_INTERVAL)",
+    )
+    parser.add_argument("--batch-size", type=int, default=None, help="Filas por bloque")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+Mantenimiento de las particiones mensuales de la tabla loans.
+
+La tabla loans está particionada por rango de `loan_date` (migración 0003), con una
+partición por mes (`loans_pAAAAMM`) y una partición DEFAULT que recibe las filas de
+meses sin partición.
+
+Este módulo proporciona:
+- Creación de las particiones de los próximos meses (al iniciar la API y periódicamente,
+  en un solo worker a la vez)
+- Traslado de filas desde DEFAULT cuando se crea la partición de su mes (solo desde la CLI)
+- Desacople (DETACH) de particiones antiguas hacia un esquema de archivo y,
+  opcionalmente, otro tablespace más económico
+
+Uso:
+    python -m database.partitions ensure [--from 2020-01-01] [--months-ahead 3]
+    python -m database.partitions detach --before 2023-01-01 [--schema archive] [--tablespace frio]
+    python -m database.partitions list
+
+Funciones:
+    ensure_loan_partitions: Crea las particiones faltantes hasta N meses adelante
+    detach_partitions_before: Desacopla y archiva las particiones anteriores a una fecha
+    list_partitions: Particiones actuales con su rango
+    run_partition_maintenance: Bucle asíncrono que crea las particiones futuras vacías
+"""
+
+import argparse
+import asyncio
+import re
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import text
+
+from config import settings
+
+LOANS_TABLE = "loans"
+DEFAULT_PARTITION = "loans_default"
+
+# Clave del advisory lock que evita que dos procesos creen particiones a la vez
+PARTITION_LOCK_KEY = 727_002
+
+# Espera máxima por los locks de loans en el mantenimiento de fondo: si hay consultas
+# largas en curso se reintenta en el siguiente ciclo en lugar de encolar a las demás
+MAINTENANCE_LOCK_TIMEOUT = "2s"
+
+_PARTITION_NAME = re.compile(r"^loans_p(\d{4})(\d{2})$")
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def month_start(value) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"loans_p{month:%Y%m}"
+
+
+def _identifier(value: str) -> str:
+    if not _IDENTIFIER.match(value):
+        raise ValueError(f"Identificador no válido: {value!r}")
+    return value
+
+
+def is_partitioned(connection) -> bool:
+    relkind = connection.scalar(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": LOANS_TABLE},
+    )
+    return relkind == "p"
+
+
+def list_partitions(connection) -> List[dict]:
+    """
+    Lista las particiones de loans con su definición de rango.
+
+    Returns:
+        List[dict]: name y bound (por ejemplo "FOR VALUES FROM (...) TO (...)" o "DEFAULT").
+    """
+    rows = connection.execute(
+        text(
+            """
+            SELECT c.relname AS name, pg_get_expr(c.relpartbound, c.oid) AS bound
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(:table)
+            ORDER BY c.relname
+            """
+        ),
+        {"table": LOANS_TABLE},
+    ).mappings()
+    return [dict(row) for row in rows]
+
+
+def create_partition(connection, month: date, move_default_rows: bool = True) -> bool:
+    """
+    Crea la partición de un mes. Si la partición DEFAULT ya tiene filas de ese mes,
+    se desacopla, se trasladan las filas a la nueva partición y se vuelve a acoplar;
+    de lo contrario PostgreSQL rechazaría la nueva partición.
+
+    Args:
+        connection: Connection síncrona dentro de una transacción.
+        month (date): Primer día del mes.
+        move_default_rows (bool): Si es False y DEFAULT tiene filas del mes, no crea la
+            partición: el traslado toma un lock ACCESS EXCLUSIVE sobre loans_default
+            durante toda la copia.
+
+    Returns:
+        bool: True si la partición se creó.
+    """
+    name = partition_name(month)
+    start, end = month.isoformat(), add_months(month, 1).isoformat()
+    bounds = {"start": start, "end": end}
+    pending = connection.scalar(
+        text(
+            f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+            "WHERE loan_date >= CAST(:start AS timestamp) AND loan_date < CAST(:end AS timestamp))"
+        ),
+        bounds,
+    )
+
+    if not pending:
+        connection.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {LOANS_TABLE} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+        )
+        return True
+    if not move_default_rows:
+        return False
+
+    connection.execute(text(f"ALTER TABLE {LOANS_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+    connection.execute(
+        text(
+            f"CREATE TABLE {name} PARTITION OF {LOANS_TABLE} "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+    )
+    connection.execute(
+        text(
+            f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} "
+            "WHERE loan_date >= CAST(:start AS timestamp) AND loan_date < CAST(:end AS timestamp)"
+        ),
+        bounds,
+    )
+    connection.execute(
+        text(
+            f"DELETE FROM {DEFAULT_PARTITION} "
+            "WHERE loan_date >= CAST(:start AS timestamp) AND loan_date < CAST(:end AS timestamp)"
+        ),
+        bounds,
+    )
+    connection.execute(
+        text(f"ALTER TABLE {LOANS_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+    )
+    return True
+
+
+def ensure_loan_partitions(
+    connection,
+    months_ahead: Optional[int] = None,
+    start: Optional[date] = None,
+    move_default_rows: bool = True,
+) -> List[str]:
+    """
+    Crea las particiones mensuales que falten desde `start` (por defecto el mes actual)
+    hasta `months_ahead` meses después del mes actual. No hace nada si loans aún no
+    está particionada.
+
+    Args:
+        connection: Connection síncrona dentro de una transacción.
+        months_ahead (Optional[int]): Meses futuros a cubrir (LOANS_PARTITION_MONTHS_AHEAD).
+        start (Optional[date]): Primer mes a cubrir, por ejemplo el préstamo más antiguo.
+        move_default_rows (bool): Si es False se omiten los meses con filas en DEFAULT
+            (ver create_partition).
+
+    Returns:
+        List[str]: Nombres de las particiones creadas.
+    """
+    if not is_partitioned(connection):
+        return []
+    if months_ahead is None:
+        months_ahead = settings.LOANS_PARTITION_MONTHS_AHEAD
+
+    connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+    existing = {partition["name"] for partition in list_partitions(connection)}
+
+    current = month_start(datetime.now(timezone.utc))
+    month = month_start(start) if start is not None else current
+    last = add_months(current, months_ahead)
+
+    created = []
+    while month <= last:
+        name = partition_name(month)
+        if name not in existing:
+            if create_partition(connection, month, move_default_rows):
+                created.append(name)
+            else:
+                print(
+                    f"⚠️ {DEFAULT_PARTITION} tiene préstamos de {month:%Y-%m}; "
+                    "ejecuta python -m database.partitions ensure para trasladarlos."
+                )
+        month = add_months(month, 1)
+    return created
+
+
+def detach_partitions_before(
+    connection,
+    before: date,
+    schema: Optional[str] = None,
+    tablespace: Optional[str] = None,
+) -> List[str]:
+    """
+    Desacopla las particiones cuyo mes termina antes de `before` y las mueve al esquema
+    de archivo (y al tablespace indicado). Los préstamos de esas particiones dejan de ser
+    visibles para la API. Se omiten las particiones con préstamos abiertos.
+
+    Args:
+        connection: Connection síncrona dentro de una transacción.
+        before (date): Fecha de corte.
+        schema (Optional[str]): Esquema de archivo (LOANS_ARCHIVE_SCHEMA).
+        tablespace (Optional[str]): Tablespace de destino (LOANS_ARCHIVE_TABLESPACE).
+
+    Returns:
+        List[str]: Particiones desacopladas.
+    """
+    schema = _identifier(schema or settings.LOANS_ARCHIVE_SCHEMA)
+    tablespace = tablespace or settings.LOANS_ARCHIVE_TABLESPACE
+    if tablespace:
+        tablespace = _identifier(tablespace)
+
+    detached = []
+    for partition in list_partitions(connection):
+        match = _PARTITION_NAME.match(partition["name"])
+        if not match:
+            continue
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        if add_months(month, 1) > before:
+            continue
+
+        name = partition["name"]
+        has_open_loans = connection.scalar(
+            text(f"SELECT EXISTS (SELECT 1 FROM {name} WHERE actual_return_date IS NULL)")
+        )
+        if has_open_loans:
+            print(f"⚠️ {name} tiene préstamos abiertos; no se desacopla.")
+            continue
+
+        connection.execute(text(f"ALTER TABLE {LOANS_TABLE} DETACH PARTITION {name}"))
+        connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        connection.execute(text(f"ALTER TABLE {name} SET SCHEMA {schema}"))
+        if tablespace:
+            connection.execute(text(f"ALTER TABLE {schema}.{name} SET TABLESPACE {tablespace}"))
+        detached.append(name)
+    return detached
+
+
+def _ensure_future_partitions(connection) -> Optional[List[str]]:
+    locked = connection.scalar(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY}
+    )
+    if not locked:
+        return None
+    connection.execute(text(f"SET LOCAL lock_timeout = '{MAINTENANCE_LOCK_TIMEOUT}'"))
+    return ensure_loan_partitions(connection, move_default_rows=False)
+
+
+async def run_partition_maintenance(async_engine, interval: float):
+    """
+    Crea periódicamente las particiones de los próximos meses para que los préstamos
+    nuevos nunca caigan en la partición DEFAULT.
+
+    Solo el worker que obtiene el advisory lock ejecuta el DDL en cada ciclo; los demás
+    lo omiten sin esperar. Solo se crean particiones vacías: los meses con filas en
+    DEFAULT quedan para `python -m database.partitions ensure`.
+
+    Args:
+        async_engine: AsyncEngine del primario.
+        interval (float): Segundos entre ejecuciones.
+    """
+    while True:
+        try:
+            async with async_engine.begin() as connection:
+                created = await connection.run_sync(_ensure_future_partitions)
+            if created:
+                print(f"🗂️ Particiones de préstamos creadas: {', '.join(created)}")
+        except Exception as e:
+            print(f"⚠️ Error en el mantenimiento de particiones: {e}")
+        await asyncio.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m database.partitions")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ensure_parser = subparsers.add_parser("ensure", help="Crea las particiones faltantes")
+    ensure_parser.add_argument("--from", dest="start", type=date.fromisoformat, default=None)
+    ensure_parser.add_argument("--months-ahead", type=int, default=None)
+
+    detach_parser = subparsers.add_parser("detach", help="Desacopla particiones antiguas")
+    detach_parser.add_argument("--before", type=date.fromisoformat, required=True)
+    detach_parser.add_argument("--schema", default=None)
+    detach_parser.add_argument("--tablespace", default=None)
+
+    subparsers.add_parser("list", help="Lista las particiones")
+
+    args = parser.parse_args()
+
+    from database.connection import engine
+
+    with engine.begin() as connection:
+        if not is_partitioned(connection):
+            print("⚠️ La tabla loans no está particionada; ejecuta las migraciones primero.")
+            return
+        if args.command == "ensure":
+            created = ensure_loan_partitions(connection, args.months_ahead, args.start)
+            print(f"✅ Particiones creadas: {', '.join(created) or 'ninguna'}")
+        elif args.command == "detach":
+            detached = detach_partitions_before(
+                connection, args.before, args.schema, args.tablespace
+            )
+            print(f"✅ Particiones desacopladas: {', '.join(detached) or 'ninguna'}")
+        else:
+            for partition in list_partitions(connection):
+                print(f"{partition['name']:<20} {partition['bound']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Estadísticas del pool de conexiones de SQLAlchemy.
+
+Este módulo proporciona:
+- Clases de pool instrumentadas que miden el tiempo de espera de cada checkout
+- Contadores de checkouts, conexiones abiertas/cerradas (churn) y timeouts
+- Un registro global de pools para exponer las métricas vía endpoint de administración
+
+Las métricas son por proceso: con varios workers de uvicorn cada uno reporta su propio pool.
+
+Clases:
+    PoolStats: Contadores acumulados de un pool
+    InstrumentedQueuePool: QueuePool síncrono instrumentado
+    InstrumentedAsyncAdaptedQueuePool: Pool para engines asíncronos instrumentado
+
+Funciones:
+    register_pool_stats: Asocia un PoolStats y sus listeners a un engine
+    get_pool_snapshots: Devuelve el estado actual de todos los pools registrados
+"""
+
+import threading
+import time
+from typing import Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolStats:
+    """
+    Contadores acumulados de un pool de conexiones.
+
+    Attributes:
+        name (str): Nombre con el que se reporta el pool (por ejemplo "primary").
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.waits = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def record_wait(self, elapsed: float, timed_out: bool = False):
+        with self._lock:
+            self.waits += 1
+            self.wait_time_total += elapsed
+            self.wait_time_max = max(self.wait_time_max, elapsed)
+            if timed_out:
+                self.timeouts += 1
+
+    def increment(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self, pool) -> dict:
+        """
+        Combina los contadores acumulados con el estado instantáneo del pool.
+
+        Args:
+            pool: Pool de SQLAlchemy asociado a estas estadísticas.
+
+        Returns:
+            dict: Métricas listas para serializar.
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "pool_size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow_in_use": max(pool.overflow(), 0),
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connections_opened": self.connections_opened,
+                "connections_closed": self.connections_closed,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_time_avg_ms": (self.wait_time_total / self.waits * 1000)
+                if self.waits
+                else 0.0,
+                "wait_time_max_ms": self.wait_time_max * 1000,
+            }
+
+
+class _InstrumentedPoolMixin:
+    """
+    Mide el tiempo que tarda cada checkout en obtener una conexión, incluyendo
+    la espera por una conexión libre y la apertura de una nueva si hace falta.
+    """
+
+    _stats = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self._stats is not None:
+                self._stats.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        if self._stats is not None:
+            self._stats.record_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() reemplaza el pool; las estadísticas se conservan
+        new_pool = super().recreate()
+        new_pool._stats = self._stats
+        return new_pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+_registry: Dict[str, tuple] = {}
+
+
+def register_pool_stats(name: str, engine) -> PoolStats:
+    """
+    Registra las estadísticas de un engine (síncrono o asíncrono).
+
+    Args:
+        name (str): Nombre con el que se reporta el pool.
+        engine: Engine o AsyncEngine creado con un pool instrumentado.
+
+    Returns:
+        PoolStats: Las estadísticas asociadas al pool.
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    stats = PoolStats(name)
+    sync_engine.pool._stats = stats
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        stats.increment("connections_opened")
+
+    @event.listens_for(sync_engine, "close")
+    def _on_close(dbapi_connection, connection_record):
+        stats.increment("connections_closed")
+
+    @event.listens_for(sync_engine, "close_detached")
+    def _on_close_detached(dbapi_connection):
+        stats.increment("connections_closed")
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        stats.increment("invalidations")
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.increment("checkouts")
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        stats.increment("checkins")
+
+    _registry[name] = (sync_engine, stats)
+    return stats
+
+
+def get_pool_snapshots() -> List[dict]:
+    """
+    Devuelve el estado actual de todos los pools registrados.
+
+    Returns:
+        List[dict]: Una entrada por pool con métricas instantáneas y acumuladas.
+    """
+    return [stats.snapshot(sync_engine.pool) for sync_engine, stats in _registry.values()]
@@ -0,0 +1,207 @@
+"""
+Enrutamiento de lecturas hacia réplicas de PostgreSQL.
+
+Este módulo proporciona:
+- Un engine asíncrono por cada réplica de lectura configurada
+- Medición del retraso de replicación de cada réplica en una tarea de fondo
+- Selección round-robin entre las réplicas sanas cuyo retraso no supera el umbral
+
+`pick` solo consulta el último retraso medido, sin tocar la base de datos en la
+ruta de la petición. Si no hay réplicas configuradas, o ninguna está disponible o
+tiene una medición reciente, devuelve None y el llamador debe usar el primario.
+
+Clases:
+    ReplicaSet: Conjunto de réplicas de lectura con control de retraso
+
+Funciones:
+    to_async_url: Convierte una URL de PostgreSQL (libpq) al driver asyncpg
+"""
+
+import asyncio
+import itertools
+import ssl
+import time
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from database.pool_stats import InstrumentedAsyncAdaptedQueuePool, register_pool_stats
+
+REPLICATION_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+# Parámetros de libpq que asyncpg no acepta como argumentos de conexión
+LIBPQ_ONLY_PARAMS = {
+    "sslmode", "sslrootcert", "sslcert", "sslkey", "sslpassword", "sslcrl", "sslcrldir",
+    "sslcompression", "sslsni", "ssl_min_protocol_version", "ssl_max_protocol_version",
+    "requiressl", "channel_binding", "gssencmode", "gssdelegation", "options",
+    "application_name", "fallback_application_name", "connect_timeout", "client_encoding",
+    "keepalives", "keepalives_idle", "keepalives_interval", "keepalives_count",
+    "tcp_user_timeout", "replication", "service", "load_balance_hosts",
+}
+
+
+def _ssl_argument(query: dict):
+    """
+    Traduce sslmode (y los certificados de libpq) al argumento `ssl` de asyncpg: el
+    modo como texto o, si hay certificados, un SSLContext equivalente.
+    """
+    mode = query.get("sslmode") or ("require" if query.get("requiressl") == "1" else None)
+    root_cert, cert = query.get("sslrootcert"), query.get("sslcert")
+    if mode in (None, "disable", "allow", "prefer") or not (root_cert or cert):
+        return mode
+
+    # Como en libpq, con certificado raíz "require" verifica la CA
+    verify = mode in ("verify-ca", "verify-full") or (mode == "require" and root_cert)
+    context = ssl.create_default_context(cafile=root_cert if verify else None)
+    context.check_hostname = mode == "verify-full"
+    if not verify:
+        context.verify_mode = ssl.CERT_NONE
+    if cert:
+        context.load_cert_chain(cert, query.get("sslkey"), query.get("sslpassword"))
+    return context
+
+
+def to_async_url(url) -> Tuple[URL, dict]:
+    """
+    Convierte una URL de PostgreSQL en libpq al driver asyncpg.
+
+    asyncpg rechaza los parámetros propios de libpq (por ejemplo `sslmode`), así que se
+    quitan de la URL: sslmode y los certificados se traducen al argumento `ssl`,
+    application_name a `server_settings` y connect_timeout a `timeout`.
+
+    Returns:
+        Tuple[URL, dict]: URL con el driver asyncpg y los `connect_args` del engine.
+    """
+    url = make_url(url)
+    query = {key: value for key, value in url.query.items() if isinstance(value, str)}
+    connect_args = {}
+
+    ssl_argument = _ssl_argument(query)
+    if ssl_argument is not None:
+        connect_args["ssl"] = ssl_argument
+    if "application_name" in query:
+        connect_args["server_settings"] = {"application_name": query["application_name"]}
+    if "connect_timeout" in query:
+        connect_args["timeout"] = float(query["connect_timeout"])
+
+    url = url.set(drivername="postgresql+asyncpg").difference_update_query(LIBPQ_ONLY_PARAMS)
+    return url, connect_args
+
+
+class _Replica:
+    def __init__(self, name: str, url: str, engine_options: dict):
+        self.name = name
+        async_url, connect_args = to_async_url(url)
+        self.engine = create_async_engine(
+            async_url,
+            connect_args=connect_args,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            **engine_options,
+        )
+        register_pool_stats(name, self.engine)
+        self.sessionmaker = async_sessionmaker(
+            bind=self.engine, autoflush=False, expire_on_commit=False
+        )
+        self.lag_seconds: Optional[float] = None
+        self.last_checked = 0.0
+        self.last_error: Optional[str] = None
+
+    async def _measure_lag(self) -> float:
+        async with self.engine.connect() as connection:
+            return float(await connection.scalar(REPLICATION_LAG_QUERY))
+
+    async def refresh_lag(self, timeout: float):
+        try:
+            self.lag_seconds = await asyncio.wait_for(self._measure_lag(), timeout)
+            self.last_error = None
+        except Exception as e:
+            self.lag_seconds = None
+            self.last_error = str(e) or type(e).__name__
+        self.last_checked = time.monotonic()
+
+
+class ReplicaSet:
+    """
+    Conjunto de réplicas de lectura.
+
+    Attributes:
+        max_lag_seconds (float): Retraso máximo tolerado antes de excluir una réplica.
+        check_interval (float): Segundos entre mediciones de retraso de cada réplica.
+            Una medición con más de tres intervalos de antigüedad (p. ej. porque la
+            tarea de fondo se detuvo) deja de considerarse válida.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        engine_options: dict,
+        max_lag_seconds: float,
+        check_interval: float,
+    ):
+        self.replicas = [
+            _Replica(f"replica-{i}", url, engine_options) for i, url in enumerate(urls)
+        ]
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._cycle = itertools.cycle(range(len(self.replicas))) if self.replicas else None
+
+    def _healthy(self, replica: _Replica, now: float) -> bool:
+        return (
+            replica.lag_seconds is not None
+            and replica.lag_seconds <= self.max_lag_seconds
+            and now - replica.last_checked <= 3 * self.check_interval
+        )
+
+    def pick(self) -> Optional[async_sessionmaker]:
+        """
+        Selecciona una réplica sana con retraso aceptable según la última medición
+        de `run_lag_monitor`.
+
+        Returns:
+            Optional[async_sessionmaker]: Fábrica de sesiones de la réplica elegida,
+                o None si se debe leer del primario.
+        """
+        now = time.monotonic()
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._cycle)]
+            if self._healthy(replica, now):
+                return replica.sessionmaker
+        return None
+
+    async def run_lag_monitor(self):
+        """
+        Mide el retraso de todas las réplicas en paralelo cada `check_interval`
+        segundos. Pensado para ejecutarse como tarea de fondo desde el arranque.
+        """
+        while True:
+            await asyncio.gather(
+                *(replica.refresh_lag(self.check_interval) for replica in self.replicas)
+            )
+            await asyncio.sleep(self.check_interval)
+
+    def status(self) -> List[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "name": replica.name,
+                "lag_seconds": replica.lag_seconds,
+                "healthy": self._healthy(replica, now),
+                "last_error": replica.last_error,
+            }
+            for replica in self.replicas
+        ]
+
+    async def dispose(self):
+        for replica in self.replicas:
+            await replica.engine.dispose()
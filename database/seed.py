@@ -0,0 +1,185 @@
+from datetime import datetime, timezone
+from database.connection import (
+    SessionLocal,
+    Role,
+    User,
+    Author,
+    MaterialType,
+    Material,
+    LoanStatus,
+    Loan,
+)
+
+
+def seed_database():
+    """
+    Inserta los datos de ejemplo (roles, usuarios, autores, tipos de material,
+    materiales, estados y préstamos) en las tablas que estén vacías.
+    Es un paso explícito y opcional: `python -m database.migrations seed`.
+    """
+    # Configurar el hash de contraseñas
+    from passlib.context import CryptContext
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    
+    with SessionLocal() as db:
+        # Crear roles si no existen
+        if db.query(Role).count() == 0:
+            admin_role = Role(
+                name="admin",
+                description="Administrador del sistema"
+            )
+            client_role = Role(
+                name="cliente",
+                description="Cliente de la biblioteca"
+            )
+            db.add_all([admin_role, client_role])
+            db.commit()
+            print("👥 Roles de ejemplo insertados.")
+        else:
+            admin_role = db.query(Role).filter_by(name="admin").first()
+            client_role = db.query(Role).filter_by(name="cliente").first()
+            print("⚠️ Ya existen roles, no se insertaron de nuevo.")
+
+        # Crear usuarios si no existen
+        if db.query(User).count() == 0:
+            admin = User(
+                email="admin@ejemplo.com",
+                full_name="Administrador",
+                password=pwd_context.hash("admin123"),
+                role_id=admin_role.id,
+            )
+            user1 = User(
+                email="usuario1@ejemplo.com",
+                full_name="Juan Pérez",
+                password=pwd_context.hash("user123"),
+                role_id=client_role.id,
+            )
+            db.add_all([admin, user1])
+            db.commit()
+            print("👤 Usuarios de ejemplo insertados.")
+
+            admin_id = admin.id
+            user1_id = user1.id
+
+        else:
+            admin_id = db.query(User.id).filter_by(email="admin@ejemplo.com").scalar()
+            user1_id = (
+                db.query(User.id).filter_by(email="usuario1@ejemplo.com").scalar()
+            )
+            print("⚠️ Ya existen usuarios, no se insertaron de nuevo.")
+
+        # Crear autores si no existen
+        if db.query(Author).count() == 0:
+            author1 = Author(
+                name="Antoine de Saint-Exupéry",
+                nationality="Francés",
+                birth_date="1900-06-29"
+            )
+            author2 = Author(
+                name="Miguel de Cervantes",
+                nationality="Español",
+                birth_date="1547-09-29",
+                death_date="1616-04-22"
+            )
+            db.add_all([author1, author2])
+            db.commit()
+            print("✍️ Autores de ejemplo insertados.")
+        else:
+            author1 = db.query(Author).filter_by(name="Antoine de Saint-Exupéry").first()
+            author2 = db.query(Author).filter_by(name="Miguel de Cervantes").first()
+            print("⚠️ Ya existen autores, no se insertaron de nuevo.")
+
+        # Crear tipos de material si no existen
+        if db.query(MaterialType).count() == 0:
+            book_type = MaterialType(
+                name="book",
+                description="Libro"
+            )
+            magazine_type = MaterialType(
+                name="magazine",
+                description="Revista"
+            )
+            newspaper_type = MaterialType(
+                name="newspaper",
+                description="Periódico"
+            )
+            db.add_all([book_type, magazine_type, newspaper_type])
+            db.commit()
+            print("📖 Tipos de material de ejemplo insertados.")
+        else:
+            book_type = db.query(MaterialType).filter_by(name="book").first()
+            magazine_type = db.query(MaterialType).filter_by(name="magazine").first()
+            newspaper_type = db.query(MaterialType).filter_by(name="newspaper").first()
+            print("⚠️ Ya existen tipos de material, no se insertaron de nuevo.")
+
+        # Crear materiales si no existen
+        if db.query(Material).count() == 0:
+            m1 = Material(
+                title="El Principito",
+                author_id=author1.id,
+                type_id=book_type.id,
+                created_by=admin_id,
+                updated_by=admin_id,
+            )
+            m2 = Material(
+                title="Don Quijote",
+                author_id=author2.id,
+                type_id=book_type.id,
+                created_by=admin_id,
+                updated_by=admin_id,
+            )
+            db.add_all([m1, m2])
+            db.commit()
+            print("📚 Materiales de ejemplo insertados.")
+            m1_id = m1.id
+            m2_id = m2.id
+        else:
+            m1_id = db.query(Material.id).filter_by(title="El Principito").scalar()
+            m2_id = db.query(Material.id).filter_by(title="Don Quijote").scalar()
+            print("⚠️ Ya existen materiales, no se insertaron de nuevo.")
+
+        # Crear estados de préstamo si no existen
+        if db.query(LoanStatus).count() == 0:
+            borrowed_status = LoanStatus(name="borrowed")
+            returned_status = LoanStatus(name="returned")
+            overdue_status = LoanStatus(name="overdue")
+            db.add_all([borrowed_status, returned_status, overdue_status])
+            db.commit()
+            print("📋 Estados de préstamo insertados.")
+        else:
+            borrowed_status = db.query(LoanStatus).filter_by(name="borrowed").first()
+            returned_status = db.query(LoanStatus).filter_by(name="returned").first()
+            overdue_status = db.query(LoanStatus).filter_by(name="overdue").first()
+            print("⚠️ Ya existen estados de préstamo, no se insertaron de nuevo.")
+
+        # Crear préstamos si no existen
+        if db.query(Loan).count() == 0:
+            loan1 = Loan(
+                material_id=m1_id,
+                user_id=user1_id,
+                expected_return_date=datetime.now(timezone.utc),
+                status_id=borrowed_status.id,
+                created_by=admin_id,
+                updated_by=admin_id,
+            )
+            loan2 = Loan(
+                material_id=m2_id,
+                user_id=admin_id,
+                expected_return_date=datetime.now(timezone.utc),
+                status_id=returned_status.id,
+                actual_return_date=datetime.now(timezone.utc),
+                created_by=admin_id,
+                updated_by=admin_id,
+            )
+            db.add_all([loan1, loan2])
+            db.flush()
+            # loan1 sigue abierto: el material queda prestado
+            db.query(Material).filter(Material.id == m1_id).update(
+                {"is_available": False, "active_loan_id": loan1.id}
+            )
+            db.commit()
+            print("📋 Préstamos de ejemplo insertados.")
+        else:
+            print("⚠️ Ya existen préstamos, no se insertaron de nuevo.")
+
+    print("✅ Datos de ejemplo verificados.")
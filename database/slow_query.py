@@ -0,0 +1,300 @@
+"""
+Registro de consultas lentas.
+
+Este módulo proporciona:
+- Hooks de SQLAlchemy que detectan sentencias que superan SLOW_QUERY_THRESHOLD_MS
+- Parámetros redactados (no se registran cadenas ni valores de columnas sensibles)
+- La ruta que originó la sentencia, tomada del contexto de instrumentación
+- Captura muestreada de `EXPLAIN (ANALYZE, BUFFERS)` en segundo plano, solo para SELECT
+  de solo lectura
+- Un archivo rotativo en formato JSON por línea y un buffer en memoria para el
+  endpoint de administración
+
+El EXPLAIN se ejecuta con la misma conexión lógica (engine) en que corrió la sentencia,
+en una conexión aparte y fuera de la petición: en engines asíncronos como una tarea del
+event loop, en engines síncronos en un hilo dedicado.
+
+EXPLAIN ANALYZE vuelve a ejecutar la sentencia, así que solo se captura para SELECT sin
+cláusulas de bloqueo (FOR UPDATE/SHARE), sin INSERT/UPDATE/DELETE/MERGE en un WITH, sin
+SELECT INTO y sin advisory locks ni secuencias. Además corre en una transacción
+`READ ONLY` que se revierte: si una sentencia de escritura pasara el filtro,
+PostgreSQL la rechaza en lugar de repetirla.
+
+Funciones:
+    install_slow_query_log: Registra los hooks en un engine
+    get_slow_queries: Entradas recientes del buffer en memoria
+"""
+
+import asyncio
+import contextvars
+import itertools
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from logging.handlers import RotatingFileHandler
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import event, text
+
+from config import settings
+from database.instrumentation import current_route
+
+logger = logging.getLogger(__name__)
+
+_file_logger = logging.getLogger("slow_query")
+_file_logger.propagate = False
+
+# Opción de ejecución que marca las sentencias del propio EXPLAIN para no registrarlas
+_EXPLAIN_OPTION = "slow_query_explain"
+
+_SENSITIVE_NAME = re.compile(r"password|hash|token|secret|email", re.IGNORECASE)
+_SELECT = re.compile(r"^\s*(WITH\b.*?\)\s*)?SELECT\b", re.IGNORECASE | re.DOTALL)
+# Escrituras o bloqueos que EXPLAIN ANALYZE repetiría (CTE con escritura, FOR UPDATE...)
+_SIDE_EFFECTS = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|INTO|FOR\s+(KEY\s+)?SHARE|NEXTVAL|SETVAL|PG_\w*ADVISORY\w*)\b",
+    re.IGNORECASE,
+)
+_PLAIN_TYPES = (int, float, bool, Decimal, UUID, datetime, date)
+_MAX_STATEMENT_LENGTH = 4000
+
+_entries: deque = deque(maxlen=settings.SLOW_QUERY_BUFFER_SIZE)
+_entries_lock = threading.Lock()
+_ids = itertools.count(1)
+
+_engines: Dict[object, tuple] = {}
+_explain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+_explain_tasks = set()
+_explains_in_flight = 0
+_explains_lock = threading.Lock()
+
+
+def _redact_value(value):
+    if value is None or isinstance(value, _PLAIN_TYPES):
+        return str(value) if isinstance(value, (Decimal, UUID, datetime, date)) else value
+    if isinstance(value, str):
+        return f"<str:{len(value)}>"
+    if isinstance(value, (list, tuple)):
+        return [_redact_value(item) for item in value]
+    return f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters):
+    """
+    Redacta los parámetros de una sentencia para poder registrarlos.
+    Se conservan números, fechas, UUID y booleanos; las cadenas se reemplazan por su
+    longitud y los parámetros con nombre sensible (password, email, token...) se ocultan.
+
+    Args:
+        parameters: Parámetros tal como llegan al cursor (dict, tupla o lista de ellos).
+
+    Returns:
+        Parámetros redactados, serializables a JSON.
+    """
+    if isinstance(parameters, dict):
+        return {
+            key: "<redacted>" if _SENSITIVE_NAME.search(str(key)) else _redact_value(value)
+            for key, value in parameters.items()
+        }
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany: solo se registra la primera fila
+            return [redact_parameters(parameters[0]), f"... {len(parameters)} filas"]
+        return [_redact_value(value) for value in parameters]
+    return _redact_value(parameters)
+
+
+def _configure_file_logger():
+    if _file_logger.handlers or not settings.SLOW_QUERY_LOG_FILE:
+        return
+    directory = os.path.dirname(settings.SLOW_QUERY_LOG_FILE)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    handler = RotatingFileHandler(
+        settings.SLOW_QUERY_LOG_FILE,
+        maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+        backupCount=settings.SLOW_QUERY_LOG_BACKUPS,
+        encoding="utf-8",
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    _file_logger.addHandler(handler)
+    _file_logger.setLevel(logging.INFO)
+
+
+def _write(record: dict):
+    _file_logger.info(json.dumps(record, ensure_ascii=False, default=str))
+
+
+def _try_acquire_explain_slot() -> bool:
+    global _explains_in_flight
+    with _explains_lock:
+        if _explains_in_flight >= settings.SLOW_QUERY_MAX_CONCURRENT_EXPLAINS:
+            return False
+        _explains_in_flight += 1
+        return True
+
+
+def _release_explain_slot():
+    global _explains_in_flight
+    with _explains_lock:
+        _explains_in_flight -= 1
+
+
+def _is_read_only(statement: str) -> bool:
+    return bool(_SELECT.match(statement)) and not _SIDE_EFFECTS.search(statement)
+
+
+def _explain_statement(statement: str) -> str:
+    return f"EXPLAIN (ANALYZE, BUFFERS, FORMAT TEXT) {statement}"
+
+
+_READ_ONLY = text("SET TRANSACTION READ ONLY")
+
+
+def _timeout_statement():
+    return text(f"SET LOCAL statement_timeout = {int(settings.SLOW_QUERY_EXPLAIN_TIMEOUT_MS)}")
+
+
+def _store_plan(entry: dict, plan: Optional[str], error: Optional[str]):
+    with _entries_lock:
+        entry["plan"] = plan
+        entry["explain_error"] = error
+        entry["plan_pending"] = False
+    _write({"id": entry["id"], "type": "plan", "plan": plan, "explain_error": error})
+
+
+def _explain_sync(engine, entry: dict, statement: str, parameters):
+    try:
+        with engine.connect().execution_options(**{_EXPLAIN_OPTION: True}) as connection:
+            connection.execute(_READ_ONLY)
+            connection.execute(_timeout_statement())
+            rows = connection.exec_driver_sql(_explain_statement(statement), parameters)
+            plan = "\n".join(row[0] for row in rows)
+            connection.rollback()
+        _store_plan(entry, plan, None)
+    except Exception as e:
+        _store_plan(entry, None, str(e))
+    finally:
+        _release_explain_slot()
+
+
+async def _explain_async(async_engine, entry: dict, statement: str, parameters):
+    try:
+        async with async_engine.connect() as connection:
+            connection = await connection.execution_options(**{_EXPLAIN_OPTION: True})
+            await connection.execute(_READ_ONLY)
+            await connection.execute(_timeout_statement())
+            result = await connection.exec_driver_sql(_explain_statement(statement), parameters)
+            plan = "\n".join(row[0] for row in result)
+            await connection.rollback()
+        _store_plan(entry, plan, None)
+    except Exception as e:
+        _store_plan(entry, None, str(e))
+    finally:
+        _release_explain_slot()
+
+
+def _schedule_explain(engine, is_async: bool, entry: dict, statement: str, parameters):
+    if not _try_acquire_explain_slot():
+        return
+    try:
+        if is_async:
+            # Contexto vacío: el EXPLAIN no debe contarse en las métricas de la petición
+            loop = asyncio.get_running_loop()
+            task = contextvars.Context().run(
+                loop.create_task, _explain_async(engine, entry, statement, parameters)
+            )
+            _explain_tasks.add(task)
+            task.add_done_callback(_explain_tasks.discard)
+        else:
+            _explain_executor.submit(_explain_sync, engine, entry, statement, parameters)
+    except RuntimeError:
+        # Sin event loop en ejecución o executor detenido
+        _release_explain_slot()
+        return
+    with _entries_lock:
+        entry["plan_pending"] = entry["plan"] is None and entry["explain_error"] is None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["slow_query_start_time"].pop()) * 1000
+    if elapsed_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+    if context is not None and context.execution_options.get(_EXPLAIN_OPTION):
+        return
+
+    registered = _engines.get(conn.engine) or _engines.get(
+        getattr(conn.engine, "_proxied", None)
+    )
+    name, engine, is_async = registered or ("unknown", None, False)
+    entry = {
+        "id": next(_ids),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "engine": name,
+        "route": current_route(),
+        "duration_ms": round(elapsed_ms, 2),
+        "statement": statement[:_MAX_STATEMENT_LENGTH],
+        "parameters": redact_parameters(parameters),
+        "plan": None,
+        "plan_pending": False,
+        "explain_error": None,
+    }
+    with _entries_lock:
+        _entries.append(entry)
+    _write({"type": "statement", **{k: v for k, v in entry.items() if k != "plan"}})
+    logger.warning(
+        "Consulta lenta (%.0f ms) en %s: %s", elapsed_ms, entry["route"], statement[:200]
+    )
+
+    if (
+        engine is not None
+        and not executemany
+        and _is_read_only(statement)
+        and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+    ):
+        _schedule_explain(engine, is_async, entry, statement, parameters)
+
+
+def install_slow_query_log(name: str, engine):
+    """
+    Registra el detector de consultas lentas en un engine.
+
+    Args:
+        name (str): Nombre con el que se reporta el engine (por ejemplo "primary").
+        engine: Engine o AsyncEngine de SQLAlchemy.
+    """
+    _configure_file_logger()
+    sync_engine = getattr(engine, "sync_engine", engine)
+    _engines[sync_engine] = (name, engine, sync_engine is not engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def get_slow_queries(limit: int = 50, route: Optional[str] = None) -> List[dict]:
+    """
+    Devuelve las consultas lentas más recientes del proceso actual.
+
+    Args:
+        limit (int): Número máximo de entradas.
+        route (Optional[str]): Filtra por ruta (coincidencia parcial).
+
+    Returns:
+        List[dict]: Entradas de la más reciente a la más antigua.
+    """
+    with _entries_lock:
+        entries = [dict(entry) for entry in reversed(_entries)]
+    if route:
+        entries = [entry for entry in entries if entry["route"] and route in entry["route"]]
+    return entries[:limit]
@@ -5,16 +5,23 @@ from .users import (
 )
 
 from .materials import (
+    search_materials_router,
+    get_material_facets_router,
+    get_autocomplete_router,
     get_materials_router,
+    get_material_availability_router,
     post_material_router,
     put_material_router,
-    delete_material_router
+    delete_material_router,
+    import_materials_router
 )
 
 from .loans import (
     get_loan_router,
     post_loan_router,
-    put_loan_router
+    put_loan_router,
+    post_bulk_loans_router,
+    put_bulk_return_router
 )
 
 from .auth import (
@@ -50,17 +57,35 @@ from .loan_status import (
     delete_loan_status_router
 )
 
+from .admin import (
+    get_autocomplete_stats_router,
+    get_cache_stats_router,
+    get_export_router,
+    get_overdue_stats_router,
+    get_pool_stats_router,
+    get_replica_status_router,
+    get_route_stats_router,
+    get_slow_queries_router
+)
+
 __all__ = [
     "get_users_router",
     "put_user_router",
     "delete_user_router",
+    "search_materials_router",
+    "get_material_facets_router",
+    "get_autocomplete_router",
     "get_materials_router",
+    "get_material_availability_router",
     "post_material_router", 
     "put_material_router",
     "delete_material_router",
+    "import_materials_router",
     "get_loan_router",
     "post_loan_router",
     "put_loan_router",
+    "post_bulk_loans_router",
+    "put_bulk_return_router",
     "login_router",
     "register_router",
     "get_roles_router",
@@ -78,5 +103,13 @@ __all__ = [
     "get_loan_status_router",
     "post_loan_status_router",
     "put_loan_status_router",
-    "delete_loan_status_router"
+    "delete_loan_status_router",
+    "get_autocomplete_stats_router",
+    "get_cache_stats_router",
+    "get_export_router",
+    "get_overdue_stats_router",
+    "get_pool_stats_router",
+    "get_replica_status_router",
+    "get_route_stats_router",
+    "get_slow_queries_router"
 ]
\ No newline at end of file
@@ -0,0 +1,19 @@
+from .get_autocomplete_stats import router as get_autocomplete_stats_router
+from .get_cache_stats import router as get_cache_stats_router
+from .get_export import router as get_export_router
+from .get_overdue_stats import router as get_overdue_stats_router
+from .get_pool_stats import router as get_pool_stats_router
+from .get_replica_status import router as get_replica_status_router
+from .get_route_stats import router as get_route_stats_router
+from .get_slow_queries import router as get_slow_queries_router
+
+__all__ = [
+    "get_autocomplete_stats_router",
+    "get_cache_stats_router",
+    "get_export_router",
+    "get_overdue_stats_router",
+    "get_pool_stats_router",
+    "get_replica_status_router",
+    "get_route_stats_router",
+    "get_slow_queries_router"
+]
\ No newline at end of file
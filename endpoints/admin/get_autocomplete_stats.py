@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from typing import List
+from models.schemas import AutocompleteStats, TokenData
+from common.autocomplete import get_autocomplete_stats as get_index_stats
+from common.middleware import require_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get(
+    "/autocomplete", response_model=List[AutocompleteStats], status_code=status.HTTP_200_OK
+)
+async def get_autocomplete_stats(_: TokenData = Depends(require_admin)):
+    """
+    Obtiene el tamaño y la memoria de los índices de autocompletado del proceso actual.
+    Solo accesible para administradores.
+
+    Args:
+        _: TokenData - Token del administrador
+
+    Returns:
+        List[AutocompleteStats] - Entradas, palabras, memoria total y por entrada y última reconstrucción
+
+    Raises:
+        HTTPException(403) - Usuario no autorizado
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        return [AutocompleteStats(**snapshot) for snapshot in get_index_stats()]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
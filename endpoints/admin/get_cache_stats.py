@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from typing import List
+from models.schemas import CacheStats, TokenData
+from common.cache import get_cache_stats as get_catalog_cache_stats
+from common.middleware import require_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/cache", response_model=List[CacheStats], status_code=status.HTTP_200_OK)
+async def get_cache_stats(_: TokenData = Depends(require_admin)):
+    """
+    Obtiene los contadores de las cachés del catálogo del proceso actual.
+    Solo accesible para administradores.
+
+    Args:
+        _: TokenData - Token del administrador
+
+    Returns:
+        List[CacheStats] - Tamaño, aciertos, fallos, desalojos, expiraciones e invalidaciones por caché
+
+    Raises:
+        HTTPException(403) - Usuario no autorizado
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        return [CacheStats(**snapshot) for snapshot in get_catalog_cache_stats()]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
@@ -0,0 +1,75 @@
+import logging
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+
+from models.schemas import TokenData
+from database.connection import AsyncSessionLocal, replica_set
+from database.export import stream_export
+from common import ExportEntity, ImportFormat
+from common.middleware import require_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {
+    ImportFormat.csv: "text/csv; charset=utf-8",
+    ImportFormat.ndjson: "application/x-ndjson",
+}
+
+
+async def _export_body(entity: ExportEntity, export_format: ImportFormat, after: Optional[UUID]):
+    # La sesión se abre dentro del generador: la respuesta se sigue enviando después
+    # de que el endpoint retorna y la sesión debe vivir lo mismo que el cursor
+    sessionmaker = replica_set.pick() or AsyncSessionLocal
+    async with sessionmaker() as db:
+        try:
+            async for chunk, _, _ in stream_export(db, entity, export_format, after=after):
+                yield chunk
+        except Exception:
+            # El código de estado ya se envió: se corta la respuesta y el cliente
+            # reanuda con `after` desde la última fila completa que recibió
+            logger.exception("Exportación de %s interrumpida", entity.value)
+            raise
+
+
+@router.get("/export/{entity}", status_code=status.HTTP_200_OK)
+async def get_export(
+    entity: ExportEntity,
+    format: ImportFormat = Query(ImportFormat.ndjson, description="ndjson o csv"),
+    after: Optional[UUID] = Query(None, description="Reanuda después de este id"),
+    _: TokenData = Depends(require_admin),
+):
+    """
+    Exporta todas las filas de materiales, autores o préstamos (incluidas las eliminadas
+    lógicamente) en NDJSON o CSV. La respuesta se envía por streaming desde un cursor del
+    servidor, en orden de id y con memoria constante. Una exportación interrumpida se
+    reanuda con `after` igual al id de la última fila recibida; en CSV el encabezado solo
+    se envía en la primera petición.
+    Se lee de una réplica si hay alguna disponible.
+    Solo accesible para administradores.
+
+    Args:
+        entity: ExportEntity - materials, authors o loans
+        format: ImportFormat - Formato de salida (ndjson por defecto)
+        after: Optional[UUID] - Id de la última fila ya exportada
+        _: TokenData - Token del administrador
+
+    Returns:
+        StreamingResponse - Filas en el formato solicitado
+
+    Raises:
+        HTTPException(403) - Usuario no autorizado
+    """
+    extension = "csv" if format == ImportFormat.csv else "ndjson"
+    return StreamingResponse(
+        _export_body(entity, format, after),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{entity.value}.{extension}"',
+            "Cache-Control": "no-store",
+        },
+    )
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from models.schemas import OverdueSweepStats, TokenData
+from database.overdue import get_overdue_stats as get_sweep_stats
+from common.middleware import require_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/overdue", response_model=OverdueSweepStats, status_code=status.HTTP_200_OK)
+async def get_overdue_stats(_: TokenData = Depends(require_admin)):
+    """
+    Obtiene las métricas del marcado periódico de préstamos vencidos del proceso actual.
+    Solo accesible para administradores.
+
+    Args:
+        _: TokenData - Token del administrador
+
+    Returns:
+        OverdueSweepStats - Barridos, filas marcadas, duración y error del último barrido
+
+    Raises:
+        HTTPException(403) - Usuario no autorizado
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        return OverdueSweepStats(**get_sweep_stats())
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from typing import List
+from models.schemas import PoolStats, TokenData
+from database.pool_stats import get_pool_snapshots
+from common.middleware import require_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/db/pool", response_model=List[PoolStats], status_code=status.HTTP_200_OK)
+async def get_pool_stats(_: TokenData = Depends(require_admin)):
+    """
+    Obtiene el estado de los pools de conexiones del proceso actual.
+    Solo accesible para administradores.
+
+    Args:
+        _: TokenData - Token del administrador
+
+    Returns:
+        List[PoolStats] - Conexiones en uso, overflow, tiempos de espera y churn por pool
+
+    Raises:
+        HTTPException(403) - Usuario no autorizado
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        return [PoolStats(**snapshot) for snapshot in get_pool_snapshots()]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
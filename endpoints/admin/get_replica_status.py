@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from typing import List
+from models.schemas import ReplicaStatus, TokenData
+from database.connection import replica_set
+from common.middleware import require_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get(
+    "/db/replicas", response_model=List[ReplicaStatus], status_code=status.HTTP_200_OK
+)
+async def get_replica_status(_: TokenData = Depends(require_admin)):
+    """
+    Obtiene el retraso de replicación medido para cada réplica de lectura.
+    Solo accesible para administradores.
+
+    Args:
+        _: TokenData - Token del administrador
+
+    Returns:
+        List[ReplicaStatus] - Una entrada por réplica configurada
+
+    Raises:
+        HTTPException(403) - Usuario no autorizado
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        return [ReplicaStatus(**replica) for replica in replica_set.status()]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
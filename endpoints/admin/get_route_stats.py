@@ -0,0 +1,35 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from typing import List
+from models.schemas import RouteSqlStats, TokenData
+from database.instrumentation import get_route_stats as get_route_sql_stats
+from common.middleware import require_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get(
+    "/db/routes", response_model=List[RouteSqlStats], status_code=status.HTTP_200_OK
+)
+async def get_route_stats(_: TokenData = Depends(require_admin)):
+    """
+    Obtiene las métricas SQL acumuladas por ruta en el proceso actual,
+    ordenadas de mayor a menor tiempo total en base de datos.
+    Solo accesible para administradores.
+
+    Args:
+        _: TokenData - Token del administrador
+
+    Returns:
+        List[RouteSqlStats] - Sentencias, tiempo en base de datos, filas y detecciones de N+1 por ruta
+
+    Raises:
+        HTTPException(403) - Usuario no autorizado
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        return [RouteSqlStats(**entry) for entry in get_route_sql_stats()]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
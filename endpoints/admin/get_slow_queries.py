@@ -0,0 +1,43 @@
+from fastapi import APIRouter, HTTPException, status, Query, Depends
+from typing import List, Optional
+from models.schemas import SlowQuery, TokenData
+from database.slow_query import get_slow_queries as get_recent_slow_queries
+from common.middleware import require_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get(
+    "/db/slow-queries", response_model=List[SlowQuery], status_code=status.HTTP_200_OK
+)
+async def get_slow_queries(
+    _: TokenData = Depends(require_admin),
+    limit: int = Query(50, ge=1, le=500),
+    route: Optional[str] = Query(None),
+):
+    """
+    Obtiene las consultas lentas más recientes del proceso actual, de la más reciente
+    a la más antigua, con sus parámetros redactados y el plan de ejecución cuando se capturó.
+    Solo accesible para administradores.
+
+    Args:
+        _: TokenData - Token del administrador
+        limit: int - Número máximo de entradas a retornar (1-500)
+        route: Optional[str] - Filtra por ruta (coincidencia parcial, por ejemplo "/loans")
+
+    Returns:
+        List[SlowQuery] - Consultas lentas registradas
+
+    Raises:
+        HTTPException(403) - Usuario no autorizado
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        return [
+            SlowQuery(**entry) for entry in get_recent_slow_queries(limit=limit, route=route)
+        ]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
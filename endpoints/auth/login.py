@@ -1,7 +1,10 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from models.schemas import LoginDTO, LoginResponse
-from database.connection import get_db, User as UserDB, Role as RoleDB
-from sqlalchemy.orm import Session, joinedload
+from database.connection import get_async_db, User as UserDB, Role as RoleDB
+from database.load_options import USER_RESPONSE_OPTIONS
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
 from passlib.context import CryptContext
 from datetime import datetime, timezone, timedelta
 from typing import cast
@@ -20,15 +23,18 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
 
 
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
-def login(data: LoginDTO, db: Session = Depends(get_db)):
-    user = (
-        db.query(UserDB)
-        .options(joinedload(UserDB.role))
-        .filter(UserDB.email == data.email, UserDB.is_deleted == False)
-        .first()
+async def login(data: LoginDTO, db: AsyncSession = Depends(get_async_db)):
+    stmt = (
+        select(UserDB)
+        .options(*USER_RESPONSE_OPTIONS)
+        .where(UserDB.email == data.email, UserDB.is_deleted == False)
     )
+    user = (await db.execute(stmt)).scalars().first()
     
-    if not user or not pwd_context.verify(data.password, cast(str, user.password)):
+    # bcrypt es costoso en CPU: se ejecuta fuera del event loop
+    if not user or not await run_in_threadpool(
+        pwd_context.verify, data.password, cast(str, user.password)
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Credenciales inválidas",
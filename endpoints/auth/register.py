@@ -1,10 +1,11 @@
 from fastapi import APIRouter, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from models.schemas import RegisterDTO, LoginResponse, LoginDTO
-from database.connection import User as UserDB, Role as RoleDB, get_db
+from database.connection import User as UserDB, Role as RoleDB, get_write_db
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 import os
 from dotenv import load_dotenv
 from .login import login
@@ -22,22 +23,24 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
 @router.post(
     "/register", response_model=LoginResponse, status_code=status.HTTP_201_CREATED
 )
-async def create_user(user: RegisterDTO, db: Session = Depends(get_db)):
+async def create_user(user: RegisterDTO, db: AsyncSession = Depends(get_write_db)):
     try:
         stmt = select(UserDB).where(UserDB.email == user.email)
-        if db.execute(stmt).scalar_one_or_none():
+        if (await db.execute(stmt)).scalar_one_or_none():
             return LoginResponse(
                 message="El correo ya está registrado", error="400 Bad Request"
             )
 
         # Buscar el rol de cliente por defecto
-        client_role = db.query(RoleDB).filter(RoleDB.name == "cliente").first()
+        client_role = (
+            await db.execute(select(RoleDB).where(RoleDB.name == "cliente"))
+        ).scalars().first()
         if not client_role:
             return LoginResponse(
                 message="Error: Rol de cliente no encontrado", error="500 Internal Server Error"
             )
 
-        hashed_password = pwd_context.hash(user.password)
+        hashed_password = await run_in_threadpool(pwd_context.hash, user.password)
 
         # Crear el usuario sin el campo created_by
         db_user = UserDB(
@@ -49,32 +52,32 @@ async def create_user(user: RegisterDTO, db: Session = Depends(get_db)):
         )
 
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
 
         db_user.created_by = db_user.id
-        db.commit()
+        await db.commit()
 
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
 
         """
         Reutilizar la lógica de login para devolver token/response
-        `login` espera un LoginDTO y una sesión (Depends(get_db) proporciona Session)
+        `login` espera un LoginDTO y una sesión (Depends(get_write_db) proporciona AsyncSession)
         """
-        return login(
+        return await login(
             data=LoginDTO(email=user.email, password=user.password),
             db=db
         )
 
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         return LoginResponse(
             message="Error de integridad en la base de datos", error="400 Bad Request"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return LoginResponse(
             message="Error interno del servidor",
             error=f"500 Internal Server Error: {str(e)}",
@@ -1,8 +1,11 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
 from models.schemas import TokenData
-from database.connection import Author as AuthorDB, Material as MaterialDB, get_db
+from database.connection import Author as AuthorDB, Material as MaterialDB, get_write_db
 from common.middleware import require_admin
+from common.cache import invalidate_author
+from common.autocomplete import author_index
 from uuid import UUID
 
 router = APIRouter(prefix="/authors", tags=["authors"])
@@ -11,7 +14,7 @@ router = APIRouter(prefix="/authors", tags=["authors"])
 @router.delete("/{author_id}", status_code=status.HTTP_200_OK)
 async def delete_author(
     author_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -21,7 +24,7 @@ async def delete_author(
 
     Args:
         author_id: UUID - Identificador único del autor
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -35,7 +38,7 @@ async def delete_author(
     """
     try:
         # Buscar el autor existente
-        db_author = db.query(AuthorDB).filter(AuthorDB.id == author_id).first()
+        db_author = await db.get(AuthorDB, author_id)
         if not db_author:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -43,10 +46,14 @@ async def delete_author(
             )
 
         # Verificar si el autor tiene materiales asociados
-        materials_count = db.query(MaterialDB).filter(
-            MaterialDB.author_id == author_id,
-            MaterialDB.is_deleted == False
-        ).count()
+        materials_count = await db.scalar(
+            select(func.count())
+            .select_from(MaterialDB)
+            .where(
+                MaterialDB.author_id == author_id,
+                MaterialDB.is_deleted == False
+            )
+        )
         
         if materials_count > 0:
             raise HTTPException(
@@ -55,15 +62,18 @@ async def delete_author(
             )
 
         # Eliminar el autor
-        db.delete(db_author)
-        db.commit()
+        name = db_author.name
+        await db.delete(db_author)
+        await db.commit()
+        invalidate_author(author_id)
+        author_index.apply_change(author_id, old_label=name)
 
         return {"message": "Autor eliminado correctamente"}
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
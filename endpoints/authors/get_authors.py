@@ -1,20 +1,24 @@
 from fastapi import APIRouter, HTTPException, status, Query, Depends
-from typing import List
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from models.schemas import Author, TokenData
-from database.connection import Author as AuthorDB, get_db
+from database.connection import Author as AuthorDB, get_read_db
 from common.middleware import require_admin
+from common.etag import conditional_get
 
 router = APIRouter(prefix="/authors", tags=["authors"])
 
+AUTHORS_ETAG = conditional_get("authors")
+
 
 @router.get("/", response_model=List[Author], status_code=status.HTTP_200_OK)
 async def get_authors(
     _: TokenData = Depends(require_admin),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    etag: Optional[str] = Depends(AUTHORS_ETAG),
 ):
     """
     Obtiene una lista paginada de todos los autores del sistema.
@@ -24,7 +28,8 @@ async def get_authors(
         _: TokenData - Token del administrador 
         skip: int - Número de registros a saltar (para paginación)
         limit: int - Número máximo de registros a retornar (10-100)
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
+        etag: Optional[str] - ETag de la respuesta; 304 si coincide con If-None-Match
 
     Returns:
         List[Author] - Lista de autores del sistema
@@ -40,7 +45,7 @@ async def get_authors(
             .offset(skip)
             .limit(limit)
         )
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         authors_db = result.scalars().all()
 
         authors = [Author.model_validate(a, from_attributes=True) for a in authors_db]
@@ -57,8 +62,9 @@ async def get_authors(
 @router.get("/{author_id}", response_model=Author)
 async def get_author(
     author_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: TokenData = Depends(require_admin),
+    etag: Optional[str] = Depends(AUTHORS_ETAG),
 ):
     """
     Obtiene los detalles de un autor específico.
@@ -66,8 +72,9 @@ async def get_author(
 
     Args:
         author_id: str - Identificador único del autor
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
         current_user: TokenData - Token del administrador 
+        etag: Optional[str] - ETag de la respuesta; 304 si coincide con If-None-Match
 
     Returns:
         Author - Detalles del autor solicitado
@@ -79,7 +86,7 @@ async def get_author(
     """
     try:
         stmt = select(AuthorDB).where(AuthorDB.id == author_id)
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         author_db = result.scalar_one_or_none()
 
         if not author_db:
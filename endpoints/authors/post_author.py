@@ -1,9 +1,11 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from models.schemas import AuthorCreate, Author, TokenData
-from database.connection import Author as AuthorDB, get_db
+from database.connection import Author as AuthorDB, get_write_db
 from common.middleware import require_admin
+from common.autocomplete import author_index
 from uuid import uuid4
 
 router = APIRouter(prefix="/authors", tags=["authors"])
@@ -12,7 +14,7 @@ router = APIRouter(prefix="/authors", tags=["authors"])
 @router.post("/", response_model=Author, status_code=status.HTTP_201_CREATED)
 async def create_author(
     author: AuthorCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -21,7 +23,7 @@ async def create_author(
 
     Args:
         author: AuthorCreate - Datos del nuevo autor
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -34,7 +36,9 @@ async def create_author(
     """
     try:
         # Verificar si el autor ya existe
-        existing_author = db.query(AuthorDB).filter(AuthorDB.name == author.name).first()
+        existing_author = (
+            await db.execute(select(AuthorDB).where(AuthorDB.name == author.name))
+        ).scalars().first()
         if existing_author:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -53,21 +57,22 @@ async def create_author(
         )
 
         db.add(db_author)
-        db.commit()
-        db.refresh(db_author)
+        await db.commit()
+        author_index.apply_change(db_author.id, new_label=db_author.name)
+        await db.refresh(db_author)
 
         return Author.model_validate(db_author, from_attributes=True)
 
     except HTTPException:
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
@@ -1,9 +1,12 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from models.schemas import AuthorUpdate, Author, TokenData
-from database.connection import Author as AuthorDB, get_db
+from database.connection import Author as AuthorDB, get_write_db
 from common.middleware import require_admin
+from common.cache import invalidate_author
+from common.autocomplete import author_index
 from uuid import UUID
 
 router = APIRouter(prefix="/authors", tags=["authors"])
@@ -13,7 +16,7 @@ router = APIRouter(prefix="/authors", tags=["authors"])
 async def update_author(
     author_id: UUID,
     author_update: AuthorUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -23,7 +26,7 @@ async def update_author(
     Args:
         author_id: UUID - Identificador único del autor
         author_update: AuthorUpdate - Datos a actualizar
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -37,7 +40,7 @@ async def update_author(
     """
     try:
         # Buscar el autor existente
-        db_author = db.query(AuthorDB).filter(AuthorDB.id == author_id).first()
+        db_author = await db.get(AuthorDB, author_id)
         if not db_author:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -46,16 +49,22 @@ async def update_author(
 
         # Verificar si el nuevo nombre ya existe (si se está cambiando)
         if author_update.name and author_update.name != db_author.name:
-            existing_author = db.query(AuthorDB).filter(
-                AuthorDB.name == author_update.name,
-                AuthorDB.id != author_id
-            ).first()
+            existing_author = (
+                await db.execute(
+                    select(AuthorDB).where(
+                        AuthorDB.name == author_update.name,
+                        AuthorDB.id != author_id
+                    )
+                )
+            ).scalars().first()
             if existing_author:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Ya existe un autor con ese nombre"
                 )
 
+        old_name = db_author.name
+
         # Actualizar campos
         update_data = author_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
@@ -65,21 +74,24 @@ async def update_author(
         # Actualizar campos de auditoría
         db_author.updated_by = current_user.id
 
-        db.commit()
-        db.refresh(db_author)
+        await db.commit()
+        invalidate_author(author_id)
+        if db_author.name != old_name:
+            author_index.apply_change(author_id, old_name, db_author.name)
+        await db.refresh(db_author)
 
         return Author.model_validate(db_author, from_attributes=True)
 
     except HTTPException:
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
 from models.schemas import TokenData
-from database.connection import LoanStatus as LoanStatusDB, Loan as LoanDB, get_db
+from database.connection import LoanStatus as LoanStatusDB, Loan as LoanDB, get_write_db
 from common.middleware import require_admin
 from uuid import UUID
 
@@ -11,7 +12,7 @@ router = APIRouter(prefix="/loan-status", tags=["loan-status"])
 @router.delete("/{loan_status_id}", status_code=status.HTTP_200_OK)
 async def delete_loan_status(
     loan_status_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -21,7 +22,7 @@ async def delete_loan_status(
 
     Args:
         loan_status_id: UUID - Identificador único del estado de préstamo
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -35,9 +36,7 @@ async def delete_loan_status(
     """
     try:
         # Buscar el estado de préstamo existente
-        db_loan_status = db.query(LoanStatusDB).filter(
-            LoanStatusDB.id == loan_status_id
-        ).first()
+        db_loan_status = await db.get(LoanStatusDB, loan_status_id)
         if not db_loan_status:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -45,9 +44,11 @@ async def delete_loan_status(
             )
 
         # Verificar si el estado de préstamo tiene préstamos asociados
-        loans_count = db.query(LoanDB).filter(
-            LoanDB.status_id == loan_status_id
-        ).count()
+        loans_count = await db.scalar(
+            select(func.count())
+            .select_from(LoanDB)
+            .where(LoanDB.status_id == loan_status_id)
+        )
         
         if loans_count > 0:
             raise HTTPException(
@@ -56,15 +57,15 @@ async def delete_loan_status(
             )
 
         # Eliminar el estado de préstamo
-        db.delete(db_loan_status)
-        db.commit()
+        await db.delete(db_loan_status)
+        await db.commit()
 
         return {"message": "Estado de préstamo eliminado correctamente"}
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
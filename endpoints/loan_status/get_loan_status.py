@@ -1,20 +1,24 @@
 from fastapi import APIRouter, HTTPException, status, Query, Depends
-from typing import List
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from models.schemas import LoanStatus, TokenData
-from database.connection import LoanStatus as LoanStatusDB, get_db
+from database.connection import LoanStatus as LoanStatusDB, get_read_db
 from common.middleware import require_admin
+from common.etag import conditional_get
 
 router = APIRouter(prefix="/loan-status", tags=["loan-status"])
 
+LOAN_STATUS_ETAG = conditional_get("loan_status")
+
 
 @router.get("/", response_model=List[LoanStatus], status_code=status.HTTP_200_OK)
 async def get_loan_status(
     _: TokenData = Depends(require_admin),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    etag: Optional[str] = Depends(LOAN_STATUS_ETAG),
 ):
     """
     Obtiene una lista paginada de todos los estados de préstamo del sistema.
@@ -24,7 +28,8 @@ async def get_loan_status(
         _: TokenData - Token del administrador 
         skip: int - Número de registros a saltar (para paginación)
         limit: int - Número máximo de registros a retornar (10-100)
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
+        etag: Optional[str] - ETag de la respuesta; 304 si coincide con If-None-Match
 
     Returns:
         List[LoanStatus] - Lista de estados de préstamo del sistema
@@ -40,7 +45,7 @@ async def get_loan_status(
             .offset(skip)
             .limit(limit)
         )
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         loan_status_db = result.scalars().all()
 
         loan_status = [LoanStatus.model_validate(ls, from_attributes=True) for ls in loan_status_db]
@@ -57,8 +62,9 @@ async def get_loan_status(
 @router.get("/{loan_status_id}", response_model=LoanStatus)
 async def get_loan_status_by_id(
     loan_status_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: TokenData = Depends(require_admin),
+    etag: Optional[str] = Depends(LOAN_STATUS_ETAG),
 ):
     """
     Obtiene los detalles de un estado de préstamo específico.
@@ -66,8 +72,9 @@ async def get_loan_status_by_id(
 
     Args:
         loan_status_id: str - Identificador único del estado de préstamo
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
         current_user: TokenData - Token del administrador 
+        etag: Optional[str] - ETag de la respuesta; 304 si coincide con If-None-Match
 
     Returns:
         LoanStatus - Detalles del estado de préstamo solicitado
@@ -79,7 +86,7 @@ async def get_loan_status_by_id(
     """
     try:
         stmt = select(LoanStatusDB).where(LoanStatusDB.id == loan_status_id)
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         loan_status_db = result.scalar_one_or_none()
 
         if not loan_status_db:
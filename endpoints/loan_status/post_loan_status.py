@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from models.schemas import LoanStatusCreate, LoanStatus, TokenData
-from database.connection import LoanStatus as LoanStatusDB, get_db
+from database.connection import LoanStatus as LoanStatusDB, get_write_db
 from common.middleware import require_admin
 from uuid import uuid4
 
@@ -12,7 +13,7 @@ router = APIRouter(prefix="/loan-status", tags=["loan-status"])
 @router.post("/", response_model=LoanStatus, status_code=status.HTTP_201_CREATED)
 async def create_loan_status(
     loan_status: LoanStatusCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -21,7 +22,7 @@ async def create_loan_status(
 
     Args:
         loan_status: LoanStatusCreate - Datos del nuevo estado de préstamo
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -34,9 +35,13 @@ async def create_loan_status(
     """
     try:
         # Verificar si el estado de préstamo ya existe
-        existing_loan_status = db.query(LoanStatusDB).filter(
-            LoanStatusDB.name == loan_status.name
-        ).first()
+        existing_loan_status = (
+            await db.execute(
+                select(LoanStatusDB).where(
+                    LoanStatusDB.name == loan_status.name
+                )
+            )
+        ).scalars().first()
         if existing_loan_status:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -51,21 +56,21 @@ async def create_loan_status(
         )
 
         db.add(db_loan_status)
-        db.commit()
-        db.refresh(db_loan_status)
+        await db.commit()
+        await db.refresh(db_loan_status)
 
         return LoanStatus.model_validate(db_loan_status, from_attributes=True)
 
     except HTTPException:
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from models.schemas import LoanStatusUpdate, LoanStatus, TokenData
-from database.connection import LoanStatus as LoanStatusDB, get_db
+from database.connection import LoanStatus as LoanStatusDB, get_write_db
 from common.middleware import require_admin
 from uuid import UUID
 
@@ -13,7 +14,7 @@ router = APIRouter(prefix="/loan-status", tags=["loan-status"])
 async def update_loan_status(
     loan_status_id: UUID,
     loan_status_update: LoanStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -23,7 +24,7 @@ async def update_loan_status(
     Args:
         loan_status_id: UUID - Identificador único del estado de préstamo
         loan_status_update: LoanStatusUpdate - Datos a actualizar
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -37,9 +38,7 @@ async def update_loan_status(
     """
     try:
         # Buscar el estado de préstamo existente
-        db_loan_status = db.query(LoanStatusDB).filter(
-            LoanStatusDB.id == loan_status_id
-        ).first()
+        db_loan_status = await db.get(LoanStatusDB, loan_status_id)
         if not db_loan_status:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -48,10 +47,14 @@ async def update_loan_status(
 
         # Verificar si el nuevo nombre ya existe (si se está cambiando)
         if loan_status_update.name and loan_status_update.name != db_loan_status.name:
-            existing_loan_status = db.query(LoanStatusDB).filter(
-                LoanStatusDB.name == loan_status_update.name,
-                LoanStatusDB.id != loan_status_id
-            ).first()
+            existing_loan_status = (
+                await db.execute(
+                    select(LoanStatusDB).where(
+                        LoanStatusDB.name == loan_status_update.name,
+                        LoanStatusDB.id != loan_status_id
+                    )
+                )
+            ).scalars().first()
             if existing_loan_status:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -67,21 +70,21 @@ async def update_loan_status(
         # Actualizar campos de auditoría
         db_loan_status.updated_by = current_user.id
 
-        db.commit()
-        db.refresh(db_loan_status)
+        await db.commit()
+        await db.refresh(db_loan_status)
 
         return LoanStatus.model_validate(db_loan_status, from_attributes=True)
 
     except HTTPException:
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
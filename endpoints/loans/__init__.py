@@ -1,9 +1,13 @@
 from .get_loan import router as get_loan_router
 from .post_loan import router as post_loan_router
 from .put_loan import router as put_loan_router
+from .post_bulk_loans import router as post_bulk_loans_router
+from .put_bulk_return import router as put_bulk_return_router
 
 __all__ = [
     "get_loan_router",
     "post_loan_router", 
-    "put_loan_router"
+    "put_loan_router",
+    "post_bulk_loans_router",
+    "put_bulk_return_router"
 ]
\ No newline at end of file
@@ -1,83 +1,289 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from database.connection import get_db
-from models.schemas import LoanResponse, TokenData
-from database.connection import Loan as LoanDB
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, tuple_
+from database.connection import get_read_db
+from models.schemas import (
+    LoanResponse,
+    LoanPage,
+    LoanSummary,
+    LoanMaterialSummary,
+    LoanUserSummary,
+    LoanStatusSummary,
+    TokenData,
+)
+from database.connection import (
+    Loan as LoanDB,
+    Material as MaterialDB,
+    Author as AuthorDB,
+    MaterialType as MaterialTypeDB,
+    User as UserDB,
+    LoanStatus as LoanStatusDB,
+)
+from database.load_options import LOAN_RESPONSE_OPTIONS
+from typing import Optional, Set
 from uuid import UUID
+from datetime import datetime
+from common import LoanSort, LoanExpand
+from common.pagination import encode_cursor, decode_cursor
 from common.middleware import require_admin, get_current_user
 from common.enums.roles_enum import RolEnum
 
 router = APIRouter(prefix="/loans", tags=["loans"])
 
-@router.get("/", response_model=List[LoanResponse])
-def get_loans(
+SORT_COLUMNS = {
+    LoanSort.newest: (LoanDB.loan_date, LoanDB.id),
+    LoanSort.due: (LoanDB.expected_return_date, LoanDB.id),
+}
+
+# Columnas de LoanSummary; todas están en ix_loans_user_history, así que el historial
+# de un usuario sin expand se resuelve con un index-only scan
+SUMMARY_COLUMNS = (
+    LoanDB.id,
+    LoanDB.material_id,
+    LoanDB.user_id,
+    LoanDB.status_id,
+    LoanDB.loan_date,
+    LoanDB.expected_return_date,
+    LoanDB.actual_return_date,
+)
+
+EXPAND_DESCRIPTION = "Objetos anidados a incluir, separados por coma: material,user,status"
+
+
+def _parse_expand(expand: Optional[str]) -> Set[LoanExpand]:
+    try:
+        return {LoanExpand(value.strip()) for value in (expand or "").split(",") if value.strip()}
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="expand solo admite material, user y status",
+        )
+
+
+def _summary_query(expand: Set[LoanExpand]):
+    """
+    Selecciona las columnas del resumen y, solo para lo pedido en expand, une las
+    tablas relacionadas y agrega sus columnas (sin cargar entidades del ORM).
+    """
+    stmt = select(*SUMMARY_COLUMNS)
+    if LoanExpand.material in expand:
+        stmt = (
+            stmt.join(MaterialDB, MaterialDB.id == LoanDB.material_id)
+            .join(AuthorDB, AuthorDB.id == MaterialDB.author_id)
+            .join(MaterialTypeDB, MaterialTypeDB.id == MaterialDB.type_id)
+            .add_columns(
+                MaterialDB.title.label("material_title"),
+                MaterialDB.author_id,
+                AuthorDB.name.label("author_name"),
+                MaterialDB.type_id,
+                MaterialTypeDB.name.label("type_name"),
+            )
+        )
+    if LoanExpand.user in expand:
+        stmt = stmt.join(UserDB, UserDB.id == LoanDB.user_id).add_columns(
+            UserDB.email.label("user_email"), UserDB.full_name.label("user_full_name")
+        )
+    if LoanExpand.status in expand:
+        stmt = stmt.join(LoanStatusDB, LoanStatusDB.id == LoanDB.status_id).add_columns(
+            LoanStatusDB.name.label("status_name")
+        )
+    return stmt
+
+
+def _summary(row, expand: Set[LoanExpand]) -> LoanSummary:
+    summary = LoanSummary(
+        id=row.id,
+        material_id=row.material_id,
+        user_id=row.user_id,
+        status_id=row.status_id,
+        loan_date=row.loan_date,
+        expected_return_date=row.expected_return_date,
+        actual_return_date=row.actual_return_date,
+    )
+    if LoanExpand.material in expand:
+        summary.material = LoanMaterialSummary(
+            id=row.material_id,
+            title=row.material_title,
+            author_id=row.author_id,
+            author_name=row.author_name,
+            type_id=row.type_id,
+            type_name=row.type_name,
+        )
+    if LoanExpand.user in expand:
+        summary.user = LoanUserSummary(
+            id=row.user_id, email=row.user_email, full_name=row.user_full_name
+        )
+    if LoanExpand.status in expand:
+        summary.status = LoanStatusSummary(id=row.status_id, name=row.status_name)
+    return summary
+
+
+def _paginate(stmt, sort: LoanSort, cursor: Optional[str], limit: int):
+    """
+    Aplica el orden, el cursor y el límite (más una fila para saber si hay página
+    siguiente). newest: (loan_date, id) descendente; due: (expected_return_date, id)
+    ascendente.
+    """
+    sort_columns = SORT_COLUMNS[sort]
+    if cursor:
+        last_value, last_id = decode_cursor(cursor, sort.value, 2)
+        try:
+            last_value = datetime.fromisoformat(last_value)
+            last_id = UUID(last_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor inválido para este criterio de orden",
+            )
+        if sort == LoanSort.newest:
+            stmt = stmt.where(tuple_(*sort_columns) < (last_value, last_id))
+        else:
+            stmt = stmt.where(tuple_(*sort_columns) > (last_value, last_id))
+
+    if sort == LoanSort.newest:
+        stmt = stmt.order_by(*(column.desc() for column in sort_columns))
+    else:
+        stmt = stmt.order_by(*sort_columns)
+    return stmt.limit(limit + 1)
+
+
+def _page(rows, sort: LoanSort, limit: int, expand: Set[LoanExpand]) -> LoanPage:
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        last_value = last.loan_date if sort == LoanSort.newest else last.expected_return_date
+        next_cursor = encode_cursor(sort.value, [last_value, last.id])
+    return LoanPage(items=[_summary(row, expand) for row in rows], next_cursor=next_cursor)
+
+
+@router.get("/", response_model=LoanPage)
+async def get_loans(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="Valor de next_cursor de la página anterior"),
+    sort: LoanSort = Query(LoanSort.newest),
+    status_id: Optional[UUID] = Query(None),
+    user_id: Optional[UUID] = Query(None),
+    material_id: Optional[UUID] = Query(None),
+    loaned_from: Optional[datetime] = Query(None, description="Fecha de préstamo desde (inclusive)"),
+    loaned_to: Optional[datetime] = Query(None, description="Fecha de préstamo hasta (exclusive)"),
+    due_from: Optional[datetime] = Query(None, description="Devolución esperada desde (inclusive)"),
+    due_to: Optional[datetime] = Query(None, description="Devolución esperada hasta (exclusive)"),
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION),
     _: TokenData = Depends(require_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
-    Obtiene la lista de todos los préstamos en el sistema.
+    Obtiene una página de préstamos, paginada por cursor (keyset) y filtrada.
+    Cada filtro tiene un índice con la clave de orden a continuación (migración 0008),
+    así que cada página cuesta lo mismo sin importar su profundidad ni el tamaño del
+    historial; el rango de fecha de préstamo además descarta particiones.
+    Cada préstamo es un resumen leído de las columnas de loans; `expand` agrega el
+    material (con nombres de autor y tipo), el usuario o el estado, uniendo solo esas
+    tablas.
     Solo accesible para administradores.
 
     Args:
+        limit: int - Número máximo de préstamos por página (1-200)
+        cursor: Optional[str] - Cursor opaco devuelto en next_cursor; omitir para la primera página
+        sort: LoanSort - Orden: newest (fecha de préstamo descendente) o due (devolución esperada ascendente)
+        status_id: Optional[UUID] - Filtra por estado del préstamo
+        user_id: Optional[UUID] - Filtra por usuario
+        material_id: Optional[UUID] - Filtra por material
+        loaned_from: Optional[datetime] - Fecha de préstamo desde (inclusive)
+        loaned_to: Optional[datetime] - Fecha de préstamo hasta (exclusive)
+        due_from: Optional[datetime] - Devolución esperada desde (inclusive)
+        due_to: Optional[datetime] - Devolución esperada hasta (exclusive)
+        expand: Optional[str] - material, user y/o status, separados por coma
         _: TokenData - Token del administrador 
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
 
     Returns:
-        List[LoanResponse] - Lista de préstamos
+        LoanPage - Préstamos de la página y cursor de la siguiente (None si es la última)
 
     Raises:
+        HTTPException(400) - Cursor o expand inválido
         HTTPException(500) - Error interno del servidor
     """
     try:
-        loans_db = db.query(LoanDB).all()
-        return [
-            LoanResponse.model_validate(loan, from_attributes=True) for loan in loans_db
-        ]
+        expanded = _parse_expand(expand)
+        stmt = _summary_query(expanded)
+        if status_id is not None:
+            stmt = stmt.where(LoanDB.status_id == status_id)
+        if user_id is not None:
+            stmt = stmt.where(LoanDB.user_id == user_id)
+        if material_id is not None:
+            stmt = stmt.where(LoanDB.material_id == material_id)
+        if loaned_from is not None:
+            stmt = stmt.where(LoanDB.loan_date >= loaned_from)
+        if loaned_to is not None:
+            stmt = stmt.where(LoanDB.loan_date < loaned_to)
+        if due_from is not None:
+            stmt = stmt.where(LoanDB.expected_return_date >= due_from)
+        if due_to is not None:
+            stmt = stmt.where(LoanDB.expected_return_date < due_to)
+
+        stmt = _paginate(stmt, sort, cursor, limit)
+        rows = (await db.execute(stmt)).all()
+        return _page(rows, sort, limit, expanded)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error al listar préstamos: {str(e)}"
         )
 
 
-@router.get("/user/{user_id}", response_model=List[LoanResponse])
-def get_user_loans(
+@router.get("/user/{user_id}", response_model=LoanPage)
+async def get_user_loans(
     user_id: UUID,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="Valor de next_cursor de la página anterior"),
+    expand: Optional[str] = Query(None, description=EXPAND_DESCRIPTION),
     current_user: TokenData = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
-    Obtiene la lista de préstamos de un usuario específico.
+    Obtiene el historial de préstamos de un usuario, del más reciente al más antiguo,
+    paginado por cursor sobre el índice (user_id, loan_date, id). Sin `expand` la
+    página se lee solo del índice, que incluye todas las columnas del resumen.
     Solo accesible para administradores o el propio usuario.
 
     Args:
         user_id: UUID - Identificador único del usuario
+        limit: int - Número máximo de préstamos por página (1-200)
+        cursor: Optional[str] - Cursor opaco devuelto en next_cursor; omitir para la primera página
+        expand: Optional[str] - material, user y/o status, separados por coma
         current_user: TokenData - Token del usuario actual 
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
 
     Returns:
-        List[LoanResponse] - Lista de préstamos del usuario
+        LoanPage - Préstamos de la página y cursor de la siguiente (None si es la última)
 
     Raises:
+        HTTPException(400) - Cursor o expand inválido
         HTTPException(403) - Acceso no autorizado
         HTTPException(404) - No se encontraron préstamos
         HTTPException(500) - Error interno del servidor
     """
     try:
-        if current_user.role_name != "admin" or current_user.id != user_id:
+        if current_user.role_name != RolEnum.admin and current_user.id != user_id:
             raise HTTPException(
                 status_code=403,
                 detail="No tienes permiso para acceder a los préstamos de este usuario",
             )
 
-        loans_db = db.query(LoanDB).filter(LoanDB.user_id == user_id).all()
-        if not loans_db:
+        expanded = _parse_expand(expand)
+        stmt = _summary_query(expanded).where(LoanDB.user_id == user_id)
+        stmt = _paginate(stmt, LoanSort.newest, cursor, limit)
+        rows = (await db.execute(stmt)).all()
+        if not rows and not cursor:
             raise HTTPException(
                 status_code=404, detail="No se encontraron préstamos para este usuario"
             )
-        return [
-            LoanResponse.model_validate(loan, from_attributes=True) for loan in loans_db
-        ]
+        return _page(rows, LoanSort.newest, limit, expanded)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error al obtener préstamos del usuario: {str(e)}"
@@ -85,17 +291,22 @@ def get_user_loans(
 
 
 @router.get("/{loan_id}", response_model=LoanResponse)
-def get_loan(
+async def get_loan(
     loan_id: UUID,
     current_user: TokenData = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Obtiene los detalles de un préstamo específico por su ID.
     Solo accesible para administradores o el usuario propietario del préstamo.
     """
     try:
-        loan = db.query(LoanDB).filter(LoanDB.id == str(loan_id)).first()
+        stmt = (
+            select(LoanDB)
+            .options(*LOAN_RESPONSE_OPTIONS)
+            .where(LoanDB.id == loan_id)
+        )
+        loan = (await db.execute(stmt)).scalars().first()
 
         if not loan:
             raise HTTPException(status_code=404, detail="Préstamo no encontrado")
@@ -0,0 +1,166 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from database.connection import get_write_db
+from models.schemas import BulkLoanCreate, BulkLoanItem, BulkLoanResult, TokenData
+from database.connection import Loan as LoanDB, Material as MaterialDB, User as UserDB
+from sqlalchemy import select, insert, update, case, cast
+from uuid import uuid4
+from common.middleware import require_admin
+
+router = APIRouter(prefix="/loans", tags=["loans"])
+
+
+@router.post("/bulk", response_model=BulkLoanResult)
+async def create_bulk_loans(
+    bulk: BulkLoanCreate,
+    current_user: TokenData = Depends(require_admin),
+    db: AsyncSession = Depends(get_write_db),
+):
+    """
+    Presta varios materiales a un mismo usuario en una sola transacción (mostrador de
+    circulación). El número de sentencias no depende del número de materiales: se
+    bloquean en orden de id solo los materiales disponibles, se insertan todos los
+    préstamos con un INSERT y se marcan los materiales como prestados con un UPDATE.
+    Dos lotes que se solapan bloquean en el mismo orden, y una devolución en bloque
+    solo bloquea materiales prestados (que este lote no bloquea), así que no pueden
+    caer en un interbloqueo.
+    Los materiales que no se pueden prestar no impiden prestar el resto; cada uno se
+    reporta con su código (404 no existe, 409 ya prestado, 400 repetido en la petición).
+    Solo accesible para administradores.
+
+    Args:
+        bulk: BulkLoanCreate - Usuario, materiales (hasta 100), fecha de devolución y estado
+        current_user: TokenData - Token del administrador
+        db: AsyncSession - Sesión de la base de datos
+
+    Returns:
+        BulkLoanResult - Resultado por material, en el orden de la petición
+
+    Raises:
+        HTTPException(400) - Error de integridad (por ejemplo, estado inexistente)
+        HTTPException(404) - Usuario no encontrado
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        stmt_user = select(UserDB.id).where(UserDB.id == bulk.user_id)
+        if (await db.execute(stmt_user)).scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="El usuario no existe"
+            )
+
+        requested = list(dict.fromkeys(bulk.material_ids))
+        stmt_available = (
+            select(MaterialDB.id)
+            .where(
+                MaterialDB.id.in_(requested),
+                MaterialDB.is_deleted == False,
+                MaterialDB.is_available == True,
+            )
+            .order_by(MaterialDB.id)
+            .with_for_update()
+        )
+        available = set((await db.scalars(stmt_available)).all())
+        loan_ids = {
+            material_id: uuid4() for material_id in requested if material_id in available
+        }
+        # Los no disponibles solo se consultan, sin bloquear, para distinguir 409 de 404
+        unavailable = [material_id for material_id in requested if material_id not in available]
+        found = set(available)
+        if unavailable:
+            stmt_existing = select(MaterialDB.id).where(
+                MaterialDB.id.in_(unavailable), MaterialDB.is_deleted == False
+            )
+            found.update((await db.scalars(stmt_existing)).all())
+
+        if loan_ids:
+            await db.execute(
+                insert(LoanDB),
+                [
+                    {
+                        "id": loan_id,
+                        "material_id": material_id,
+                        "user_id": bulk.user_id,
+                        "expected_return_date": bulk.expected_return_date,
+                        "status_id": bulk.status_id,
+                        "created_by": current_user.id,
+                        "updated_by": current_user.id,
+                    }
+                    for material_id, loan_id in loan_ids.items()
+                ],
+            )
+            await db.execute(
+                update(MaterialDB)
+                .where(MaterialDB.id.in_(loan_ids))
+                .values(
+                    is_available=False,
+                    # Préstamo de cada material: CASE id WHEN ... THEN loan_id
+                    active_loan_id=cast(
+                        case(loan_ids, value=MaterialDB.id), MaterialDB.active_loan_id.type
+                    ),
+                    updated_at=MaterialDB.updated_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+        await db.commit()
+
+        items = []
+        seen = set()
+        for material_id in bulk.material_ids:
+            if material_id in seen:
+                items.append(
+                    BulkLoanItem(
+                        id=material_id,
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        error="Material repetido en la petición",
+                    )
+                )
+                continue
+            seen.add(material_id)
+            if material_id in loan_ids:
+                items.append(
+                    BulkLoanItem(
+                        id=material_id,
+                        status_code=status.HTTP_201_CREATED,
+                        loan_id=loan_ids[material_id],
+                        material_id=material_id,
+                    )
+                )
+            elif material_id in found:
+                items.append(
+                    BulkLoanItem(
+                        id=material_id,
+                        status_code=status.HTTP_409_CONFLICT,
+                        material_id=material_id,
+                        error="El material ya está prestado",
+                    )
+                )
+            else:
+                items.append(
+                    BulkLoanItem(
+                        id=material_id,
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        error="El material no existe",
+                    )
+                )
+
+        succeeded = len(loan_ids)
+        return BulkLoanResult(
+            requested=len(items), succeeded=succeeded, failed=len(items) - succeeded, items=items
+        )
+
+    except HTTPException:
+        await db.rollback()
+        raise
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Error de integridad en la base de datos",
+        )
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
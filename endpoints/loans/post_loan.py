@@ -1,12 +1,13 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from database.connection import get_db
+from database.connection import get_write_db
 from models.schemas import LoanCreate, LoanResponse, TokenData
 from database.connection import Loan as LoanDB, Material as MaterialDB, User as UserDB
-from sqlalchemy import select
-from uuid import UUID
+from sqlalchemy import select, update
+from uuid import UUID, uuid4
 from common.middleware import require_admin
+from database.load_options import LOAN_RESPONSE_OPTIONS
 
 router = APIRouter(prefix="/loans", tags=["loans"])
 
@@ -15,75 +16,100 @@ router = APIRouter(prefix="/loans", tags=["loans"])
 async def create_loan(
     loan: LoanCreate,
     current_user: TokenData = Depends(require_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
     Crea un nuevo préstamo en el sistema. Solo accesible para administradores.
+    El material se reserva con un UPDATE condicional (is_available = true) que verifica
+    y marca el préstamo en una sola sentencia: de dos préstamos simultáneos del mismo
+    material solo uno modifica la fila y el otro recibe 409. El bloqueo de la fila dura
+    solo hasta el commit. El UPDATE solo asigna columnas de disponibilidad, que no
+    disparan el contador de versión del catálogo (migración 0009), así que préstamos de
+    otros materiales no esperan ningún bloqueo (benchmarks/checkout_contention.py).
 
     Args:
         loan: LoanCreate - Datos del préstamo a crear
         current_user: TokenData - Token del administrador
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
 
     Returns:
         LoanResponse - Detalles del préstamo creado
 
     Raises:
-        HTTPException(400) - Error de validación o material ya prestado
+        HTTPException(400) - Error de validación
         HTTPException(404) - Material o usuario no encontrado
+        HTTPException(409) - Material ya prestado
         HTTPException(500) - Error interno del servidor
     """
     try:
-        stmt_material = select(MaterialDB).where(MaterialDB.id == loan.material_id)
-        db_material = db.execute(stmt_material).scalar_one_or_none()
-        if not db_material:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="El material no existe"
-            )
-
-        stmt_user = select(UserDB).where(UserDB.id == loan.user_id)
-        db_user = db.execute(stmt_user).scalar_one_or_none()
-        if not db_user:
+        stmt_user = select(UserDB.id).where(UserDB.id == loan.user_id)
+        if (await db.execute(stmt_user)).scalar_one_or_none() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="El usuario no existe"
             )
 
-        stmt_loan = select(LoanDB).where(
-            LoanDB.material_id == loan.material_id, LoanDB.is_returned == False
+        # Reserva atómica: una transacción concurrente espera el bloqueo de la fila y,
+        # al reevaluar la condición, ya no la cumple
+        loan_id = uuid4()
+        reserved = await db.scalar(
+            update(MaterialDB)
+            .where(
+                MaterialDB.id == loan.material_id,
+                MaterialDB.is_deleted == False,
+                MaterialDB.is_available == True,
+            )
+            # updated_at no cambia: la disponibilidad no forma parte del catálogo
+            .values(is_available=False, active_loan_id=loan_id, updated_at=MaterialDB.updated_at)
+            .returning(MaterialDB.id)
+            .execution_options(synchronize_session=False)
         )
-        existing_loan = db.execute(stmt_loan).scalar_one_or_none()
-        if existing_loan:
+        if reserved is None:
+            stmt_material = select(MaterialDB.id).where(
+                MaterialDB.id == loan.material_id, MaterialDB.is_deleted == False
+            )
+            if (await db.execute(stmt_material)).scalar_one_or_none() is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="El material no existe"
+                )
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=status.HTTP_409_CONFLICT,
                 detail="El material ya está prestado",
             )
 
         db_loan = LoanDB(
+            id=loan_id,
             material_id=loan.material_id,
             user_id=loan.user_id,
             expected_return_date=loan.expected_return_date,
+            status_id=loan.status_id,
             created_by=current_user.id,
             updated_by=current_user.id,
         )
 
         db.add(db_loan)
-        db.flush()
-        db.commit()
-        db.refresh(db_loan)
+        await db.commit()
+
+        stmt = (
+            select(LoanDB)
+            .options(*LOAN_RESPONSE_OPTIONS)
+            .where(LoanDB.id == db_loan.id)
+            .execution_options(populate_existing=True)
+        )
+        db_loan = (await db.execute(stmt)).scalar_one()
 
         return LoanResponse.model_validate(db_loan, from_attributes=True)
 
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos",
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}",
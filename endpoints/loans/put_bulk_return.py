@@ -0,0 +1,157 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from database.connection import get_write_db
+from models.schemas import BulkLoanReturn, BulkLoanItem, BulkLoanResult, TokenData
+from database.connection import Loan as LoanDB, LoanStatus as LoanStatusDB, Material as MaterialDB
+from datetime import datetime, timezone
+from sqlalchemy import select, update
+from common.middleware import require_admin
+
+# Se registra antes que put_loan_router para que /loans/bulk/return no coincida
+# con /loans/{loan_id}/return
+router = APIRouter(prefix="/loans", tags=["loans"])
+
+
+@router.put("/bulk/return", response_model=BulkLoanResult)
+async def return_bulk_loans(
+    bulk: BulkLoanReturn,
+    current_user: TokenData = Depends(require_admin),
+    db: AsyncSession = Depends(get_write_db),
+):
+    """
+    Registra la devolución de varios préstamos en una sola transacción y marca sus
+    materiales como disponibles. Se bloquean los préstamos y después sus materiales en
+    orden de id, y se actualizan préstamos y materiales con un UPDATE cada uno, sin
+    importar cuántos sean.
+    Los préstamos que no se pueden devolver no impiden devolver el resto; cada uno se
+    reporta con su código (404 no existe, 400 ya devuelto o repetido en la petición).
+    Solo accesible para administradores.
+
+    Args:
+        bulk: BulkLoanReturn - Préstamos a devolver (hasta 100)
+        current_user: TokenData - Token del administrador
+        db: AsyncSession - Sesión de la base de datos
+
+    Returns:
+        BulkLoanResult - Resultado por préstamo, en el orden de la petición
+
+    Raises:
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        requested = list(dict.fromkeys(bulk.loan_ids))
+        stmt_loans = (
+            select(LoanDB.id, LoanDB.material_id, LoanDB.actual_return_date)
+            .where(LoanDB.id.in_(requested))
+            .order_by(LoanDB.id)
+            .with_for_update()
+        )
+        found = {row.id: row for row in await db.execute(stmt_loans)}
+        open_loans = {
+            loan_id: row.material_id
+            for loan_id, row in found.items()
+            if row.actual_return_date is None
+        }
+
+        if open_loans:
+            returned_status_id = await db.scalar(
+                select(LoanStatusDB.id).where(LoanStatusDB.name == "returned")
+            )
+            update_data = {
+                "updated_by": current_user.id,
+                "actual_return_date": datetime.now(timezone.utc),
+            }
+            if returned_status_id is not None:
+                update_data["status_id"] = returned_status_id
+
+            await db.execute(
+                update(LoanDB)
+                .where(LoanDB.id.in_(open_loans))
+                .values(**update_data)
+                .execution_options(synchronize_session=False)
+            )
+            # Solo los materiales cuyo préstamo abierto registrado es uno de estos,
+            # bloqueados en orden de id como en el préstamo en bloque
+            stmt_materials = (
+                select(MaterialDB.id)
+                .where(MaterialDB.active_loan_id.in_(open_loans))
+                .order_by(MaterialDB.id)
+                .with_for_update()
+            )
+            material_ids = (await db.scalars(stmt_materials)).all()
+            if material_ids:
+                await db.execute(
+                    update(MaterialDB)
+                    .where(
+                        MaterialDB.id.in_(material_ids),
+                        MaterialDB.active_loan_id.in_(open_loans),
+                    )
+                    .values(
+                        is_available=True, active_loan_id=None, updated_at=MaterialDB.updated_at
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+        await db.commit()
+
+        items = []
+        seen = set()
+        for loan_id in bulk.loan_ids:
+            if loan_id in seen:
+                items.append(
+                    BulkLoanItem(
+                        id=loan_id,
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        error="Préstamo repetido en la petición",
+                    )
+                )
+                continue
+            seen.add(loan_id)
+            if loan_id in open_loans:
+                items.append(
+                    BulkLoanItem(
+                        id=loan_id,
+                        status_code=status.HTTP_200_OK,
+                        loan_id=loan_id,
+                        material_id=open_loans[loan_id],
+                    )
+                )
+            elif loan_id in found:
+                items.append(
+                    BulkLoanItem(
+                        id=loan_id,
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        loan_id=loan_id,
+                        material_id=found[loan_id].material_id,
+                        error="El préstamo ya fue devuelto",
+                    )
+                )
+            else:
+                items.append(
+                    BulkLoanItem(
+                        id=loan_id,
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        error="Préstamo no encontrado",
+                    )
+                )
+
+        succeeded = len(open_loans)
+        return BulkLoanResult(
+            requested=len(items), succeeded=succeeded, failed=len(items) - succeeded, items=items
+        )
+
+    except HTTPException:
+        await db.rollback()
+        raise
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Error de integridad en la base de datos",
+        )
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
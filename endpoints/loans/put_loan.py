@@ -1,15 +1,16 @@
 # endpoints/loans/put_loan.py
 
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from database.connection import get_db
+from database.connection import get_write_db
 from models.schemas import LoanUpdate, LoanResponse, TokenData
-from database.connection import Loan as LoanDB
+from database.connection import Loan as LoanDB, LoanStatus as LoanStatusDB, Material as MaterialDB
 from datetime import datetime, timezone
-from sqlalchemy import select
+from sqlalchemy import select, update
 from uuid import UUID
 from common.middleware import require_admin
+from database.load_options import LOAN_RESPONSE_OPTIONS
 
 router = APIRouter(prefix="/loans", tags=["loans"])
 
@@ -18,15 +19,16 @@ router = APIRouter(prefix="/loans", tags=["loans"])
 async def return_loan(
     loan_id: UUID,
     current_user: TokenData = Depends(require_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ):
     """
-    Registra la devolución de un préstamo. Solo accesible para administradores.
+    Registra la devolución de un préstamo y, en la misma transacción, marca el material
+    como disponible. Solo accesible para administradores.
 
     Args:
         loan_id: UUID - Identificador único del préstamo a devolver
         current_user: TokenData - Token del administrador
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
 
     Returns:
         LoanResponse - Detalles actualizados del préstamo
@@ -37,46 +39,68 @@ async def return_loan(
         HTTPException(500) - Error interno del servidor
     """
     try:
-        stmt = select(LoanDB).where(LoanDB.id == loan_id)
-        db_loan = db.execute(stmt).scalar_one_or_none()
+        stmt = select(LoanDB).where(LoanDB.id == loan_id).with_for_update()
+        db_loan = (await db.execute(stmt)).scalar_one_or_none()
 
         if not db_loan:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Préstamo no encontrado"
             )
 
-        if bool(db_loan.is_returned):
+        if db_loan.actual_return_date is not None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="El préstamo ya fue devuelto",
             )
 
+        returned_status_id = await db.scalar(
+            select(LoanStatusDB.id).where(LoanStatusDB.name == "returned")
+        )
+
         update_data = {
-            "updated_by": str(current_user.id),
-            "is_returned": True,
+            "updated_by": current_user.id,
             "actual_return_date": datetime.now(timezone.utc),
             "updated_at": datetime.now(timezone.utc),
         }
+        if returned_status_id is not None:
+            update_data["status_id"] = returned_status_id
 
         for key, value in update_data.items():
             setattr(db_loan, key, value)
 
-        db.commit()
-        db.refresh(db_loan)
+        # Solo si este es el préstamo abierto registrado en el material
+        await db.execute(
+            update(MaterialDB)
+            .where(
+                MaterialDB.id == db_loan.material_id,
+                MaterialDB.active_loan_id == db_loan.id,
+            )
+            .values(is_available=True, active_loan_id=None, updated_at=MaterialDB.updated_at)
+        )
+
+        await db.commit()
+
+        stmt = (
+            select(LoanDB)
+            .options(*LOAN_RESPONSE_OPTIONS)
+            .where(LoanDB.id == db_loan.id)
+            .execution_options(populate_existing=True)
+        )
+        db_loan = (await db.execute(stmt)).scalar_one()
 
         return LoanResponse.model_validate(db_loan, from_attributes=True)
 
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos",
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}",
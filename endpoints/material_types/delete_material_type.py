@@ -1,8 +1,10 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
 from models.schemas import TokenData
-from database.connection import MaterialType as MaterialTypeDB, Material as MaterialDB, get_db
+from database.connection import MaterialType as MaterialTypeDB, Material as MaterialDB, get_write_db
 from common.middleware import require_admin
+from common.cache import invalidate_material_type
 from uuid import UUID
 
 router = APIRouter(prefix="/material-types", tags=["material-types"])
@@ -11,7 +13,7 @@ router = APIRouter(prefix="/material-types", tags=["material-types"])
 @router.delete("/{material_type_id}", status_code=status.HTTP_200_OK)
 async def delete_material_type(
     material_type_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -21,7 +23,7 @@ async def delete_material_type(
 
     Args:
         material_type_id: UUID - Identificador único del tipo de material
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -35,9 +37,7 @@ async def delete_material_type(
     """
     try:
         # Buscar el tipo de material existente
-        db_material_type = db.query(MaterialTypeDB).filter(
-            MaterialTypeDB.id == material_type_id
-        ).first()
+        db_material_type = await db.get(MaterialTypeDB, material_type_id)
         if not db_material_type:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -45,10 +45,14 @@ async def delete_material_type(
             )
 
         # Verificar si el tipo de material tiene materiales asociados
-        materials_count = db.query(MaterialDB).filter(
-            MaterialDB.type_id == material_type_id,
-            MaterialDB.is_deleted == False
-        ).count()
+        materials_count = await db.scalar(
+            select(func.count())
+            .select_from(MaterialDB)
+            .where(
+                MaterialDB.type_id == material_type_id,
+                MaterialDB.is_deleted == False
+            )
+        )
         
         if materials_count > 0:
             raise HTTPException(
@@ -57,15 +61,16 @@ async def delete_material_type(
             )
 
         # Eliminar el tipo de material
-        db.delete(db_material_type)
-        db.commit()
+        await db.delete(db_material_type)
+        await db.commit()
+        invalidate_material_type(material_type_id)
 
         return {"message": "Tipo de material eliminado correctamente"}
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
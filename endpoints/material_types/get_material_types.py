@@ -1,20 +1,24 @@
 from fastapi import APIRouter, HTTPException, status, Query, Depends
-from typing import List
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from models.schemas import MaterialType, TokenData
-from database.connection import MaterialType as MaterialTypeDB, get_db
+from database.connection import MaterialType as MaterialTypeDB, get_read_db
 from common.middleware import require_admin
+from common.etag import conditional_get
 
 router = APIRouter(prefix="/material-types", tags=["material-types"])
 
+MATERIAL_TYPES_ETAG = conditional_get("material_types")
+
 
 @router.get("/", response_model=List[MaterialType], status_code=status.HTTP_200_OK)
 async def get_material_types(
     _: TokenData = Depends(require_admin),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    etag: Optional[str] = Depends(MATERIAL_TYPES_ETAG),
 ):
     """
     Obtiene una lista paginada de todos los tipos de material del sistema.
@@ -24,7 +28,8 @@ async def get_material_types(
         _: TokenData - Token del administrador 
         skip: int - Número de registros a saltar (para paginación)
         limit: int - Número máximo de registros a retornar (10-100)
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
+        etag: Optional[str] - ETag de la respuesta; 304 si coincide con If-None-Match
 
     Returns:
         List[MaterialType] - Lista de tipos de material del sistema
@@ -40,7 +45,7 @@ async def get_material_types(
             .offset(skip)
             .limit(limit)
         )
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         material_types_db = result.scalars().all()
 
         material_types = [MaterialType.model_validate(mt, from_attributes=True) for mt in material_types_db]
@@ -57,8 +62,9 @@ async def get_material_types(
 @router.get("/{material_type_id}", response_model=MaterialType)
 async def get_material_type(
     material_type_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: TokenData = Depends(require_admin),
+    etag: Optional[str] = Depends(MATERIAL_TYPES_ETAG),
 ):
     """
     Obtiene los detalles de un tipo de material específico.
@@ -66,8 +72,9 @@ async def get_material_type(
 
     Args:
         material_type_id: str - Identificador único del tipo de material
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
         current_user: TokenData - Token del administrador 
+        etag: Optional[str] - ETag de la respuesta; 304 si coincide con If-None-Match
 
     Returns:
         MaterialType - Detalles del tipo de material solicitado
@@ -79,7 +86,7 @@ async def get_material_type(
     """
     try:
         stmt = select(MaterialTypeDB).where(MaterialTypeDB.id == material_type_id)
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         material_type_db = result.scalar_one_or_none()
 
         if not material_type_db:
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from models.schemas import MaterialTypeCreate, MaterialType, TokenData
-from database.connection import MaterialType as MaterialTypeDB, get_db
+from database.connection import MaterialType as MaterialTypeDB, get_write_db
 from common.middleware import require_admin
 from uuid import uuid4
 
@@ -12,7 +13,7 @@ router = APIRouter(prefix="/material-types", tags=["material-types"])
 @router.post("/", response_model=MaterialType, status_code=status.HTTP_201_CREATED)
 async def create_material_type(
     material_type: MaterialTypeCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -21,7 +22,7 @@ async def create_material_type(
 
     Args:
         material_type: MaterialTypeCreate - Datos del nuevo tipo de material
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -34,9 +35,13 @@ async def create_material_type(
     """
     try:
         # Verificar si el tipo de material ya existe
-        existing_material_type = db.query(MaterialTypeDB).filter(
-            MaterialTypeDB.name == material_type.name
-        ).first()
+        existing_material_type = (
+            await db.execute(
+                select(MaterialTypeDB).where(
+                    MaterialTypeDB.name == material_type.name
+                )
+            )
+        ).scalars().first()
         if existing_material_type:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -52,21 +57,21 @@ async def create_material_type(
         )
 
         db.add(db_material_type)
-        db.commit()
-        db.refresh(db_material_type)
+        await db.commit()
+        await db.refresh(db_material_type)
 
         return MaterialType.model_validate(db_material_type, from_attributes=True)
 
     except HTTPException:
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
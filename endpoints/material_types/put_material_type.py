@@ -1,9 +1,11 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from models.schemas import MaterialTypeUpdate, MaterialType, TokenData
-from database.connection import MaterialType as MaterialTypeDB, get_db
+from database.connection import MaterialType as MaterialTypeDB, get_write_db
 from common.middleware import require_admin
+from common.cache import invalidate_material_type
 from uuid import UUID
 
 router = APIRouter(prefix="/material-types", tags=["material-types"])
@@ -13,7 +15,7 @@ router = APIRouter(prefix="/material-types", tags=["material-types"])
 async def update_material_type(
     material_type_id: UUID,
     material_type_update: MaterialTypeUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -23,7 +25,7 @@ async def update_material_type(
     Args:
         material_type_id: UUID - Identificador único del tipo de material
         material_type_update: MaterialTypeUpdate - Datos a actualizar
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -37,9 +39,7 @@ async def update_material_type(
     """
     try:
         # Buscar el tipo de material existente
-        db_material_type = db.query(MaterialTypeDB).filter(
-            MaterialTypeDB.id == material_type_id
-        ).first()
+        db_material_type = await db.get(MaterialTypeDB, material_type_id)
         if not db_material_type:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -48,10 +48,14 @@ async def update_material_type(
 
         # Verificar si el nuevo nombre ya existe (si se está cambiando)
         if material_type_update.name and material_type_update.name != db_material_type.name:
-            existing_material_type = db.query(MaterialTypeDB).filter(
-                MaterialTypeDB.name == material_type_update.name,
-                MaterialTypeDB.id != material_type_id
-            ).first()
+            existing_material_type = (
+                await db.execute(
+                    select(MaterialTypeDB).where(
+                        MaterialTypeDB.name == material_type_update.name,
+                        MaterialTypeDB.id != material_type_id
+                    )
+                )
+            ).scalars().first()
             if existing_material_type:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -67,21 +71,22 @@ async def update_material_type(
         # Actualizar campos de auditoría
         db_material_type.updated_by = current_user.id
 
-        db.commit()
-        db.refresh(db_material_type)
+        await db.commit()
+        invalidate_material_type(material_type_id)
+        await db.refresh(db_material_type)
 
         return MaterialType.model_validate(db_material_type, from_attributes=True)
 
     except HTTPException:
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
@@ -1,11 +1,21 @@
+from .search_materials import router as search_materials_router
+from .get_material_facets import router as get_material_facets_router
+from .get_autocomplete import router as get_autocomplete_router
 from .get_material import router as get_materials_router
+from .get_material_availability import router as get_material_availability_router
 from .post_material import router as post_material_router
 from .put_material import router as put_material_router
 from .delete_material import router as delete_material_router
+from .import_materials import router as import_materials_router
 
 __all__ = [
+    "search_materials_router",
+    "get_material_facets_router",
+    "get_autocomplete_router",
     "get_materials_router",
+    "get_material_availability_router",
     "post_material_router", 
     "put_material_router",
-    "delete_material_router"
+    "delete_material_router",
+    "import_materials_router"
 ]
\ No newline at end of file
@@ -1,12 +1,14 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from models.schemas import TokenData
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database.connection import Material as MaterialDB
-from database.connection import get_db
+from database.connection import get_write_db
 from uuid import UUID
 from datetime import datetime, timezone
 from common.middleware import require_admin
-from sqlalchemy import select
+from common.cache import invalidate_material
+from common.autocomplete import title_index
+from sqlalchemy import select, update
 
 router = APIRouter(prefix="/materials", tags=["materials"])
 
@@ -14,7 +16,7 @@ router = APIRouter(prefix="/materials", tags=["materials"])
 @router.delete("/{material_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_material(
     material_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -23,7 +25,7 @@ async def delete_material(
 
     Args:
         material_id: UUID - Identificador único del material a eliminar
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
         current_user: TokenData - Token del administrador 
 
     Returns:
@@ -35,27 +37,31 @@ async def delete_material(
     """
     try:
         stmt = select(MaterialDB).where(MaterialDB.id == material_id, MaterialDB.is_deleted == False)
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         material = result.scalar_one_or_none()
 
         if not material:
             raise HTTPException(status_code=404, detail="Material no encontrado")
 
-        db.query(MaterialDB).filter(MaterialDB.id == material_id).update(
-            {
-                "is_deleted": True,
-                "updated_at": datetime.now(timezone.utc),
-                "updated_by": current_user.id,
-            },
-            synchronize_session="fetch",
+        await db.execute(
+            update(MaterialDB)
+            .where(MaterialDB.id == material_id)
+            .values(
+                is_deleted=True,
+                updated_at=datetime.now(timezone.utc),
+                updated_by=current_user.id,
+            )
+            .execution_options(synchronize_session="fetch")
         )
 
-        db.commit()
+        await db.commit()
+        invalidate_material(material_id)
+        title_index.apply_change(material_id, old_label=material.title)
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"Error al eliminar el material: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, HTTPException, status, Query
+from models.schemas import AutocompleteItem, AutocompleteResponse
+from common.autocomplete import title_index, author_index
+from config import settings
+
+
+# Se registra antes que get_materials_router para que /materials/autocomplete no
+# coincida con /materials/{material_id}
+router = APIRouter(prefix="/materials", tags=["materials"])
+
+
+@router.get("/autocomplete", response_model=AutocompleteResponse)
+async def get_autocomplete(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=20),
+):
+    """
+    Sugiere títulos de materiales y nombres de autores a partir de lo escrito, sin
+    distinguir mayúsculas ni tildes. El último término se toma como prefijo y los
+    anteriores como palabras completas. Se responde desde el índice en memoria del
+    proceso, sin consultar la base de datos.
+    Accesible para todos los usuarios.
+
+    Args:
+        q: str - Texto escrito por el usuario
+        limit: int - Número máximo de sugerencias por lista (1-20)
+
+    Returns:
+        AutocompleteResponse - Títulos y autores que coinciden
+
+    Raises:
+        HTTPException(503) - Autocompletado deshabilitado o índice aún en construcción
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        if not settings.AUTOCOMPLETE_ENABLED or not (title_index.ready and author_index.ready):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="El autocompletado no está disponible todavía",
+                headers={"Retry-After": "5"},
+            )
+
+        return AutocompleteResponse(
+            titles=[
+                AutocompleteItem(id=item_id, label=label)
+                for item_id, label in title_index.search(q, limit)
+            ],
+            authors=[
+                AutocompleteItem(id=item_id, label=label)
+                for item_id, label in author_index.search(q, limit)
+            ],
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
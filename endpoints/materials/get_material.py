@@ -1,43 +1,109 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from models.schemas import Material, MaterialCreate
-from sqlalchemy.orm import Session
-from database.connection import Material as MaterialDB
-from database.connection import get_db
-from sqlalchemy import select, func
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
+from models.schemas import Material, MaterialCreate, MaterialPage
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.connection import Material as MaterialDB, Author as AuthorDB
+from database.connection import get_read_db
+from database.load_options import MATERIAL_RESPONSE_OPTIONS
+from sqlalchemy import select, func, tuple_
+from typing import List, Optional
 from uuid import UUID
+from datetime import datetime
+from common import MaterialSort
+from common.pagination import encode_cursor, decode_cursor
+from common.cache import material_cache, author_cache, material_type_cache
+from config import settings
+from common.etag import conditional_get, get_table_versions, make_etag, apply_etag
 
 
 router = APIRouter(prefix="/materials", tags=["materials"])
 
+CATALOG_TABLES = ("materials", "authors", "material_types")
+
+# La disponibilidad no cambia la versión de materials (migración 0009): las
+# respuestas filtradas por disponibilidad no llevan ETag
+CATALOG_ETAG = conditional_get(*CATALOG_TABLES, uncacheable_params=("available",))
+
 
 @router.get("/{material_id}", response_model=Material)
-async def get_material(material_id: UUID, db: Session = Depends(get_db)):
+async def get_material(
+    material_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
     """
     Obtiene los detalles de un material específico por su ID.
+    El detalle se compone desde la caché del catálogo (material, autor y tipo) sin
+    consultar la base de datos; solo si falta alguna de las tres entradas se leen las
+    versiones del catálogo y el material. Cada entrada guarda la versión de su tabla al
+    leerla y el ETag se calcula con esas versiones, de modo que el cuerpo servido
+    siempre corresponde a su ETag.
     Accesible para todos los usuarios.
 
     Args:
         material_id: UUID - Identificador único del material
-        db: Session - Sesión de la base de datos 
+        request: Request - Petición (If-None-Match, ruta y parámetros del ETag)
+        response: Response - Respuesta a la que se agregan ETag y Cache-Control
+        db: AsyncSession - Sesión de la base de datos 
 
     Returns:
         Material - Detalles del material solicitado
 
     Raises:
+        HTTPException(304) - If-None-Match coincide con el ETag
         HTTPException(404) - Material no encontrado
         HTTPException(500) - Error interno del servidor
     """
     try:
-        stmt = select(MaterialDB).where(MaterialDB.id == material_id, MaterialDB.is_deleted == False)
-        result = db.execute(stmt)
+        if settings.CATALOG_CACHE_ENABLED:
+            cached = material_cache.get(material_id)
+            if cached is not None:
+                material_version, cached_material = cached
+                author = author_cache.get(cached_material.author_id)
+                material_type = material_type_cache.get(cached_material.type_id)
+                if author is not None and material_type is not None:
+                    versions = {
+                        "materials": material_version,
+                        "authors": author[0],
+                        "material_types": material_type[0],
+                    }
+                    apply_etag(request, response, make_etag(request, versions))
+                    return cached_material.model_copy(
+                        update={"author": author[1], "material_type": material_type[1]}
+                    )
+
+        # Versiones antes que las filas: el cuerpo nunca es más antiguo que su ETag
+        versions = await get_table_versions(db, CATALOG_TABLES)
+        apply_etag(request, response, make_etag(request, versions))
+
+        stmt = (
+            select(MaterialDB)
+            .options(*MATERIAL_RESPONSE_OPTIONS)
+            .where(MaterialDB.id == material_id, MaterialDB.is_deleted == False)
+        )
+        result = await db.execute(stmt)
         material = result.scalar_one_or_none()
 
         if not material:
             raise HTTPException(status_code=404, detail="Material no encontrado")
 
-        return Material.model_validate(material, from_attributes=True)
-
+        detail = Material.model_validate(material, from_attributes=True)
+        if settings.CATALOG_CACHE_ENABLED:
+            material_cache.set(
+                material_id,
+                (
+                    versions["materials"],
+                    detail.model_copy(update={"author": None, "material_type": None}),
+                ),
+            )
+            author_cache.set(detail.author.id, (versions["authors"], detail.author))
+            material_type_cache.set(
+                detail.material_type.id, (versions["material_types"], detail.material_type)
+            )
+        return detail
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -45,26 +111,95 @@ async def get_material(material_id: UUID, db: Session = Depends(get_db)):
         )
 
 
-@router.get("/", response_model=list[Material])
-async def get_all_materials(db: Session = Depends(get_db)):
+@router.get("/", response_model=MaterialPage)
+async def get_all_materials(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Valor de next_cursor de la página anterior"),
+    sort: MaterialSort = Query(MaterialSort.title),
+    type_id: Optional[UUID] = Query(None),
+    author_id: Optional[UUID] = Query(None),
+    available: Optional[bool] = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    etag: Optional[str] = Depends(CATALOG_ETAG),
+):
     """
-    Obtiene la lista de todos los materiales disponibles en el sistema.
+    Obtiene una página del catálogo de materiales, paginada por cursor (keyset).
+    Cada página cuesta lo mismo sin importar su profundidad: la siguiente se obtiene
+    comparando con la clave de orden de la última fila, usando el índice del orden.
     Accesible para todos los usuarios.
 
     Args:
-        db: Session - Sesión de la base de datos 
+        limit: int - Número máximo de materiales por página (1-100)
+        cursor: Optional[str] - Cursor opaco devuelto en next_cursor; omitir para la primera página
+        sort: MaterialSort - Orden: title (título, id) o newest (fecha de ingreso descendente, id)
+        type_id: Optional[UUID] - Filtra por tipo de material
+        author_id: Optional[UUID] - Filtra por autor
+        available: Optional[bool] - True: sin préstamo abierto; False: actualmente prestados
+        db: AsyncSession - Sesión de la base de datos
+        etag: Optional[str] - ETag de la respuesta; 304 si coincide con If-None-Match
 
     Returns:
-        list[Material] - Lista de materiales disponibles
+        MaterialPage - Materiales de la página y cursor de la siguiente (None si es la última)
 
     Raises:
+        HTTPException(400) - Cursor inválido
         HTTPException(500) - Error interno del servidor
     """
     try:
-        stmt = select(MaterialDB).where(MaterialDB.is_deleted == False)
-        result = db.execute(stmt).scalars().all()
-        return [Material.model_validate(m, from_attributes=True) for m in result]
+        if sort == MaterialSort.title:
+            sort_columns = (MaterialDB.title, MaterialDB.id)
+        else:
+            sort_columns = (MaterialDB.date_added, MaterialDB.id)
+
+        stmt = (
+            select(MaterialDB)
+            .options(*MATERIAL_RESPONSE_OPTIONS)
+            .where(MaterialDB.is_deleted == False)
+        )
+        if type_id is not None:
+            stmt = stmt.where(MaterialDB.type_id == type_id)
+        if author_id is not None:
+            stmt = stmt.where(MaterialDB.author_id == author_id)
+        if available is not None:
+            stmt = stmt.where(MaterialDB.is_available == available)
+
+        if cursor:
+            last_value, last_id = decode_cursor(cursor, sort.value, 2)
+            try:
+                if sort == MaterialSort.newest:
+                    last_value = datetime.fromisoformat(last_value)
+                last_id = UUID(last_id)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cursor inválido para este criterio de orden",
+                )
+            if sort == MaterialSort.title:
+                stmt = stmt.where(tuple_(*sort_columns) > (last_value, last_id))
+            else:
+                stmt = stmt.where(tuple_(*sort_columns) < (last_value, last_id))
+
+        if sort == MaterialSort.title:
+            stmt = stmt.order_by(*sort_columns)
+        else:
+            stmt = stmt.order_by(*(column.desc() for column in sort_columns))
+
+        # Una fila extra indica si hay una página siguiente
+        materials = (await db.execute(stmt.limit(limit + 1))).scalars().all()
+        next_cursor = None
+        if len(materials) > limit:
+            materials = materials[:limit]
+            last = materials[-1]
+            last_value = last.title if sort == MaterialSort.title else last.date_added
+            next_cursor = encode_cursor(sort.value, [last_value, last.id])
+
+        return MaterialPage(
+            items=[Material.model_validate(m, from_attributes=True) for m in materials],
+            next_cursor=next_cursor,
+        )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -73,15 +208,21 @@ async def get_all_materials(db: Session = Depends(get_db)):
 
 
 @router.get("/by-author/{author}", response_model=List[Material])
-def search_by_author(author: str, db: Session = Depends(get_db)):
+async def search_by_author(
+    author: str,
+    db: AsyncSession = Depends(get_read_db),
+    etag: Optional[str] = Depends(CATALOG_ETAG),
+):
     """
     Busca materiales por el nombre del autor.
-    Realiza una búsqueda parcial ignorando mayúsculas/minúsculas.
+    Realiza una búsqueda parcial ignorando mayúsculas/minúsculas y tildes, resuelta
+    con el índice de trigramas sobre el nombre del autor (migración 0005).
     Accesible para todos los usuarios.
 
     Args:
         author: str - Nombre o parte del nombre del autor a buscar
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
+        etag: Optional[str] - ETag de la respuesta; 304 si coincide con If-None-Match
 
     Returns:
         List[Material] - Lista de materiales que coinciden con el autor buscado
@@ -90,8 +231,19 @@ def search_by_author(author: str, db: Session = Depends(get_db)):
         HTTPException(404) - No se encontraron materiales para ese autor
         HTTPException(500) - Error interno del servidor
     """
-    stmt = select(MaterialDB).where(MaterialDB.author.ilike(f"%{author}%"))
-    result = db.execute(stmt).scalars().all()
+    pattern = "%" + author.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    stmt = (
+        select(MaterialDB)
+        .join(AuthorDB, AuthorDB.id == MaterialDB.author_id)
+        .options(*MATERIAL_RESPONSE_OPTIONS)
+        .where(
+            MaterialDB.is_deleted == False,
+            func.f_unaccent(func.lower(AuthorDB.name)).like(
+                func.f_unaccent(func.lower(pattern))
+            ),
+        )
+    )
+    result = (await db.execute(stmt)).scalars().all()
 
     if not result:
         raise HTTPException(
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from models.schemas import MaterialAvailability
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.connection import Material as MaterialDB
+from database.connection import get_read_db
+from sqlalchemy import select
+from uuid import UUID
+
+router = APIRouter(prefix="/materials", tags=["materials"])
+
+
+@router.get("/{material_id}/availability", response_model=MaterialAvailability)
+async def get_material_availability(
+    material_id: UUID,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Indica si un material está disponible (sin préstamo abierto).
+    La disponibilidad cambia con cada préstamo y devolución sin cambiar la versión del
+    catálogo (migración 0009), por eso no forma parte del detalle en caché ni lleva
+    ETag: se lee de la fila del material en cada petición, por clave primaria.
+    Accesible para todos los usuarios.
+
+    Args:
+        material_id: UUID - Identificador único del material
+        db: AsyncSession - Sesión de la base de datos
+
+    Returns:
+        MaterialAvailability - Id del material y disponibilidad
+
+    Raises:
+        HTTPException(404) - Material no encontrado
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        stmt = select(MaterialDB.is_available).where(
+            MaterialDB.id == material_id, MaterialDB.is_deleted == False
+        )
+        is_available = (await db.execute(stmt)).scalar_one_or_none()
+        if is_available is None:
+            raise HTTPException(status_code=404, detail="Material no encontrado")
+
+        return MaterialAvailability(material_id=material_id, is_available=is_available)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
@@ -0,0 +1,155 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from models.schemas import FacetCount, MaterialFacets
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.connection import (
+    Material as MaterialDB,
+    Author as AuthorDB,
+    MaterialType as MaterialTypeDB,
+)
+from database.connection import get_read_db
+from sqlalchemy import select, func, bindparam, or_, String
+from typing import Optional
+from uuid import UUID
+from config import settings
+from common.cache import facet_cache
+from endpoints.materials.search_materials import SEARCH_CONFIG
+
+
+# Se registra antes que get_materials_router para que /materials/facets no
+# coincida con /materials/{material_id}
+router = APIRouter(prefix="/materials", tags=["materials"])
+
+def _facets_query(
+    q: Optional[str],
+    type_id: Optional[UUID],
+    author_id: Optional[UUID],
+    available: Optional[bool],
+    author_limit: int,
+):
+    """
+    Una sola consulta con GROUPING SETS (type_id, author_id, is_available): PostgreSQL
+    recorre una vez los materiales filtrados y agrega los tres conteos. GROUPING()
+    indica a qué faceta pertenece cada fila; los autores se recortan a los
+    `author_limit` más frecuentes con row_number() antes de unir los nombres.
+    """
+    grouping_type = func.grouping(MaterialDB.type_id)
+    grouping_author = func.grouping(MaterialDB.author_id)
+    grouping_available = func.grouping(MaterialDB.is_available)
+    count = func.count()
+
+    grouped = select(
+        grouping_type.label("grouping_type"),
+        grouping_author.label("grouping_author"),
+        MaterialDB.type_id,
+        MaterialDB.author_id,
+        MaterialDB.is_available,
+        count.label("material_count"),
+        func.row_number()
+        .over(
+            partition_by=(grouping_type, grouping_author, grouping_available),
+            order_by=count.desc(),
+        )
+        .label("position"),
+    ).where(MaterialDB.is_deleted == False)
+
+    if q:
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, bindparam("q", q, type_=String))
+        grouped = grouped.where(MaterialDB.search_vector.op("@@")(ts_query))
+    if type_id is not None:
+        grouped = grouped.where(MaterialDB.type_id == type_id)
+    if author_id is not None:
+        grouped = grouped.where(MaterialDB.author_id == author_id)
+    if available is not None:
+        grouped = grouped.where(MaterialDB.is_available == available)
+
+    grouped = grouped.group_by(
+        func.grouping_sets(MaterialDB.type_id, MaterialDB.author_id, MaterialDB.is_available)
+    ).subquery()
+
+    return (
+        select(grouped, AuthorDB.name.label("author_name"), MaterialTypeDB.name.label("type_name"))
+        .outerjoin(AuthorDB, AuthorDB.id == grouped.c.author_id)
+        .outerjoin(MaterialTypeDB, MaterialTypeDB.id == grouped.c.type_id)
+        .where(or_(grouped.c.grouping_author == 1, grouped.c.position <= author_limit))
+        .order_by(grouped.c.material_count.desc())
+    )
+
+
+@router.get("/facets", response_model=MaterialFacets)
+async def get_material_facets(
+    q: Optional[str] = Query(None, min_length=2, max_length=200),
+    type_id: Optional[UUID] = Query(None),
+    author_id: Optional[UUID] = Query(None),
+    available: Optional[bool] = Query(None),
+    author_limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Obtiene el número de materiales por tipo, por autor y por disponibilidad que
+    cumplen el filtro (los mismos de /materials y el texto de /materials/search), en
+    una sola consulta agrupada.
+    El resultado se guarda en caché por parámetros durante
+    FACET_CACHE_TTL segundos, sin consultar table_versions: los conteos (incluida la
+    disponibilidad, que no cambia la versión del catálogo) pueden tener hasta esa
+    antigüedad, y por eso la respuesta no lleva ETag.
+    Accesible para todos los usuarios.
+
+    Args:
+        q: Optional[str] - Texto de búsqueda (misma sintaxis que /materials/search)
+        type_id: Optional[UUID] - Filtra por tipo de material
+        author_id: Optional[UUID] - Filtra por autor
+        available: Optional[bool] - Filtra por disponibilidad
+        author_limit: int - Número máximo de autores, los de más materiales (1-100)
+        db: AsyncSession - Sesión de la base de datos
+
+    Returns:
+        MaterialFacets - Total y conteos por tipo, autor y disponibilidad
+
+    Raises:
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        use_cache = settings.CATALOG_CACHE_ENABLED
+        if use_cache:
+            key = (q, type_id, author_id, available, author_limit)
+            cached = facet_cache.get(key)
+            if cached is not None:
+                return cached
+
+        rows = (
+            await db.execute(_facets_query(q, type_id, author_id, available, author_limit))
+        ).all()
+
+        material_types, authors, availability = [], [], []
+        for row in rows:
+            if row.grouping_type == 0:
+                material_types.append(
+                    FacetCount(value=str(row.type_id), label=row.type_name, count=row.material_count)
+                )
+            elif row.grouping_author == 0:
+                authors.append(
+                    FacetCount(value=str(row.author_id), label=row.author_name, count=row.material_count)
+                )
+            else:
+                availability.append(
+                    FacetCount(value="true" if row.is_available else "false", count=row.material_count)
+                )
+
+        # Cada material cae en exactamente un grupo de disponibilidad
+        facets = MaterialFacets(
+            total=sum(facet.count for facet in availability),
+            material_types=material_types,
+            authors=authors,
+            availability=availability,
+        )
+        if use_cache:
+            facet_cache.set(key, facets)
+        return facets
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
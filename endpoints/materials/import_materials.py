@@ -0,0 +1,452 @@
+import asyncio
+import csv
+import json
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.schemas import MaterialImportError, MaterialImportResult, TokenData
+from database.connection import (
+    Author as AuthorDB,
+    Material as MaterialDB,
+    MaterialType as MaterialTypeDB,
+    get_write_db,
+)
+from common import ImportFormat
+from common.middleware import require_admin
+from common.autocomplete import title_index, author_index
+from config import settings
+
+router = APIRouter(prefix="/materials", tags=["materials"])
+
+logger = logging.getLogger(__name__)
+
+MATERIAL_COLUMNS = [
+    "id", "title", "author_id", "type_id", "is_deleted", "date_added",
+    "created_by", "updated_by", "updated_at",
+]
+
+REQUIRED_FIELDS = ("title", "author", "type")
+
+# Longitudes máximas de las columnas de destino
+MAX_LENGTHS = {"title": 200, "author": 100, "type": 50}
+
+CONTENT_TYPES = {
+    "text/csv": ImportFormat.csv,
+    "application/csv": ImportFormat.csv,
+    "application/x-ndjson": ImportFormat.ndjson,
+    "application/ndjson": ImportFormat.ndjson,
+    "application/jsonl": ImportFormat.ndjson,
+}
+
+
+class _ImportState:
+    """
+    Estado acumulado entre lotes: ids de autores y tipos ya resueltos, títulos vistos
+    en el archivo y contadores del resultado.
+    """
+
+    def __init__(self, user_id: UUID):
+        self.user_id = user_id
+        self.author_ids: Dict[str, UUID] = {}
+        self.type_ids: Dict[str, UUID] = {}
+        self.seen_titles: set = set()
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.authors_created = 0
+        self.material_types_created = 0
+        self.batches = 0
+        self.errors: List[MaterialImportError] = []
+        self.errors_truncated = False
+
+    def fail(self, line: int, title: Optional[str], error: str):
+        self.failed += 1
+        if len(self.errors) < settings.MATERIAL_IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append(MaterialImportError(line=line, title=title, error=error))
+        else:
+            self.errors_truncated = True
+
+
+async def _iter_lines(request: Request) -> AsyncIterator[Tuple[int, bytes]]:
+    """Recorre el cuerpo de la petición por líneas a medida que llega, sin cargarlo completo."""
+    buffer = b""
+    number = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            yield number, line
+    if buffer:
+        yield number + 1, buffer
+
+
+async def _iter_text_lines(
+    request: Request, state: _ImportState
+) -> AsyncIterator[Tuple[int, str, bool]]:
+    """
+    Decodifica las líneas del cuerpo. Las que no son UTF-8 se registran como error y se
+    entregan decodificadas con reemplazos y marcadas como inválidas, para que quien las
+    consume descarte su registro sin perder la estructura de comillas.
+    """
+    async for number, raw in _iter_lines(request):
+        encoding = "utf-8-sig" if number == 1 else "utf-8"
+        try:
+            yield number, raw.decode(encoding).rstrip("\r"), True
+        except UnicodeDecodeError:
+            state.rows += 1
+            state.fail(number, None, "Codificación inválida (se espera UTF-8)")
+            yield number, raw.decode(encoding, errors="replace").rstrip("\r"), False
+
+
+def _ends_in_quoted_field(line: str, in_quotes: bool) -> bool:
+    """
+    Indica si al final de `line` sigue abierto un campo entre comillas, con las reglas
+    del dialecto por defecto de csv: una comilla solo abre un campo al inicio del campo
+    (una comilla dentro de un campo sin comillas, como en `12" vinilo`, es literal) y
+    dentro de un campo entre comillas "" es una comilla escapada.
+    """
+    field_start = not in_quotes
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if in_quotes:
+            if char == '"':
+                if line[i + 1:i + 2] == '"':
+                    i += 2
+                    continue
+                in_quotes = False
+        elif char == '"' and field_start:
+            in_quotes = True
+        field_start = char == "," and not in_quotes
+        i += 1
+    return in_quotes
+
+
+async def _iter_csv_records(
+    request: Request, state: _ImportState
+) -> AsyncIterator[Tuple[int, List[str]]]:
+    """
+    Lee el CSV con un solo csv.reader que consume las líneas a medida que llegan, de
+    modo que un campo entre comillas puede contener saltos de línea. Las líneas se
+    acumulan hasta que ningún campo entre comillas queda abierto y solo entonces se le
+    pide la fila al lector, que nunca se queda sin líneas a mitad de un registro. Si el
+    lector no consume todas las líneas acumuladas, las sobrantes se reportan como error.
+    Cada registro se reporta con el número de su primera línea; los que tienen una
+    línea que no es UTF-8 se descartan.
+    """
+    pending: deque = deque()
+    reader = csv.reader(iter(pending.popleft, None))
+    start = None
+    in_quotes = False
+    valid = True
+    async for number, line, line_valid in _iter_text_lines(request, state):
+        pending.append(line + "\n")
+        if start is None:
+            start = number
+        in_quotes = _ends_in_quoted_field(line, in_quotes)
+        valid = valid and line_valid
+        if in_quotes:
+            continue
+        values = next(reader)
+        record_start, record_valid = start, valid
+        start, valid = None, True
+        if pending:
+            # El lector cerró el registro antes que el escáner: no se pierden líneas
+            state.rows += 1
+            state.fail(
+                record_start, None, f"Registro CSV mal formado ({len(pending)} líneas sin leer)"
+            )
+            pending.clear()
+            continue
+        if record_valid and any(value.strip() for value in values):
+            yield record_start, values
+    if start is not None:
+        state.rows += 1
+        state.fail(start, None, "Comillas sin cerrar al final del archivo")
+
+
+async def _iter_rows(
+    request: Request, import_format: ImportFormat, state: _ImportState
+) -> AsyncIterator[Tuple[int, dict]]:
+    """
+    Convierte los registros en diccionarios. Las líneas que no se pueden leer se
+    registran como error y se omiten. En CSV el primer registro es el encabezado y un
+    registro puede ocupar varias líneas (campos entre comillas con saltos de línea); en
+    NDJSON cada línea es un objeto.
+    """
+    if import_format == ImportFormat.csv:
+        header = None
+        async for number, values in _iter_csv_records(request, state):
+            if header is None:
+                header = [value.strip().lower() for value in values]
+                missing = [field for field in REQUIRED_FIELDS if field not in header]
+                if missing:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Faltan columnas en el encabezado: {', '.join(missing)}",
+                    )
+                continue
+            state.rows += 1
+            yield number, dict(zip(header, values))
+        return
+
+    async for number, line, valid in _iter_text_lines(request, state):
+        if not valid or not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            state.rows += 1
+            state.fail(number, None, "JSON inválido")
+            continue
+        if not isinstance(row, dict):
+            state.rows += 1
+            state.fail(number, None, "Se espera un objeto JSON por línea")
+            continue
+
+        state.rows += 1
+        yield number, row
+
+
+def _validate(row: dict) -> Tuple[Optional[Tuple[str, str, str]], Optional[str]]:
+    """
+    Normaliza y valida una fila.
+
+    Returns:
+        Tuple: (título, autor, tipo) y None, o None y el mensaje de error.
+    """
+    values = {}
+    for field in REQUIRED_FIELDS:
+        value = row.get(field)
+        value = "" if value is None else str(value).strip()
+        if not value:
+            return None, f"Falta el campo {field}"
+        if len(value) > MAX_LENGTHS[field]:
+            return None, f"El campo {field} supera {MAX_LENGTHS[field]} caracteres"
+        values[field] = value
+    return (values["title"], values["author"], values["type"]), None
+
+
+async def _resolve_names(
+    db: AsyncSession, model, names: set, known: Dict[str, UUID], user_id: UUID
+) -> List[str]:
+    """
+    Resuelve en bloque los ids de autores o tipos por nombre exacto y crea los que no
+    existen.
+
+    Returns:
+        List[str]: Nombres creados (para descartarlos de `known` si el lote falla).
+    """
+    missing = [name for name in names if name not in known]
+    if not missing:
+        return []
+
+    rows = await db.execute(select(model.name, model.id).where(model.name.in_(missing)))
+    for name, model_id in rows:
+        known.setdefault(name, model_id)
+
+    created = [name for name in missing if name not in known]
+    if created:
+        now = datetime.now(timezone.utc)
+        values = [
+            {"id": uuid4(), "name": name, "created_by": user_id, "updated_by": user_id, "updated_at": now}
+            for name in created
+        ]
+        await db.execute(insert(model), values)
+        for value in values:
+            known[value["name"]] = value["id"]
+    return created
+
+
+async def _import_batch(
+    db: AsyncSession, batch: List[Tuple[int, str, str, str]], state: _ImportState
+):
+    """
+    Importa un lote en su propia transacción: descarta los títulos ya existentes,
+    resuelve o crea autores y tipos, carga los materiales con COPY y confirma. Si el
+    lote falla se revierte completo y todas sus filas, salvo las ya reportadas como
+    existentes, se reportan como error.
+    """
+    state.batches += 1
+    created_authors: List[str] = []
+    created_types: List[str] = []
+    rows = []
+    duplicate_lines = set()
+    try:
+        existing = set(
+            (
+                await db.scalars(
+                    select(MaterialDB.title).where(
+                        MaterialDB.is_deleted == False,
+                        MaterialDB.title.in_([title for _, title, _, _ in batch]),
+                    )
+                )
+            ).all()
+        )
+        for line, title, author, type_name in batch:
+            if title in existing:
+                duplicate_lines.add(line)
+                state.fail(line, title, "El material ya existe")
+            else:
+                rows.append((line, title, author, type_name))
+        if not rows:
+            await db.rollback()
+            return
+
+        created_authors = await _resolve_names(
+            db, AuthorDB, {author for _, _, author, _ in rows}, state.author_ids, state.user_id
+        )
+        created_types = await _resolve_names(
+            db, MaterialTypeDB, {type_name for _, _, _, type_name in rows}, state.type_ids, state.user_id
+        )
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        records = [
+            (
+                uuid4(), title, state.author_ids[author], state.type_ids[type_name],
+                False, now, state.user_id, state.user_id, now,
+            )
+            for _, title, author, type_name in rows
+        ]
+        connection = await db.connection()
+        raw_connection = (await connection.get_raw_connection()).driver_connection
+        await raw_connection.copy_records_to_table(
+            MaterialDB.__tablename__, records=records, columns=MATERIAL_COLUMNS
+        )
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        for name in created_authors:
+            state.author_ids.pop(name, None)
+        for name in created_types:
+            state.type_ids.pop(name, None)
+        # Desde el lote: si el error ocurre antes de separar las filas, rows está vacío
+        for line, title, _, _ in batch:
+            if line in duplicate_lines:
+                continue
+            state.seen_titles.discard(title)
+            state.fail(line, title, f"Lote rechazado: {str(e)}")
+        return
+
+    # Fuera del try: el lote ya está confirmado, un fallo del índice no lo rechaza
+    state.imported += len(records)
+    state.authors_created += len(created_authors)
+    state.material_types_created += len(created_types)
+    try:
+        await asyncio.to_thread(
+            author_index.apply_changes,
+            [(state.author_ids[name], None, name) for name in created_authors],
+        )
+        await asyncio.to_thread(
+            title_index.apply_changes, [(record[0], None, record[1]) for record in records]
+        )
+    except Exception:
+        # La reconstrucción periódica (AUTOCOMPLETE_REFRESH_SECONDS) recupera el índice
+        logger.exception("No se pudo actualizar el autocompletado tras importar un lote")
+
+
+@router.post("/import", response_model=MaterialImportResult, status_code=status.HTTP_200_OK)
+async def import_materials(
+    request: Request,
+    format: Optional[ImportFormat] = Query(
+        None, description="csv o ndjson; por defecto se deduce del Content-Type"
+    ),
+    current_user: TokenData = Depends(require_admin),
+    db: AsyncSession = Depends(get_write_db),
+):
+    """
+    Importa materiales en bloque desde un archivo CSV (encabezado title,author,type) o
+    NDJSON (un objeto {"title", "author", "type"} por línea) enviado como cuerpo de la
+    petición. El cuerpo se procesa a medida que llega, en lotes de
+    MATERIAL_IMPORT_BATCH_SIZE filas con una transacción por lote: los autores y tipos
+    se resuelven por nombre o se crean en bloque y los materiales se cargan con COPY.
+    Las filas inválidas o con título existente (también repetido en el archivo) se
+    reportan sin detener la importación.
+    Solo accesible para administradores.
+
+    Args:
+        request: Request - Petición cuyo cuerpo es el archivo a importar
+        format: Optional[ImportFormat] - Formato del archivo (csv o ndjson)
+        current_user: TokenData - Token del administrador
+        db: AsyncSession - Sesión de la base de datos
+
+    Returns:
+        MaterialImportResult - Filas leídas, importadas y rechazadas, con el detalle de los errores
+
+    Raises:
+        HTTPException(400) - Encabezado CSV sin las columnas requeridas
+        HTTPException(403) - Usuario no autorizado
+        HTTPException(415) - Formato no soportado
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        import_format = format
+        if import_format is None:
+            content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+            import_format = CONTENT_TYPES.get(content_type)
+        if import_format is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Formato no soportado: usa text/csv, application/x-ndjson o el parámetro format",
+            )
+
+        start = time.perf_counter()
+        state = _ImportState(current_user.id)
+        state.type_ids = {
+            name: type_id
+            for name, type_id in await db.execute(select(MaterialTypeDB.name, MaterialTypeDB.id))
+        }
+        await db.rollback()
+
+        batch = []
+        async for line, row in _iter_rows(request, import_format, state):
+            values, error = _validate(row)
+            if error:
+                state.fail(line, row.get("title") if isinstance(row.get("title"), str) else None, error)
+                continue
+            title, author, type_name = values
+            if title in state.seen_titles:
+                state.fail(line, title, "Título repetido en el archivo")
+                continue
+            state.seen_titles.add(title)
+            batch.append((line, title, author, type_name))
+
+            if len(batch) >= settings.MATERIAL_IMPORT_BATCH_SIZE:
+                await _import_batch(db, batch, state)
+                batch = []
+        if batch:
+            await _import_batch(db, batch, state)
+
+        elapsed = time.perf_counter() - start
+        return MaterialImportResult(
+            rows=state.rows,
+            imported=state.imported,
+            failed=state.failed,
+            authors_created=state.authors_created,
+            material_types_created=state.material_types_created,
+            batches=state.batches,
+            elapsed_ms=round(elapsed * 1000, 1),
+            rows_per_second=round(state.rows / elapsed, 1) if elapsed > 0 else 0.0,
+            errors=state.errors,
+            errors_truncated=state.errors_truncated,
+        )
+
+    except HTTPException:
+        await db.rollback()
+        raise
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from models.schemas import Material, MaterialCreate, TokenData
-from common import MaterialType
-from sqlalchemy.orm import Session
-from database.connection import get_db, Material as MaterialDB
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.connection import get_write_db, Material as MaterialDB
+from database.load_options import MATERIAL_RESPONSE_OPTIONS
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from common.middleware import require_admin
+from common.autocomplete import title_index
 
 router = APIRouter(prefix="/materials", tags=["materials"])
 
@@ -13,7 +14,7 @@ router = APIRouter(prefix="/materials", tags=["materials"])
 @router.post("/", response_model=Material, status_code=status.HTTP_201_CREATED)
 async def create_material(
     material: MaterialCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -22,33 +23,22 @@ async def create_material(
 
     Args:
         material: MaterialCreate - Datos del material a crear
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
         current_user: TokenData - Token del administrador 
 
     Returns:
         Material - Detalles del material creado
 
     Raises:
-        HTTPException(400) - Tipo de material inválido o material duplicado
+        HTTPException(400) - Material duplicado o referencias inválidas
         HTTPException(403) - Usuario no autorizado
         HTTPException(500) - Error interno del servidor
     """
     try:
-        valid_types = [t.value for t in MaterialType]
-        if material.type.value not in valid_types:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Tipo inválido. Debe ser uno de: {valid_types}",
-            )
-
-        exists = (
-            db.query(MaterialDB)
-            .filter(
-                MaterialDB.title == material.title, MaterialDB.is_deleted == False
-            )
-            .first()
-            is not None
+        stmt = select(MaterialDB.id).where(
+            MaterialDB.title == material.title, MaterialDB.is_deleted == False
         )
+        exists = (await db.execute(stmt)).first() is not None
 
         if exists:
             raise HTTPException(
@@ -56,37 +46,40 @@ async def create_material(
             )
 
         db_material = MaterialDB(
-            title=material.title, author=material.author, type=material.type.value
+            title=material.title,
+            author_id=material.author_id,
+            type_id=material.type_id,
+            created_by=current_user.id,
+            updated_by=current_user.id,
         )
 
         db.add(db_material)
-        db.flush()
+        await db.commit()
+        title_index.apply_change(db_material.id, new_label=db_material.title)
 
-        setattr(
-            db_material, "created_by", str(current_user.id)
-        )
-        setattr(
-            db_material, "updated_by", str(current_user.id)
+        stmt = (
+            select(MaterialDB)
+            .options(*MATERIAL_RESPONSE_OPTIONS)
+            .where(MaterialDB.id == db_material.id)
+            .execution_options(populate_existing=True)
         )
-
-        db.commit()
-        db.refresh(db_material)
+        db_material = (await db.execute(stmt)).scalar_one()
 
         created_material = Material.model_validate(db_material, from_attributes=True)
 
         return created_material
 
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos",
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}",
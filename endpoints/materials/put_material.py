@@ -1,14 +1,17 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from models.schemas import Material, MaterialUpdate, TokenData
 from common import MaterialType
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database.connection import Material as MaterialDB
-from database.connection import get_db
+from database.connection import get_write_db
+from database.load_options import MATERIAL_RESPONSE_OPTIONS
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import update, select
 from uuid import UUID
 from datetime import datetime, timezone
 from common.middleware import require_admin
+from common.cache import invalidate_material
+from common.autocomplete import title_index
 
 router = APIRouter(prefix="/materials", tags=["materials"])
 
@@ -17,12 +20,12 @@ router = APIRouter(prefix="/materials", tags=["materials"])
 async def update_material(
     material_id: UUID,
     updated_data: MaterialUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     try:
         stmt = select(MaterialDB).where(MaterialDB.id == material_id)
-        material = db.execute(stmt).scalar_one_or_none()
+        material = (await db.execute(stmt)).scalar_one_or_none()
         if material is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Material no encontrado"
@@ -32,6 +35,7 @@ async def update_material(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Material no encontrado"
             )
 
+        old_title = material.title
         update_data_dict = updated_data.model_dump(exclude_unset=True)
 
         if "type" in update_data_dict and isinstance(update_data_dict["type"], MaterialType):
@@ -50,25 +54,36 @@ async def update_material(
             .values(**update_data_dict)
             .returning(MaterialDB)
         )
-        result = db.execute(stmt)
-        db.commit()
-
+        result = await db.execute(stmt)
         updated_material = result.scalar_one_or_none()
+        await db.commit()
+        invalidate_material(material_id)
+
         if not updated_material:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Material no encontrado"
             )
 
+        stmt = (
+            select(MaterialDB)
+            .options(*MATERIAL_RESPONSE_OPTIONS)
+            .where(MaterialDB.id == material_id)
+            .execution_options(populate_existing=True)
+        )
+        updated_material = (await db.execute(stmt)).scalar_one()
+        if updated_material.title != old_title:
+            title_index.apply_change(material_id, old_title, updated_material.title)
+
         return Material.model_validate(updated_material, from_attributes=True)
 
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos",
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}",
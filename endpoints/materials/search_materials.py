@@ -0,0 +1,182 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from models.schemas import Material, MaterialSearchPage, MaterialSearchResult
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.connection import Material as MaterialDB, Author as AuthorDB
+from database.connection import get_read_db
+from database.load_options import MATERIAL_RESPONSE_OPTIONS
+from sqlalchemy import select, func, union, literal_column, bindparam, or_, and_, String
+from typing import Optional
+from uuid import UUID
+from config import settings
+from common.pagination import encode_cursor, decode_cursor
+from common.etag import conditional_get
+
+
+# Se registra antes que get_materials_router para que /materials/search no
+# coincida con /materials/{material_id}
+router = APIRouter(prefix="/materials", tags=["materials"])
+
+CATALOG_ETAG = conditional_get("materials", "authors", "material_types")
+
+# Configuración de texto de la migración 0005: español sin tildes
+SEARCH_CONFIG = literal_column("'es_unaccent'::regconfig")
+
+MODE_FULLTEXT = "fulltext"
+MODE_FUZZY = "fuzzy"
+
+
+def _normalized(expression):
+    """Misma expresión que los índices de trigramas: f_unaccent(lower(...))."""
+    return func.f_unaccent(func.lower(expression))
+
+
+def _fulltext_candidates(q: str):
+    """
+    Materiales cuyo search_vector coincide con la consulta (índice GIN), con su
+    relevancia ts_rank_cd. Se conservan las SEARCH_MAX_CANDIDATES coincidencias más
+    relevantes (empates por id), de modo que el recorte es determinista y no descarta
+    los mejores resultados. El costo es calcular ts_rank_cd de todas las coincidencias;
+    el límite acota la ordenación (top-N en memoria), los joins y la paginación.
+    """
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, bindparam("q", q, type_=String))
+    rank = func.ts_rank_cd(MaterialDB.search_vector, ts_query)
+    return (
+        select(MaterialDB.id.label("id"), rank.label("rank"))
+        .where(MaterialDB.is_deleted == False, MaterialDB.search_vector.op("@@")(ts_query))
+        .order_by(rank.desc(), MaterialDB.id)
+        .limit(settings.SEARCH_MAX_CANDIDATES)
+        .subquery()
+    )
+
+
+def _fuzzy_candidates(q: str):
+    """
+    Materiales cuyo título o nombre de autor se parece a la consulta por trigramas
+    (tolera errores de escritura). Cada rama usa su índice de trigramas; la relevancia
+    es la mayor word_similarity entre título y autor. Como en la búsqueda de texto
+    completo, se conservan las SEARCH_MAX_CANDIDATES coincidencias más relevantes
+    (empates por id): la similitud se calcula para todas las coincidencias, que el
+    umbral de word_similarity ya acota.
+    """
+    normalized_q = _normalized(bindparam("q", q, type_=String))
+    title = _normalized(MaterialDB.title)
+    author_name = _normalized(AuthorDB.name)
+
+    matches = union(
+        select(MaterialDB.id).where(
+            MaterialDB.is_deleted == False, normalized_q.op("<%")(title)
+        ),
+        select(MaterialDB.id)
+        .join(AuthorDB, AuthorDB.id == MaterialDB.author_id)
+        .where(MaterialDB.is_deleted == False, normalized_q.op("<%")(author_name)),
+    ).subquery()
+
+    rank = func.greatest(
+        func.word_similarity(normalized_q, title),
+        func.word_similarity(normalized_q, author_name),
+    )
+    return (
+        select(MaterialDB.id.label("id"), rank.label("rank"))
+        .join(AuthorDB, AuthorDB.id == MaterialDB.author_id)
+        .where(MaterialDB.id.in_(select(matches.c.id)))
+        .order_by(rank.desc(), MaterialDB.id)
+        .limit(settings.SEARCH_MAX_CANDIDATES)
+        .subquery()
+    )
+
+
+async def _search_page(db: AsyncSession, candidates, limit: int, after: Optional[tuple]):
+    stmt = (
+        select(MaterialDB, candidates.c.rank)
+        .join(candidates, candidates.c.id == MaterialDB.id)
+        .options(*MATERIAL_RESPONSE_OPTIONS)
+    )
+    if after is not None:
+        last_rank, last_id = after
+        stmt = stmt.where(
+            or_(
+                candidates.c.rank < last_rank,
+                and_(candidates.c.rank == last_rank, MaterialDB.id > last_id),
+            )
+        )
+    stmt = stmt.order_by(candidates.c.rank.desc(), MaterialDB.id).limit(limit + 1)
+    return (await db.execute(stmt)).all()
+
+
+@router.get("/search", response_model=MaterialSearchPage)
+async def search_materials(
+    q: str = Query(..., min_length=2, max_length=200, description="Texto a buscar en título y autor"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Valor de next_cursor de la página anterior"),
+    db: AsyncSession = Depends(get_read_db),
+    etag: Optional[str] = Depends(CATALOG_ETAG),
+):
+    """
+    Busca materiales por título y nombre del autor, ordenados por relevancia.
+    Usa búsqueda de texto completo en español sin tildes ("quijote" encuentra
+    "Don Quijote", "perez" encuentra "Pérez") y admite la sintaxis de buscador web
+    ("frase exacta", -excluir, OR). Si no hay coincidencias, repite la búsqueda por
+    similitud de trigramas para tolerar errores de escritura ("quijote" ~ "qijote");
+    en ese caso la respuesta indica fuzzy=True.
+    Accesible para todos los usuarios.
+
+    Args:
+        q: str - Texto a buscar
+        limit: int - Número máximo de resultados por página (1-100)
+        cursor: Optional[str] - Cursor opaco devuelto en next_cursor; omitir para la primera página
+        db: AsyncSession - Sesión de la base de datos
+        etag: Optional[str] - ETag de la respuesta; 304 si coincide con If-None-Match
+
+    Returns:
+        MaterialSearchPage - Resultados con su relevancia, cursor de la siguiente página
+        y si se usó la búsqueda aproximada
+
+    Raises:
+        HTTPException(400) - Cursor inválido
+        HTTPException(500) - Error interno del servidor
+    """
+    try:
+        after = None
+        if cursor:
+            mode, last_rank, last_id = decode_cursor(cursor, "search", 3)
+            try:
+                if mode not in (MODE_FULLTEXT, MODE_FUZZY):
+                    raise ValueError(mode)
+                after = (float(last_rank), UUID(last_id))
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cursor inválido para este criterio de orden",
+                )
+        else:
+            mode = MODE_FULLTEXT
+
+        if mode == MODE_FULLTEXT:
+            rows = await _search_page(db, _fulltext_candidates(q), limit, after)
+            if not rows and after is None:
+                mode = MODE_FUZZY
+        if mode == MODE_FUZZY:
+            rows = await _search_page(db, _fuzzy_candidates(q), limit, after)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_material, last_rank = rows[-1]
+            next_cursor = encode_cursor("search", [mode, last_rank, last_material.id])
+
+        items = [
+            MaterialSearchResult(
+                **Material.model_validate(material, from_attributes=True).model_dump(),
+                rank=rank,
+            )
+            for material, rank in rows
+        ]
+        return MaterialSearchPage(items=items, next_cursor=next_cursor, fuzzy=mode == MODE_FUZZY)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}",
+        )
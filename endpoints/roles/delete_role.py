@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
 from models.schemas import TokenData
-from database.connection import Role as RoleDB, User as UserDB, get_db
+from database.connection import Role as RoleDB, User as UserDB, get_write_db
 from common.middleware import require_admin
 from uuid import UUID
 
@@ -11,7 +12,7 @@ router = APIRouter(prefix="/roles", tags=["roles"])
 @router.delete("/{role_id}", status_code=status.HTTP_200_OK)
 async def delete_role(
     role_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -21,7 +22,7 @@ async def delete_role(
 
     Args:
         role_id: UUID - Identificador único del rol
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -35,7 +36,7 @@ async def delete_role(
     """
     try:
         # Buscar el rol existente
-        db_role = db.query(RoleDB).filter(RoleDB.id == role_id).first()
+        db_role = await db.get(RoleDB, role_id)
         if not db_role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -43,7 +44,9 @@ async def delete_role(
             )
 
         # Verificar si el rol está siendo usado por usuarios
-        users_with_role = db.query(UserDB).filter(UserDB.role_id == role_id).count()
+        users_with_role = await db.scalar(
+            select(func.count()).select_from(UserDB).where(UserDB.role_id == role_id)
+        )
         if users_with_role > 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -51,15 +54,15 @@ async def delete_role(
             )
 
         # Eliminar el rol
-        db.delete(db_role)
-        db.commit()
+        await db.delete(db_role)
+        await db.commit()
 
         return {"message": "Rol eliminado correctamente"}
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, HTTPException, status, Query, Depends
 from typing import List
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from models.schemas import Role, TokenData
-from database.connection import Role as RoleDB, get_db
+from database.connection import Role as RoleDB, get_read_db
 from common.middleware import require_admin
 
 router = APIRouter(prefix="/roles", tags=["roles"])
@@ -14,7 +14,7 @@ async def get_roles(
     _: TokenData = Depends(require_admin),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Obtiene una lista paginada de todos los roles del sistema.
@@ -24,7 +24,7 @@ async def get_roles(
         _: TokenData - Token del administrador 
         skip: int - Número de registros a saltar (para paginación)
         limit: int - Número máximo de registros a retornar (10-100)
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
 
     Returns:
         List[Role] - Lista de roles del sistema
@@ -40,7 +40,7 @@ async def get_roles(
             .offset(skip)
             .limit(limit)
         )
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         roles_db = result.scalars().all()
 
         roles = [Role.model_validate(r, from_attributes=True) for r in roles_db]
@@ -57,7 +57,7 @@ async def get_roles(
 @router.get("/{role_id}", response_model=Role)
 async def get_role(
     role_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -66,7 +66,7 @@ async def get_role(
 
     Args:
         role_id: str - Identificador único del rol
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
         current_user: TokenData - Token del administrador 
 
     Returns:
@@ -79,7 +79,7 @@ async def get_role(
     """
     try:
         stmt = select(RoleDB).where(RoleDB.id == role_id)
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         role_db = result.scalar_one_or_none()
 
         if not role_db:
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from models.schemas import RoleCreate, Role, TokenData
-from database.connection import Role as RoleDB, get_db
+from database.connection import Role as RoleDB, get_write_db
 from common.middleware import require_admin
 from uuid import uuid4
 
@@ -12,7 +13,7 @@ router = APIRouter(prefix="/roles", tags=["roles"])
 @router.post("/", response_model=Role, status_code=status.HTTP_201_CREATED)
 async def create_role(
     role: RoleCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -21,7 +22,7 @@ async def create_role(
 
     Args:
         role: RoleCreate - Datos del nuevo rol
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -34,7 +35,9 @@ async def create_role(
     """
     try:
         # Verificar si el rol ya existe
-        existing_role = db.query(RoleDB).filter(RoleDB.name == role.name).first()
+        existing_role = (
+            await db.execute(select(RoleDB).where(RoleDB.name == role.name))
+        ).scalars().first()
         if existing_role:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -50,21 +53,21 @@ async def create_role(
         )
 
         db.add(db_role)
-        db.commit()
-        db.refresh(db_role)
+        await db.commit()
+        await db.refresh(db_role)
 
         return Role.model_validate(db_role, from_attributes=True)
 
     except HTTPException:
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from models.schemas import RoleUpdate, Role, TokenData
-from database.connection import Role as RoleDB, get_db
+from database.connection import Role as RoleDB, get_write_db
 from common.middleware import require_admin
 from uuid import UUID
 
@@ -13,7 +14,7 @@ router = APIRouter(prefix="/roles", tags=["roles"])
 async def update_role(
     role_id: UUID,
     role_update: RoleUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(require_admin),
 ):
     """
@@ -23,7 +24,7 @@ async def update_role(
     Args:
         role_id: UUID - Identificador único del rol
         role_update: RoleUpdate - Datos a actualizar
-        db: Session - Sesión de la base de datos
+        db: AsyncSession - Sesión de la base de datos
         current_user: TokenData - Token del administrador
 
     Returns:
@@ -37,7 +38,7 @@ async def update_role(
     """
     try:
         # Buscar el rol existente
-        db_role = db.query(RoleDB).filter(RoleDB.id == role_id).first()
+        db_role = await db.get(RoleDB, role_id)
         if not db_role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -46,10 +47,14 @@ async def update_role(
 
         # Verificar si el nuevo nombre ya existe (si se está cambiando)
         if role_update.name and role_update.name != db_role.name:
-            existing_role = db.query(RoleDB).filter(
-                RoleDB.name == role_update.name,
-                RoleDB.id != role_id
-            ).first()
+            existing_role = (
+                await db.execute(
+                    select(RoleDB).where(
+                        RoleDB.name == role_update.name,
+                        RoleDB.id != role_id
+                    )
+                )
+            ).scalars().first()
             if existing_role:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -65,21 +70,21 @@ async def update_role(
         # Actualizar campos de auditoría
         db_role.updated_by = current_user.id
 
-        db.commit()
-        db.refresh(db_role)
+        await db.commit()
+        await db.refresh(db_role)
 
         return Role.model_validate(db_role, from_attributes=True)
 
     except HTTPException:
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}"
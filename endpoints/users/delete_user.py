@@ -1,9 +1,9 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
 from models.schemas import UserResponse, TokenData
 from database.connection import User as UserDB
-from database.connection import get_db
+from database.connection import get_write_db
 from uuid import UUID
 from datetime import datetime, timezone
 from common.middleware import get_current_user
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/users", tags=["users"])
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: TokenData = Depends(get_current_user),
 ):
     """
@@ -23,7 +23,7 @@ async def delete_user(
 
     Args:
         user_id: UUID - Identificador único del usuario a eliminar
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
         current_user: TokenData - Token del usuario actual 
 
     Returns:
@@ -36,7 +36,7 @@ async def delete_user(
     """
     try:
         stmt = select(UserDB).where(UserDB.id == user_id, UserDB.is_deleted == False)
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         user_db = result.scalar_one_or_none()
 
         if not user_db:
@@ -50,22 +50,24 @@ async def delete_user(
                 detail="No tienes permiso para eliminar este usuario",
             )
 
-        db.query(UserDB).filter(UserDB.id == user_id).update(
-            {
-                "is_deleted": True,
-                "updated_at": datetime.now(timezone.utc),
-                "updated_by": current_user.id,
-            },
-            synchronize_session="fetch",
+        await db.execute(
+            update(UserDB)
+            .where(UserDB.id == user_id)
+            .values(
+                is_deleted=True,
+                updated_at=datetime.now(timezone.utc),
+                updated_by=current_user.id,
+            )
+            .execution_options(synchronize_session="fetch")
         )
 
-        db.commit()
+        await db.commit()
 
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}",
@@ -1,10 +1,11 @@
 from fastapi import APIRouter, HTTPException, status, Query, Depends
 from typing import List
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from models.schemas import User, TokenData
 from database.connection import User as UserDB
-from database.connection import get_db
+from database.connection import get_read_db
+from database.load_options import USER_RESPONSE_OPTIONS
 from uuid import UUID
 from common.middleware import require_admin, get_current_user
 
@@ -16,7 +17,7 @@ async def get_users(
     _: TokenData = Depends(require_admin),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Obtiene una lista paginada de todos los usuarios del sistema.
@@ -26,7 +27,7 @@ async def get_users(
         _: TokenData - Token del administrador 
         skip: int - Número de registros a saltar (para paginación)
         limit: int - Número máximo de registros a retornar (10-100)
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
 
     Returns:
         List[User] - Lista de usuarios del sistema
@@ -38,12 +39,13 @@ async def get_users(
     try:
         stmt = (
             select(UserDB)
+            .options(*USER_RESPONSE_OPTIONS)
             .where(UserDB.is_deleted == False)
             .order_by(UserDB.id)
             .offset(skip)
             .limit(limit)
         )
-        result = db.execute(stmt)
+        result = await db.execute(stmt)
         users_db = result.scalars().all()
 
         users = [User.model_validate(u, from_attributes=True) for u in users_db]
@@ -60,7 +62,7 @@ async def get_users(
 @router.get("/{user_id}", response_model=User)
 async def get_user(
     user_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: TokenData = Depends(get_current_user),
 ):
     """
@@ -69,7 +71,7 @@ async def get_user(
 
     Args:
         user_id: UUID - Identificador único del usuario
-        db: Session - Sesión de la base de datos 
+        db: AsyncSession - Sesión de la base de datos 
         current_user: TokenData - Token del usuario actual 
 
     Returns:
@@ -87,8 +89,12 @@ async def get_user(
                 detail="No tienes permiso para acceder a este recurso",
             )
 
-        stmt = select(UserDB).where(UserDB.id == user_id, UserDB.is_deleted == False)
-        result = db.execute(stmt)
+        stmt = (
+            select(UserDB)
+            .options(*USER_RESPONSE_OPTIONS)
+            .where(UserDB.id == user_id, UserDB.is_deleted == False)
+        )
+        result = await db.execute(stmt)
         user_db = result.scalar_one_or_none()
 
         if not user_db:
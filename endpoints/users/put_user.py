@@ -1,10 +1,11 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from models.schemas import User, UserUpdate
 from database.connection import User as UserDB
-from database.connection import get_db
+from database.connection import get_write_db
+from database.load_options import USER_RESPONSE_OPTIONS
 import hashlib
 from uuid import UUID
 from common.middleware import get_current_user
@@ -15,12 +16,16 @@ router = APIRouter(prefix="/users", tags=["users"])
 async def update_user(
     user_id: UUID,
     user_update: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user = Depends(get_current_user)
 ):
     try:
-        stmt = select(UserDB).where(UserDB.id == user_id, UserDB.is_deleted == False)
-        user_db = db.execute(stmt).scalar_one_or_none()
+        stmt = (
+            select(UserDB)
+            .options(*USER_RESPONSE_OPTIONS)
+            .where(UserDB.id == user_id, UserDB.is_deleted == False)
+        )
+        user_db = (await db.execute(stmt)).scalar_one_or_none()
 
         if not user_db:
             raise HTTPException(
@@ -46,7 +51,7 @@ async def update_user(
             stmt = select(UserDB).where(
                 UserDB.email == update_data["email"], UserDB.id != user_id
             )
-            if db.execute(stmt).scalar_one_or_none():
+            if (await db.execute(stmt)).scalar_one_or_none():
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="El email ya está registrado",
@@ -57,22 +62,30 @@ async def update_user(
                 value = hashlib.sha256(value.encode()).hexdigest()
             setattr(user_db, key, value)
 
-        db.commit()
-        db.refresh(user_db)
+        await db.commit()
+
+        # role_id pudo cambiar: se recarga el usuario con su rol
+        stmt = (
+            select(UserDB)
+            .options(*USER_RESPONSE_OPTIONS)
+            .where(UserDB.id == user_id)
+            .execution_options(populate_existing=True)
+        )
+        user_db = (await db.execute(stmt)).scalar_one()
 
         return user_db
 
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos",
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno del servidor: {str(e)}",
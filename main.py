@@ -1,17 +1,33 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from database.connection import create_tables, test_connection, migrate_database
+from database.connection import (
+    test_async_connection,
+    async_engine,
+    replica_set,
+)
+from database.migrations import check_schema_version
+from database.partitions import run_partition_maintenance
+from database.overdue import run_overdue_sweeper
+from common.autocomplete import run_autocomplete_refresh
 from endpoints import (
     get_users_router,
     put_user_router,
     delete_user_router,
+    search_materials_router,
+    get_material_facets_router,
+    get_autocomplete_router,
     get_materials_router,
+    get_material_availability_router,
     post_material_router,
     put_material_router,
     delete_material_router,
+    import_materials_router,
     get_loan_router,
     post_loan_router,
     put_loan_router,
+    post_bulk_loans_router,
+    put_bulk_return_router,
     login_router,
     register_router,
     get_roles_router,
@@ -30,7 +46,17 @@ from endpoints import (
     post_loan_status_router,
     put_loan_status_router,
     delete_loan_status_router,
+    get_autocomplete_stats_router,
+    get_cache_stats_router,
+    get_export_router,
+    get_overdue_stats_router,
+    get_pool_stats_router,
+    get_replica_status_router,
+    get_route_stats_router,
+    get_slow_queries_router,
 )
+from common.middleware import SqlMetricsMiddleware
+from config import settings
 
 """
 Crear la aplicación FastAPI
@@ -54,9 +80,16 @@ app.add_middleware(
     ],
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization", "accept"],
+    allow_headers=["Content-Type", "Authorization", "accept", "If-None-Match"],
+    expose_headers=["ETag"],
 )
 
+"""
+Métricas SQL por petición (cabecera Server-Timing y estadísticas por ruta)
+"""
+if settings.SQL_INSTRUMENTATION:
+    app.add_middleware(SqlMetricsMiddleware)
+
 """
 Incluir routers de la aplicación
 """
@@ -69,8 +102,13 @@ app.include_router(get_users_router)
 app.include_router(put_user_router)
 app.include_router(delete_user_router)
 
-# Routers de materiales
+# Routers de materiales (search, facets y autocomplete antes que /materials/{material_id})
+app.include_router(search_materials_router)
+app.include_router(get_material_facets_router)
+app.include_router(get_autocomplete_router)
+app.include_router(import_materials_router)
 app.include_router(get_materials_router)
+app.include_router(get_material_availability_router)
 app.include_router(post_material_router)
 app.include_router(put_material_router)
 app.include_router(delete_material_router)
@@ -78,6 +116,8 @@ app.include_router(delete_material_router)
 # Routers de préstamos
 app.include_router(get_loan_router)
 app.include_router(post_loan_router)
+app.include_router(post_bulk_loans_router)
+app.include_router(put_bulk_return_router)
 app.include_router(put_loan_router)
 
 # Routers de roles
@@ -104,26 +144,73 @@ app.include_router(post_loan_status_router)
 app.include_router(put_loan_status_router)
 app.include_router(delete_loan_status_router)
 
+# Routers de administración
+app.include_router(get_autocomplete_stats_router)
+app.include_router(get_cache_stats_router)
+app.include_router(get_export_router)
+app.include_router(get_overdue_stats_router)
+app.include_router(get_pool_stats_router)
+app.include_router(get_replica_status_router)
+app.include_router(get_route_stats_router)
+app.include_router(get_slow_queries_router)
+
 
 @app.on_event("startup")
 async def startup_event():
     """Evento que se ejecuta al iniciar la aplicación"""
+    if replica_set.replicas:
+        # Mide el retraso de las réplicas fuera de la ruta de las peticiones
+        app.state.replica_lag_task = asyncio.create_task(replica_set.run_lag_monitor())
     try:
-        if test_connection():
-            create_tables()
-            migrate_database()
+        if await test_async_connection():
+            if await check_schema_version(async_engine):
+                # Crea las particiones vacías de los próximos meses (un worker por ciclo)
+                app.state.partition_task = asyncio.create_task(
+                    run_partition_maintenance(
+                        async_engine, settings.LOANS_PARTITION_MAINTENANCE_INTERVAL
+                    )
+                )
+                if settings.OVERDUE_SWEEP_ENABLED:
+                    # Marca los préstamos vencidos por bloques, sin bloquear los préstamos nuevos
+                    app.state.overdue_task = asyncio.create_task(
+                        run_overdue_sweeper(
+                            async_engine,
+                            settings.OVERDUE_SWEEP_INTERVAL,
+                            settings.OVERDUE_SWEEP_FULL_INTERVAL,
+                        )
+                    )
+                if settings.AUTOCOMPLETE_ENABLED:
+                    # Construye los índices en segundo plano y los reconstruye periódicamente
+                    app.state.autocomplete_task = asyncio.create_task(
+                        run_autocomplete_refresh(settings.AUTOCOMPLETE_REFRESH_SECONDS)
+                    )
             print("API iniciada correctamente")
-            print("Base de datos conectada, tablas creadas y migración completada")
         else:
             print("No se pudo conectar a la base de datos")
     except Exception as e:
         print(f"Error al inicializar la API: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Evento que se ejecuta al detener la aplicación"""
+    for task_name in (
+        "replica_lag_task",
+        "partition_task",
+        "overdue_task",
+        "autocomplete_task",
+    ):
+        task = getattr(app.state, task_name, None)
+        if task is not None:
+            task.cancel()
+    await async_engine.dispose()
+    await replica_set.dispose()
+
+
 @app.get("/health")
 async def health_check():
     """Verificación del estado de la API"""
-    db_status = "connected" if test_connection() else "disconnected"
+    db_status = "connected" if await test_async_connection() else "disconnected"
     return {"status": "healthy", "database": db_status}
 
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, EmailStr
-from typing import Optional
+from typing import Any, List, Optional
 from datetime import datetime, date
 from uuid import UUID
 
@@ -187,6 +187,88 @@ class Material(MaterialBase):
         from_attributes = True
 
 
+class MaterialPage(BaseModel):
+    """Página del catálogo paginada por cursor"""
+
+    items: List[Material]
+    next_cursor: Optional[str] = None
+
+
+class MaterialSearchResult(Material):
+    """Material encontrado por la búsqueda, con su relevancia"""
+
+    rank: float
+
+
+class MaterialSearchPage(BaseModel):
+    """Página de resultados de búsqueda ordenada por relevancia"""
+
+    items: List[MaterialSearchResult]
+    next_cursor: Optional[str] = None
+    fuzzy: bool = False
+
+
+class AutocompleteItem(BaseModel):
+    """Sugerencia de autocompletado"""
+
+    id: UUID
+    label: str
+
+
+class AutocompleteResponse(BaseModel):
+    """Títulos y autores que coinciden con lo escrito"""
+
+    titles: List[AutocompleteItem]
+    authors: List[AutocompleteItem]
+
+
+class MaterialAvailability(BaseModel):
+    """Disponibilidad actual de un material"""
+
+    material_id: UUID
+    is_available: bool = Field(description="Sin préstamo abierto")
+
+
+class FacetCount(BaseModel):
+    """Número de materiales con un valor de una faceta"""
+
+    value: str
+    label: Optional[str] = None
+    count: int
+
+
+class MaterialFacets(BaseModel):
+    """Conteos por tipo, autor y disponibilidad de los materiales que cumplen un filtro"""
+
+    total: int
+    material_types: List[FacetCount]
+    authors: List[FacetCount]
+    availability: List[FacetCount]
+
+
+class MaterialImportError(BaseModel):
+    """Fila rechazada por la importación masiva"""
+
+    line: int
+    title: Optional[str] = None
+    error: str
+
+
+class MaterialImportResult(BaseModel):
+    """Resumen de una importación masiva de materiales"""
+
+    rows: int
+    imported: int
+    failed: int
+    authors_created: int
+    material_types_created: int
+    batches: int
+    elapsed_ms: float
+    rows_per_second: float
+    errors: List[MaterialImportError]
+    errors_truncated: bool = False
+
+
 class MaterialResponse(BaseModel):
     """Respuesta estándar de la API para materiales"""
 
@@ -248,6 +330,92 @@ class LoanResponse(LoanBase):
         from_attributes = True
 
 
+class LoanMaterialSummary(BaseModel):
+    """Material de un préstamo con los nombres de su autor y tipo"""
+
+    id: UUID
+    title: str
+    author_id: UUID
+    author_name: str
+    type_id: UUID
+    type_name: str
+
+
+class LoanUserSummary(BaseModel):
+    """Usuario de un préstamo"""
+
+    id: UUID
+    email: str
+    full_name: Optional[str] = None
+
+
+class LoanStatusSummary(BaseModel):
+    """Estado de un préstamo"""
+
+    id: UUID
+    name: str
+
+
+class LoanSummary(BaseModel):
+    """
+    Préstamo leído directamente de las columnas de loans; material, user y status solo
+    se incluyen si se piden con `expand`
+    """
+
+    id: UUID
+    material_id: UUID
+    user_id: UUID
+    status_id: UUID
+    loan_date: datetime
+    expected_return_date: datetime
+    actual_return_date: Optional[datetime] = None
+
+    material: Optional[LoanMaterialSummary] = None
+    user: Optional[LoanUserSummary] = None
+    status: Optional[LoanStatusSummary] = None
+
+
+class LoanPage(BaseModel):
+    """Página de préstamos paginada por cursor"""
+
+    items: List[LoanSummary]
+    next_cursor: Optional[str] = None
+
+
+class BulkLoanCreate(BaseModel):
+    """Varios materiales prestados a un mismo usuario en una sola transacción"""
+
+    user_id: UUID
+    material_ids: List[UUID] = Field(..., min_length=1, max_length=100)
+    expected_return_date: datetime
+    status_id: UUID = Field(..., description="ID del estado del préstamo")
+
+
+class BulkLoanReturn(BaseModel):
+    """Varios préstamos devueltos en una sola transacción"""
+
+    loan_ids: List[UUID] = Field(..., min_length=1, max_length=100)
+
+
+class BulkLoanItem(BaseModel):
+    """Resultado de un material (préstamo) o de un préstamo (devolución) del lote"""
+
+    id: UUID
+    status_code: int
+    loan_id: Optional[UUID] = None
+    material_id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class BulkLoanResult(BaseModel):
+    """Resumen de un préstamo o devolución por lote, en el orden de la petición"""
+
+    requested: int
+    succeeded: int
+    failed: int
+    items: List[BulkLoanItem]
+
+
 # -----------------------------
 # Auth DTOs
 # -----------------------------
@@ -284,3 +452,110 @@ class RegisterResponse(BaseModel):
     user: Optional[User] = None
     error: Optional[str] = None
     token: Optional[str] = None
+
+
+# -----------------------------
+# Admin DTOs
+# -----------------------------
+
+
+class PoolStats(BaseModel):
+    """Estado y contadores de un pool de conexiones"""
+
+    name: str
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow_in_use: int
+    checkouts: int
+    checkins: int
+    connections_opened: int
+    connections_closed: int
+    invalidations: int
+    timeouts: int
+    wait_time_avg_ms: float
+    wait_time_max_ms: float
+
+
+class AutocompleteStats(BaseModel):
+    """Tamaño y memoria de un índice de autocompletado"""
+
+    name: str
+    ready: bool
+    entries: int
+    words: int
+    memory_bytes: int
+    bytes_per_entry: float
+    garbage_bytes: int
+    built_at: Optional[datetime] = None
+    build_seconds: Optional[float] = None
+
+
+class OverdueSweepStats(BaseModel):
+    """Métricas del marcado de préstamos vencidos en este proceso"""
+
+    enabled: bool
+    sweeps: int
+    skipped: int
+    total_updated: int
+    last_full: Optional[bool] = None
+    last_started_at: Optional[datetime] = None
+    last_duration_seconds: Optional[float] = None
+    last_updated: Optional[int] = None
+    last_batches: Optional[int] = None
+    last_rows_per_second: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class CacheStats(BaseModel):
+    """Contadores de una caché del catálogo"""
+
+    name: str
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+class ReplicaStatus(BaseModel):
+    """Retraso y disponibilidad de una réplica de lectura"""
+
+    name: str
+    lag_seconds: Optional[float] = None
+    healthy: bool
+    last_error: Optional[str] = None
+
+
+class RouteSqlStats(BaseModel):
+    """Métricas SQL acumuladas de una ruta"""
+
+    route: str
+    requests: int
+    statements_avg: float
+    statements_max: int
+    db_time_avg_ms: float
+    db_time_total_ms: float
+    rows_avg: float
+    n_plus_one_requests: int
+    n_plus_one_statements: List[str]
+
+
+class SlowQuery(BaseModel):
+    """Sentencia que superó el umbral de consulta lenta, con su plan si se capturó"""
+
+    id: int
+    timestamp: datetime
+    engine: str
+    route: Optional[str] = None
+    duration_ms: float
+    statement: str
+    parameters: Any = None
+    plan: Optional[str] = None
+    plan_pending: bool
+    explain_error: Optional[str] = None
@@ -0,0 +1,142 @@
+"""
+Reporte de planes de ejecución para las consultas más frecuentes.
+
+Ejecuta EXPLAIN sobre cada consulta dos veces: sin los índices secundarios de las
+tablas consultadas (los de las migraciones 0002, 0004, 0005, 0007 y 0008; se eliminan
+dentro de una transacción que luego se revierte) y con ellos, y escribe un reporte
+Markdown con ambos planes. Las claves primarias y los índices de restricciones únicas
+se conservan.
+
+DROP INDEX dentro de la transacción toma un lock exclusivo sobre cada tabla
+mientras dura el reporte: úsalo solo en bases locales o de staging.
+
+Uso:
+    python -m scripts.explain_hot_queries [--analyze] [--output reporte.md]
+"""
+
+import argparse
+import sys
+
+from sqlalchemy import text
+
+from database.connection import engine
+
+EXPLAINED_TABLES = ["loans", "materials", "users", "authors", "loan_status"]
+
+# Índices de nivel superior que no respaldan una restricción. Los de las particiones de
+# loans cuelgan del índice del padre y se eliminan con él.
+SECONDARY_INDEXES = text(
+    """
+    SELECT i.indexrelid::regclass::text
+    FROM pg_index i
+    WHERE i.indrelid IN (SELECT to_regclass(name) FROM unnest(CAST(:tables AS text[])) AS name)
+      AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+      AND NOT EXISTS (SELECT 1 FROM pg_inherits h WHERE h.inhrelid = i.indexrelid)
+    """
+)
+
+SAMPLE_QUERY = text(
+    """
+    SELECT
+        (SELECT material_id FROM loans LIMIT 1) AS material_id,
+        (SELECT user_id FROM loans LIMIT 1) AS user_id,
+        (SELECT author_id FROM materials LIMIT 1) AS author_id,
+        (SELECT type_id FROM materials LIMIT 1) AS type_id
+    """
+)
+
+HOT_QUERIES = [
+    (
+        "Préstamo abierto de un material (create_loan)",
+        "SELECT * FROM loans WHERE material_id = :material_id AND actual_return_date IS NULL",
+    ),
+    (
+        "Préstamos de un usuario (get_user_loans)",
+        "SELECT * FROM loans WHERE user_id = :user_id ORDER BY loan_date DESC, id DESC LIMIT 50",
+    ),
+    (
+        "Préstamos vencidos",
+        "SELECT id FROM loans WHERE actual_return_date IS NULL AND expected_return_date < now()",
+    ),
+    (
+        "Catálogo activo ordenado por título (get_all_materials)",
+        "SELECT * FROM materials WHERE is_deleted = false ORDER BY title, id LIMIT 50",
+    ),
+    (
+        "Materiales de un autor",
+        "SELECT * FROM materials WHERE author_id = :author_id AND is_deleted = false",
+    ),
+    (
+        "Materiales de un tipo",
+        "SELECT * FROM materials WHERE type_id = :type_id AND is_deleted = false LIMIT 50",
+    ),
+    (
+        "Usuarios activos (get_users)",
+        "SELECT * FROM users WHERE is_deleted = false ORDER BY id LIMIT 10",
+    ),
+    ("Autores por nombre (get_authors)", "SELECT * FROM authors ORDER BY name LIMIT 10"),
+    (
+        "Estados de préstamo por nombre (get_loan_status)",
+        "SELECT * FROM loan_status ORDER BY name LIMIT 10",
+    ),
+]
+
+
+def explain_all(connection, params: dict, analyze: bool) -> list:
+    options = "ANALYZE, BUFFERS" if analyze else "COSTS"
+    plans = []
+    for title, sql in HOT_QUERIES:
+        rows = connection.execute(text(f"EXPLAIN ({options}) {sql}"), params).scalars()
+        plans.append((title, sql, "\n".join(rows)))
+    return plans
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m scripts.explain_hot_queries")
+    parser.add_argument("--analyze", action="store_true", help="Usa EXPLAIN (ANALYZE, BUFFERS)")
+    parser.add_argument("--output", default=None, help="Archivo Markdown de salida")
+    args = parser.parse_args()
+
+    with engine.connect() as connection:
+        params = dict(connection.execute(SAMPLE_QUERY).mappings().one())
+        connection.rollback()
+
+        # Antes: sin los índices, en una transacción que se revierte
+        transaction = connection.begin()
+        indexes = connection.execute(SECONDARY_INDEXES, {"tables": EXPLAINED_TABLES}).scalars()
+        for name in list(indexes):
+            connection.execute(text(f"DROP INDEX {name}"))
+        before = explain_all(connection, params, args.analyze)
+        transaction.rollback()
+
+        with connection.begin():
+            after = explain_all(connection, params, args.analyze)
+
+    lines = ["# Planes de consultas frecuentes", ""]
+    for (title, sql, plan_before), (_, _, plan_after) in zip(before, after):
+        lines += [
+            f"## {title}",
+            "",
+            f"```sql\n{sql}\n```",
+            "",
+            "**Sin índices**",
+            "",
+            f"```\n{plan_before}\n```",
+            "",
+            "**Con índices**",
+            "",
+            f"```\n{plan_after}\n```",
+            "",
+        ]
+    report = "\n".join(lines)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+        print(f"✅ Reporte escrito en {args.output}")
+    else:
+        sys.stdout.write(report)
+
+
+if __name__ == "__main__":
+    main()
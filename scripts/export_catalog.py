@@ -0,0 +1,104 @@
+"""
+Exportación completa de materiales, autores o préstamos a un archivo NDJSON o CSV.
+
+Lee la tabla con un cursor del lado del servidor (database.export) y escribe cada
+bloque al archivo a medida que llega, con memoria constante sin importar el tamaño de
+la tabla. Tras cada bloque guarda un punto de control en `<archivo>.checkpoint` con el
+último id y el tamaño del archivo; `--resume` trunca el archivo a ese tamaño (descarta
+un bloque escrito a medias) y continúa desde ese id.
+
+Uso:
+    python -m scripts.export_catalog loans --output loans.ndjson
+    python -m scripts.export_catalog materials --format csv --output materials.csv
+    python -m scripts.export_catalog loans --output loans.ndjson --resume
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from uuid import UUID
+
+from common import ExportEntity, ImportFormat
+from database.connection import AsyncSessionLocal, async_engine
+from database.export import stream_export
+
+
+def _checkpoint_path(output: str) -> str:
+    return f"{output}.checkpoint"
+
+
+def _read_checkpoint(output: str):
+    try:
+        with open(_checkpoint_path(output)) as file:
+            checkpoint = json.load(file)
+        return UUID(checkpoint["after"]), int(checkpoint["offset"])
+    except FileNotFoundError:
+        return None, 0
+
+
+def _write_checkpoint(output: str, after: UUID, offset: int):
+    path = _checkpoint_path(output)
+    with open(f"{path}.tmp", "w") as file:
+        json.dump({"after": str(after), "offset": offset}, file)
+    os.replace(f"{path}.tmp", path)
+
+
+async def export(args):
+    entity = ExportEntity(args.entity)
+    export_format = ImportFormat(args.format)
+    output = args.output or f"{entity.value}.{export_format.value}"
+
+    after, offset = _read_checkpoint(output) if args.resume else (None, 0)
+    if after is not None:
+        print(f"⏩ Reanudando {output} después de {after} (byte {offset})")
+
+    start = time.perf_counter()
+    rows = 0
+    chunks = 0
+    with open(output, "r+b" if after is not None else "wb") as file:
+        file.truncate(offset)
+        file.seek(offset)
+        async with AsyncSessionLocal() as db:
+            async for chunk, last_id, count in stream_export(
+                db, entity, export_format, after=after, batch_size=args.batch_size
+            ):
+                file.write(chunk.encode("utf-8"))
+                if last_id is None:
+                    continue
+                file.flush()
+                _write_checkpoint(output, last_id, file.tell())
+                rows += count
+                chunks += 1
+                if chunks % 20 == 0:
+                    elapsed = time.perf_counter() - start
+                    print(f"📦 {rows:,} filas ({rows / elapsed:,.0f} filas/s)")
+
+    await async_engine.dispose()
+    # Una tabla vacía no escribe punto de control
+    checkpoint = _checkpoint_path(output)
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {rows:,} filas de {entity.value} exportadas a {output} en {elapsed:.1f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m scripts.export_catalog")
+    parser.add_argument("entity", choices=[entity.value for entity in ExportEntity], help="Tabla a exportar")
+    parser.add_argument(
+        "--format", choices=[value.value for value in ImportFormat], default="ndjson", help="Formato de salida"
+    )
+    parser.add_argument("--output", help="Archivo de salida (por defecto <entidad>.<formato>)")
+    parser.add_argument(
+        "--batch-size", type=int, default=None, help="Filas por bloque del cursor (por defecto EXPORT_BATCH_SIZE)"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Continúa desde el punto de control de una exportación interrumpida"
+    )
+    asyncio.run(export(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+"""
+Generador de un conjunto de datos sintético de biblioteca a escala de producción.
+
+Genera autores, materiales, usuarios y préstamos con distribuciones realistas y los
+carga con COPY binario (asyncpg `copy_records_to_table`) en lotes. Con la misma semilla,
+los mismos tamaños y el mismo `--now` el resultado es idéntico, incluidos los UUID.
+Las fechas se generan hacia atrás desde `--now`, que por defecto es la medianoche UTC
+de hoy (así los préstamos abiertos no nacen vencidos) y se imprime para poder repetir
+la ejecución exacta.
+
+Distribuciones:
+- Pocos autores concentran muchas obras y pocos materiales y usuarios concentran
+  muchos préstamos (pesos de Pareto)
+- Los préstamos de cada material no se solapan en el tiempo: a lo sumo uno abierto
+- De los préstamos ya vencidos, ~85% se devuelven a tiempo y el resto tarde; el último
+  préstamo de cada material puede seguir abierto (borrowed) o sin devolver (overdue)
+
+Todos los usuarios generados tienen la contraseña DATASET_PASSWORD; el primero es admin.
+Los roles, tipos de material y estados de préstamo se reutilizan si ya existen.
+
+Uso:
+    python -m scripts.generate_dataset --profile large --seed 42 --truncate
+    python -m scripts.generate_dataset --materials 50000 --loans 500000
+"""
+
+import argparse
+import asyncio
+import importlib
+import itertools
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID
+
+from database.connection import async_engine
+from database.partitions import ensure_loan_partitions
+
+material_availability = importlib.import_module("database.migrations.0007_material_availability")
+
+DATASET_PASSWORD = "dataset123"
+
+PROFILES = {
+    "small": {"authors": 2_000, "materials": 10_000, "users": 5_000, "loans": 100_000},
+    "medium": {"authors": 20_000, "materials": 100_000, "users": 50_000, "loans": 2_000_000},
+    "large": {"authors": 200_000, "materials": 1_000_000, "users": 500_000, "loans": 20_000_000},
+}
+
+ROLES = [("admin", "Administrador del sistema"), ("cliente", "Cliente de la biblioteca")]
+MATERIAL_TYPES = [("book", "Libro", 0.80), ("magazine", "Revista", 0.15), ("newspaper", "Periódico", 0.05)]
+LOAN_STATUSES = ["borrowed", "returned", "overdue"]
+
+FIRST_NAMES = [
+    "Ana", "Carlos", "Lucía", "Mateo", "Valentina", "Santiago", "Camila", "Sebastián",
+    "Isabella", "Diego", "Sofía", "Andrés", "Mariana", "Felipe", "Gabriela", "Juan",
+    "Laura", "Miguel", "Daniela", "Tomás", "Paula", "Alejandro", "Elena", "Jorge",
+]
+LAST_NAMES = [
+    "García", "Rodríguez", "Martínez", "López", "González", "Pérez", "Sánchez", "Ramírez",
+    "Torres", "Flores", "Rivera", "Gómez", "Díaz", "Cruz", "Morales", "Reyes", "Gutiérrez",
+    "Ortiz", "Castillo", "Jiménez", "Vargas", "Romero", "Herrera", "Medina", "Bernal",
+]
+NATIONALITIES = [
+    "Colombiano", "Español", "Mexicano", "Argentino", "Chileno", "Peruano", "Francés",
+    "Inglés", "Estadounidense", "Alemán", "Italiano", "Ruso", "Japonés", "Brasileño",
+]
+TITLE_WORDS = [
+    "sombra", "viento", "ciudad", "memoria", "río", "silencio", "noche", "jardín",
+    "tiempo", "mar", "camino", "espejo", "fuego", "luz", "invierno", "montaña",
+    "historia", "secreto", "laberinto", "voz", "casa", "isla", "sueño", "ángel",
+    "guerra", "amor", "soledad", "cielo", "piedra", "lluvia", "destino", "palabra",
+]
+TITLE_PATTERNS = [
+    "{A} y {b}", "{A} de {b}", "Crónica de {a}", "{A}", "Los años de {a}",
+    "Tratado sobre {a} y {b}", "Cien días de {a}", "Revista {A}", "Diario de {a}",
+]
+
+LOAN_DAYS = 14
+
+
+def default_now() -> datetime:
+    """Medianoche UTC de hoy (naive, como las columnas de la base de datos)."""
+    return datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0, tzinfo=None
+    )
+
+
+class DatasetGenerator:
+    """
+    Genera los registros de cada tabla de forma determinista a partir de una semilla.
+
+    Attributes:
+        rng (random.Random): Generador pseudoaleatorio compartido.
+        now (datetime): Instante de referencia; con el mismo valor la salida es reproducible.
+        history_days (int): Días de historial de préstamos hacia atrás desde `now`.
+    """
+
+    def __init__(self, seed: int, now: datetime, history_days: int):
+        self.rng = random.Random(seed)
+        self.now = now
+        self.history_days = history_days
+
+    def uuid(self) -> UUID:
+        return UUID(int=self.rng.getrandbits(128), version=4)
+
+    def pareto_cum_weights(self, n: int, alpha: float) -> list:
+        return list(itertools.accumulate(self.rng.paretovariate(alpha) for _ in range(n)))
+
+    def person_name(self) -> str:
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    def title(self) -> str:
+        a, b = self.rng.sample(TITLE_WORDS, 2)
+        pattern = self.rng.choice(TITLE_PATTERNS)
+        return pattern.format(a=a, b=b, A=a.capitalize())
+
+    def timestamp_between(self, start: datetime, end: datetime) -> datetime:
+        return start + timedelta(seconds=self.rng.uniform(0, (end - start).total_seconds()))
+
+    def authors(self, count: int, admin_id: UUID):
+        for _ in range(count):
+            birth = date(1500, 1, 1) + timedelta(days=self.rng.randint(0, 490 * 365))
+            death = (
+                birth + timedelta(days=self.rng.randint(30 * 365, 90 * 365))
+                if birth.year < 1940 and self.rng.random() < 0.9
+                else None
+            )
+            if death is not None and death > self.now.date():
+                death = None
+            yield (
+                self.uuid(),
+                self.person_name(),
+                self.rng.choice(NATIONALITIES),
+                birth,
+                death,
+                None,
+                admin_id,
+                admin_id,
+                None,
+            )
+
+    def materials(self, count: int, author_ids: list, type_ids: list, admin_id: UUID):
+        author_weights = self.pareto_cum_weights(len(author_ids), 1.2)
+        type_weights = list(itertools.accumulate(weight for _, _, weight in MATERIAL_TYPES))
+        catalog_start = self.now - timedelta(days=10 * 365)
+        for _ in range(count):
+            yield (
+                self.uuid(),
+                self.title(),
+                self.rng.choices(author_ids, cum_weights=author_weights)[0],
+                self.rng.choices(type_ids, cum_weights=type_weights)[0],
+                self.rng.random() < 0.02,
+                self.timestamp_between(catalog_start, self.now),
+                admin_id,
+                admin_id,
+                None,
+            )
+
+    def users(self, count: int, role_ids: dict, password_hash: str):
+        signup_start = self.now - timedelta(days=5 * 365)
+        for i in range(count):
+            is_admin = i == 0 or self.rng.random() < 0.001
+            created_at = self.timestamp_between(signup_start, self.now)
+            yield (
+                self.uuid(),
+                f"lector{i}@dataset.test",
+                self.person_name(),
+                password_hash,
+                role_ids["admin" if is_admin else "cliente"],
+                created_at,
+                None,
+                created_at,
+                None,
+                self.rng.random() < 0.01,
+            )
+
+    def loan_counts(self, total: int, materials: int) -> list:
+        """
+        Reparte `total` préstamos entre los materiales según su popularidad, sin
+        superar los préstamos que caben en el historial sin solaparse.
+        """
+        # Cada préstamo ocupa al menos el doble del plazo para dejar margen a devoluciones tardías
+        max_per_material = max(self.history_days // (LOAN_DAYS * 2), 1)
+        total = min(total, max_per_material * materials)
+        weights = [self.rng.paretovariate(1.5) for _ in range(materials)]
+        scale = total / sum(weights)
+        counts = [min(int(weight * scale), max_per_material) for weight in weights]
+        missing = total - sum(counts)
+        # Los préstamos que faltan por redondeo o por el tope se reparten al azar
+        while missing > 0:
+            index = self.rng.randrange(materials)
+            if counts[index] < max_per_material:
+                counts[index] += 1
+                missing -= 1
+        return counts
+
+    def loans(self, total: int, material_ids: list, user_ids: list, status_ids: dict, admin_id: UUID):
+        user_weights = self.pareto_cum_weights(len(user_ids), 1.3)
+        history_start = self.now - timedelta(days=self.history_days)
+        counts = self.loan_counts(total, len(material_ids))
+
+        for material_id, count in zip(material_ids, counts):
+            if count == 0:
+                continue
+            slot = (self.now - history_start) / count
+            for j in range(count):
+                slot_start = history_start + slot * j
+                slot_end = min(slot_start + slot, self.now)
+                loan_date = slot_start + slot * 0.3 * self.rng.random()
+                is_last = j == count - 1
+                recent_start = self.now - timedelta(days=2 * LOAN_DAYS)
+                if is_last and recent_start > slot_start and self.rng.random() < 0.4:
+                    # Parte de los materiales tiene su último préstamo en las últimas semanas
+                    loan_date = self.timestamp_between(recent_start, self.now)
+                expected = loan_date + timedelta(days=LOAN_DAYS)
+                outcome = self.rng.random()
+
+                if expected > self.now:
+                    # Préstamo en curso: abierto o devuelto antes de tiempo
+                    if is_last and outcome < 0.7:
+                        returned, status = None, "borrowed"
+                    else:
+                        returned, status = self.timestamp_between(loan_date, min(expected, slot_end)), "returned"
+                elif is_last and outcome < 0.05:
+                    returned, status = None, "overdue"
+                elif outcome < 0.85:
+                    returned, status = self.timestamp_between(loan_date, min(expected, slot_end)), "returned"
+                else:
+                    late_limit = min(expected + timedelta(days=30), slot_end)
+                    returned = self.timestamp_between(min(expected, late_limit), late_limit)
+                    status = "returned"
+
+                yield (
+                    self.uuid(),
+                    material_id,
+                    self.rng.choices(user_ids, cum_weights=user_weights)[0],
+                    loan_date,
+                    expected,
+                    returned,
+                    status_ids[status],
+                    admin_id,
+                    admin_id,
+                    returned or loan_date,
+                )
+
+
+AUTHOR_COLUMNS = [
+    "id", "name", "nationality", "birth_date", "death_date", "biography",
+    "created_by", "updated_by", "updated_at",
+]
+MATERIAL_COLUMNS = [
+    "id", "title", "author_id", "type_id", "is_deleted", "date_added",
+    "created_by", "updated_by", "updated_at",
+]
+USER_COLUMNS = [
+    "id", "email", "full_name", "password", "role_id", "created_at",
+    "created_by", "updated_at", "updated_by", "is_deleted",
+]
+LOAN_COLUMNS = [
+    "id", "material_id", "user_id", "loan_date", "expected_return_date",
+    "actual_return_date", "status_id", "created_by", "updated_by", "updated_at",
+]
+
+
+async def copy_in_batches(connection, table: str, columns: list, records, batch_size: int) -> int:
+    """
+    Carga los registros con COPY binario en lotes de `batch_size`.
+
+    Returns:
+        int: Registros cargados.
+    """
+    loaded = 0
+    start = time.perf_counter()
+    iterator = iter(records)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            break
+        await connection.copy_records_to_table(table, records=batch, columns=columns)
+        loaded += len(batch)
+        rate = loaded / max(time.perf_counter() - start, 1e-9)
+        print(f"   {table}: {loaded:,} filas ({rate:,.0f} filas/s)", end="\r")
+    print(f"✅ {table}: {loaded:,} filas en {time.perf_counter() - start:.1f}s" + " " * 20)
+    return loaded
+
+
+async def ensure_reference_rows(connection, table: str, rows: list, generator: DatasetGenerator) -> dict:
+    """
+    Obtiene los ids de las filas de referencia por nombre, insertando las que falten.
+
+    Args:
+        rows (list): Tuplas (name,) o (name, description).
+
+    Returns:
+        dict: Nombre -> id.
+    """
+    existing = {
+        record["name"]: record["id"]
+        for record in await connection.fetch(f"SELECT id, name FROM {table}")
+    }
+    for row in rows:
+        if row[0] not in existing:
+            row_id = generator.uuid()
+            if len(row) > 1:
+                await connection.execute(
+                    f"INSERT INTO {table} (id, name, description) VALUES ($1, $2, $3)",
+                    row_id, row[0], row[1],
+                )
+            else:
+                await connection.execute(
+                    f"INSERT INTO {table} (id, name) VALUES ($1, $2)", row_id, row[0]
+                )
+            existing[row[0]] = row_id
+    return existing
+
+
+async def generate(args):
+    from passlib.context import CryptContext
+
+    now = args.now or default_now()
+    print(f"🕒 Instante de referencia: {now.isoformat()} (repite con --seed {args.seed} --now {now.isoformat()})")
+    generator = DatasetGenerator(args.seed, now, args.history_days)
+    password_hash = CryptContext(schemes=["bcrypt"], deprecated="auto").hash(DATASET_PASSWORD)
+
+    async with async_engine.connect() as sa_connection:
+        connection = (await sa_connection.get_raw_connection()).driver_connection
+
+        if args.truncate:
+            await connection.execute("TRUNCATE loans, materials, authors, users CASCADE")
+            print("🗑️ Tablas loans, materials, authors y users vaciadas.")
+
+        role_ids = await ensure_reference_rows(connection, "roles", ROLES, generator)
+        type_ids = await ensure_reference_rows(
+            connection, "material_types", [(name, description) for name, description, _ in MATERIAL_TYPES], generator
+        )
+        status_ids = await ensure_reference_rows(
+            connection, "loan_status", [(name,) for name in LOAN_STATUSES], generator
+        )
+
+        users = list(generator.users(args.users, role_ids, password_hash))
+        admin_id = users[0][0]
+        await copy_in_batches(connection, "users", USER_COLUMNS, users, args.batch_size)
+        user_ids = [user[0] for user in users]
+        del users
+
+        authors = list(generator.authors(args.authors, admin_id))
+        await copy_in_batches(connection, "authors", AUTHOR_COLUMNS, authors, args.batch_size)
+        author_ids = [author[0] for author in authors]
+        del authors
+
+        materials = list(
+            generator.materials(args.materials, author_ids, [type_ids[name] for name, _, _ in MATERIAL_TYPES], admin_id)
+        )
+        await copy_in_batches(connection, "materials", MATERIAL_COLUMNS, materials, args.batch_size)
+        material_ids = [material[0] for material in materials]
+        del materials
+
+        # Particiones mensuales para todo el historial; si no, los préstamos irían a DEFAULT
+        created = await sa_connection.run_sync(
+            lambda sync_connection: ensure_loan_partitions(
+                sync_connection, start=generator.now - timedelta(days=args.history_days)
+            )
+        )
+        await sa_connection.commit()
+        if created:
+            print(f"🗂️ Particiones creadas: {len(created)}")
+
+        await copy_in_batches(
+            connection,
+            "loans",
+            LOAN_COLUMNS,
+            generator.loans(args.loans, material_ids, user_ids, status_ids, admin_id),
+            args.batch_size,
+        )
+
+        # COPY no pasa por create_loan: is_available y active_loan_id se derivan de los préstamos abiertos
+        print("🔄 Sincronizando disponibilidad de materiales...")
+        await sa_connection.execute(material_availability.SYNC_AVAILABILITY)
+        await sa_connection.commit()
+
+        print("🔄 Actualizando estadísticas (ANALYZE)...")
+        await connection.execute("ANALYZE users, authors, materials, loans")
+
+    await async_engine.dispose()
+    print(f"✅ Dataset generado con semilla {args.seed} y --now {now.isoformat()}. Contraseña de los usuarios: {DATASET_PASSWORD}")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m scripts.generate_dataset")
+    parser.add_argument("--profile", choices=PROFILES, default="small", help="Tamaños predefinidos")
+    parser.add_argument("--authors", type=int, help="Número de autores")
+    parser.add_argument("--materials", type=int, help="Número de materiales")
+    parser.add_argument("--users", type=int, help="Número de usuarios")
+    parser.add_argument("--loans", type=int, help="Número de préstamos")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla para resultados reproducibles")
+    parser.add_argument("--history-days", type=int, default=3 * 365, help="Días de historial de préstamos")
+    parser.add_argument(
+        "--now",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Instante de referencia ISO 8601 (por defecto la medianoche UTC de hoy; se imprime para repetir la ejecución)",
+    )
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Filas por COPY")
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Vacía loans, materials, authors y users antes de cargar (incluye los datos de ejemplo)",
+    )
+    args = parser.parse_args()
+    for key, value in PROFILES[args.profile].items():
+        if getattr(args, key) is None:
+            setattr(args, key, value)
+
+    asyncio.run(generate(args))
+
+
+if __name__ == "__main__":
+    main()